@@ -0,0 +1,29 @@
+"""
+Measures the overhead of the query builder: the steps of a query and finishing it in a call, without sending it.
+
+	PYTHONPATH=. python3 benchmarks/bench_builder.py
+"""
+import timeit
+
+from stackexchangepy.client import ExchangeClient
+
+
+def main(repeat=5, number=20000):
+	client = ExchangeClient(access_token='token', key='key')
+
+	queries = [
+		('questions', lambda: client.questions().tagged('python').order('desc').sort('votes').pagesize(100)),
+		('answers of questions', lambda: client.questions(1, 2, 3).answers().filter('withbody')),
+		('associated users', lambda: client.users(1, 2).associated()),
+		('search', lambda: client.search().advanced().q('json').answers(1).closed(False))
+	]
+
+	for name, build in queries:
+		steps = min(timeit.repeat(build, repeat=repeat, number=number)) / number
+		query = build()
+		prepare = min(timeit.repeat(lambda: client._prepare(query, 'get'), repeat=repeat, number=number)) / number
+		print("  {:<22} {:6.2f} us build  {:6.2f} us prepare".format(name, steps * 1e6, prepare * 1e6))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,91 @@
+"""
+Compares the JSON libraries, with which the client can decode responses, on pages of questions and answers
+with bodies, similar to the ones returned with pagesize=100 and the withbody filter.
+
+	PYTHONPATH=. python3 benchmarks/bench_decoders.py
+"""
+import json
+import random
+import string
+import timeit
+
+from stackexchangepy import decoders
+
+
+def owner(random):
+	return {
+		'reputation': random.randint(1, 500000),
+		'user_id': random.randint(1, 10000000),
+		'user_type': 'registered',
+		'accept_rate': random.randint(0, 100),
+		'profile_image': 'https://www.gravatar.com/avatar/{}?s=128&d=identicon&r=PG'.format(random.getrandbits(128)),
+		'display_name': ''.join(random.choice(string.ascii_letters) for _ in range(12)),
+		'link': 'https://stackoverflow.com/users/{}'.format(random.randint(1, 10000000))
+	}
+
+
+def body(random, size):
+	words = [''.join(random.choice(string.ascii_lowercase) for _ in range(random.randint(2, 10))) for _ in range(size)]
+	return '<p>{}</p>\n<pre><code>{}</code></pre>'.format(' '.join(words), ' '.join(words[:size // 4]))
+
+
+def questions(random, pagesize=100):
+	return {
+		'items': [{
+			'tags': random.sample(['python', 'json', 'performance', 'django', 'numpy', 'pandas', 'asyncio'], 3),
+			'owner': owner(random),
+			'is_answered': random.random() > 0.5,
+			'view_count': random.randint(0, 1000000),
+			'answer_count': random.randint(0, 30),
+			'score': random.randint(-10, 5000),
+			'last_activity_date': random.randint(1217540572, 1600000000),
+			'creation_date': random.randint(1217540572, 1600000000),
+			'question_id': random.randint(1, 60000000),
+			'link': 'https://stackoverflow.com/questions/{}'.format(random.randint(1, 60000000)),
+			'title': body(random, 10),
+			'body': body(random, 300)
+		} for _ in range(pagesize)],
+		'has_more': True,
+		'quota_max': 10000,
+		'quota_remaining': 9999
+	}
+
+
+def answers(random, pagesize=100):
+	return {
+		'items': [{
+			'owner': owner(random),
+			'is_accepted': random.random() > 0.8,
+			'score': random.randint(-10, 5000),
+			'last_activity_date': random.randint(1217540572, 1600000000),
+			'creation_date': random.randint(1217540572, 1600000000),
+			'answer_id': random.randint(1, 60000000),
+			'question_id': random.randint(1, 60000000),
+			'body': body(random, 200)
+		} for _ in range(pagesize)],
+		'has_more': True,
+		'quota_max': 10000,
+		'quota_remaining': 9998
+	}
+
+
+def main(repeat=5, number=50):
+	pages = {
+		'questions': json.dumps(questions(random.Random(1))).encode('utf-8'),
+		'answers': json.dumps(answers(random.Random(2))).encode('utf-8')
+	}
+
+	for method, content in pages.items():
+		print("{} ({} KB)".format(method, len(content) // 1024))
+
+		times = {}
+		for name in decoders.available():
+			loads = decoders.get_decoder(name)
+			times[name] = min(timeit.repeat(lambda: loads(content), repeat=repeat, number=number)) / number
+
+		for name, seconds in times.items():
+			print("  {:<8} {:8.3f} ms  {:5.2f}x".format(name, seconds * 1000, times['json'] / seconds))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,63 @@
+"""
+Compares the previous models, for which a new class was created for every item, with the cached record types
+and the lazy views, on a page of 100 questions with bodies. Reports the time to build the items and read three
+of their fields, and the memory which they keep.
+
+	PYTHONPATH=. python3 benchmarks/bench_models.py
+"""
+import gc
+import json
+import random
+import timeit
+import tracemalloc
+
+from stackexchangepy.model import create_class, LazyRecord
+
+from bench_decoders import questions
+
+
+def create_class_per_item(name, response):
+	klass = type(name, (object,), {})
+	for key, value in response.items():
+		if type(value) == dict:
+			subklass = create_class_per_item(key, value)
+			setattr(klass, key, subklass)
+		else:
+			setattr(klass, key, value)
+	return klass
+
+
+def read(items):
+	for item in items:
+		item.question_id, item.score, item.owner.user_id
+	return items
+
+
+def memory(build, page, pages=10):
+	gc.collect()
+	tracemalloc.start()
+	items = [build(page) for _ in range(pages)]
+	size = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	del items
+	return size / pages
+
+
+def main(repeat=5, number=50):
+	# bodies are shared by both models, so they are not part of the measured memory
+	page = json.loads(json.dumps(questions(random.Random(1))))['items']
+
+	models = [
+		('class per item', lambda page: read([create_class_per_item('questions', item) for item in page])),
+		('record types', lambda page: read([create_class('questions', item) for item in page])),
+		('lazy views', lambda page: read([LazyRecord('questions', item) for item in page]))
+	]
+
+	print("{} questions".format(len(page)))
+	for name, build in models:
+		seconds = min(timeit.repeat(lambda: build(page), repeat=repeat, number=number)) / number
+		print("  {:<15} {:8.3f} ms per page  {:8.1f} KB per page".format(name, seconds * 1000, memory(build, page) / 1024))
+
+
+if __name__ == '__main__':
+	main()
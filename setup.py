@@ -17,6 +17,12 @@ setup(
     author='Monika Ilieva',
     author_email='hidden@hidden.com',
     install_requires = ['requests', 'tinynetrc'],
+    extras_require = {
+      'async': ['aiohttp'],
+      'fast': ['orjson'],
+      'numpy': ['numpy'],
+      'arrow': ['pyarrow'],
+    },
     classifiers=[
       'Development Status :: 3 - Alpha',
       'Intended Audience :: Developers',
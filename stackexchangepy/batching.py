@@ -0,0 +1,119 @@
+import asyncio
+import threading
+
+
+class _Batch(object):
+
+	def __init__(self):
+		self.ids 	= []
+		self.full 	= threading.Event()
+		self.done 	= threading.Event()
+		self.result = None
+		self.error 	= None
+
+
+class _AsyncBatch(object):
+
+	def __init__(self):
+		self.ids 	= []
+		self.full 	= asyncio.Event()
+		self.done 	= asyncio.get_event_loop().create_future()
+
+
+class Batcher(object):
+	"""
+	Collects single id lookups of the same method, which arrive in a short window, and loads them
+	with one vectorized request. The first caller for a key waits for the window to pass, or for the batch
+	to become full, and then makes the request for everyone in the batch.
+	"""
+
+	def __init__(self, window=0.005, max_size=100):
+		"""
+		:param window: Seconds for which lookups are collected, before the batch is requested.
+		:param max_size: Maximum number of ids in a batch. The API allows at most 100.
+		"""
+		self.window 		= window
+		self.max_size 		= max_size
+		self._batches 		= {}
+		self._async_batches = {}
+		self._lock 			= threading.Lock()
+
+	def load(self, key, _id, function):
+		"""
+		Adds the id to the open batch for the key, and returns the result of the batch.
+
+		:param key: Hashable key of the method. Only lookups with the same key are batched together.
+		:param _id: The id which is looked up.
+		:param function: Function, which receives the list of ids of the batch and returns the result for all of them.
+		"""
+		with self._lock:
+			batch = self._batches.get(key)
+			leader = batch is None
+			if leader:
+				batch = self._batches[key] = _Batch()
+
+			if _id not in batch.ids:
+				batch.ids.append(_id)
+			if len(batch.ids) >= self.max_size:
+				self._close(self._batches, key, batch)
+				batch.full.set()
+
+		if not leader:
+			batch.done.wait()
+		else:
+			batch.full.wait(self.window)
+			with self._lock:
+				self._close(self._batches, key, batch)
+
+			try:
+				batch.result = function(batch.ids)
+			except Exception as error:
+				batch.error = error
+			finally:
+				batch.done.set()
+
+		if batch.error is not None:
+			raise batch.error
+		return batch.result
+
+	async def load_async(self, key, _id, function):
+		"""
+		Asynchronous version of load. Must be called only from one event loop.
+
+		:param key: Hashable key of the method. Only lookups with the same key are batched together.
+		:param _id: The id which is looked up.
+		:param function: Coroutine function, which receives the list of ids of the batch and returns the result for all of them.
+		"""
+		batch = self._async_batches.get(key)
+		leader = batch is None
+		if leader:
+			batch = self._async_batches[key] = _AsyncBatch()
+
+		if _id not in batch.ids:
+			batch.ids.append(_id)
+		if len(batch.ids) >= self.max_size:
+			self._close(self._async_batches, key, batch)
+			batch.full.set()
+
+		if leader:
+			try:
+				try:
+					await asyncio.wait_for(batch.full.wait(), self.window)
+				except asyncio.TimeoutError:
+					pass
+				self._close(self._async_batches, key, batch)
+
+				batch.done.set_result(await function(batch.ids))
+			except BaseException as error:
+				# the rest of the batch must not wait forever, if the leader fails or is cancelled
+				self._close(self._async_batches, key, batch)
+				if not batch.done.done():
+					batch.done.set_exception(error)
+				if not isinstance(error, Exception):
+					raise
+
+		return await asyncio.shield(batch.done)
+
+	def _close(self, batches, key, batch):
+		if batches.get(key) is batch:
+			del batches[key]
@@ -0,0 +1,396 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+
+# methods whose responses depend on the user of the access token
+private_methods = ['/me', '/inbox', '/notifications', '/access-tokens', '/apps']
+private_segments = ['/inbox', '/notifications', '/write-permissions', '/full', '/unread']
+
+
+def cache_key(url, params, route):
+	"""
+	Returns the key of a response in the cache. The key of the app is never part of it, and the access token is part
+	of it only for methods, whose response depends on the user.
+
+	:param url: Url of the request.
+	:param params: Parameters of the request.
+	:param route: Route of the method.
+	"""
+	private = any(route.startswith(method) for method in private_methods) or \
+		any(segment in route for segment in private_segments)
+
+	params = sorted((key, str(value)) for key, value in params.items()
+					if key != 'key' and (key != 'access_token' or private))
+	return "{}?{}".format(url, urlencode(params))
+
+
+class MemoryCache(object):
+	"""
+	In-memory cache of responses, with time to live for every entry and LRU eviction, when the size
+	of all responses exceeds max_bytes. One cache can be shared by many clients and threads.
+	"""
+
+	def __init__(self, max_bytes=64 * 1024 * 1024, ttl=60, ttls=None, compress=False, clock=time.monotonic):
+		"""
+		:param max_bytes: Maximum size of all stored responses in bytes.
+		:param ttl: Seconds for which a response is kept. By default is set to one minute.
+		:param ttls: Dictionary with time to live for every method. The key is the start of the route of the method,
+			e.g. { '/info': 300, '/sites': 86400, '/tags': 600 }. The longest matching key is used.
+		:param compress: If it is set to True, responses are compressed with zlib, before they are stored.
+		:param clock: Function which returns the current time in seconds.
+		"""
+		self.max_bytes 	= max_bytes
+		self.ttl 		= ttl
+		self.ttls 		= ttls or {}
+		self.compress 	= compress
+		self._clock 	= clock
+		self._entries 	= OrderedDict()
+		self._size 		= 0
+		self._lock 		= threading.Lock()
+
+		self.hits 		= 0
+		self.misses 	= 0
+		self.evictions 	= 0
+		self.expirations = 0
+
+	def __len__(self):
+		return len(self._entries)
+
+	def ttl_for(self, route):
+		"""
+		Returns the time to live of the responses of the method.
+
+		:param route: Route of the method.
+		"""
+		matches = [prefix for prefix in self.ttls if route.startswith(prefix)]
+		return self.ttls[max(matches, key=len)] if matches else self.ttl
+
+	def lookup(self, key):
+		"""
+		Returns the stored response for the key, and whether it is fresh, or None if there is no such.
+		Expired responses are not kept, so they are always fresh.
+
+		:param key: Key of the response.
+		"""
+		content = self.get(key)
+		return (content, True) if content is not None else None
+
+	def get(self, key):
+		"""
+		Returns the stored response for the key, or None if there is no such, or it is expired.
+
+		:param key: Key of the response.
+		"""
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				self.misses += 1
+				return None
+
+			expires, content, compressed = entry
+			if expires <= self._clock():
+				self._remove(key)
+				self.expirations += 1
+				self.misses += 1
+				return None
+
+			self._entries.move_to_end(key)
+			self.hits += 1
+
+		return zlib.decompress(content) if compressed else content
+
+	def set(self, key, content, route):
+		"""
+		Stores the response, and evicts the least recently used ones, if the cache is full.
+
+		:param key: Key of the response.
+		:param content: The body of the response.
+		:param route: Route of the method, from which the time to live is taken.
+		"""
+		ttl = self.ttl_for(route)
+		if ttl <= 0:
+			return
+
+		compressed = self.compress
+		if compressed:
+			content = zlib.compress(content)
+		if len(content) > self.max_bytes:
+			return
+
+		with self._lock:
+			if key in self._entries:
+				self._remove(key)
+
+			self._entries[key] = (self._clock() + ttl, content, compressed)
+			self._size += len(content)
+
+			while self._size > self.max_bytes:
+				self._remove(next(iter(self._entries)))
+				self.evictions += 1
+
+	def clear(self):
+		"""
+		Removes all responses.
+		"""
+		with self._lock:
+			self._entries.clear()
+			self._size = 0
+
+	def stats(self):
+		"""
+		Returns the number of hits, misses, evictions and expirations, and the number and size of the stored responses.
+		"""
+		with self._lock:
+			return {
+				'hits': self.hits,
+				'misses': self.misses,
+				'evictions': self.evictions,
+				'expirations': self.expirations,
+				'entries': len(self._entries),
+				'bytes': self._size
+			}
+
+	def _remove(self, key):
+		expires, content, compressed = self._entries.pop(key)
+		self._size -= len(content)
+
+
+# value of PRAGMA auto_vacuum, with which free pages are returned by incremental_vacuum
+INCREMENTAL = 2
+
+
+class SQLiteCache(object):
+	"""
+	Persistent cache of responses in a SQLite database, which can be used by many processes at the same time.
+	Expired responses can be served for stale_ttl more seconds, while the client requests them again in background.
+	When the database grows over max_bytes, the least recently used responses are removed and the file is vacuumed.
+	Hits do not write to the database. Their access times are kept in memory, and are written with the next response.
+	"""
+
+	def __init__(self, path, max_bytes=256 * 1024 * 1024, ttl=60, ttls=None, stale_ttl=0, compress=True, clock=time.time):
+		"""
+		:param path: Path to the database file. It is created, if it does not exist.
+		:param max_bytes: Maximum size of all stored responses in bytes.
+		:param ttl: Seconds for which a response is fresh. By default is set to one minute.
+		:param ttls: Dictionary with time to live for every method, in the same format as for MemoryCache.
+		:param stale_ttl: Seconds after the expiration, for which the response is still served, while it is revalidated.
+		:param compress: If it is set to True, responses are compressed with zlib, before they are stored.
+		:param clock: Function which returns the current unix time. It must be the same for all processes.
+		"""
+		self.path 		= path
+		self.max_bytes 	= max_bytes
+		self.ttl 		= ttl
+		self.ttls 		= ttls or {}
+		self.stale_ttl 	= stale_ttl
+		self.compress 	= compress
+		self._clock 	= clock
+		self._local 	= threading.local()
+		# access times of the hits, which are written together with the next response
+		self._accessed 	= {}
+		self._lock 		= threading.Lock()
+
+		self.hits 		= 0
+		self.stale_hits = 0
+		self.misses 	= 0
+		self.evictions 	= 0
+
+		self._create()
+
+	ttl_for = MemoryCache.ttl_for
+
+	def lookup(self, key):
+		"""
+		Returns the stored response for the key, and whether it is fresh, or None if there is no such,
+		or it is expired for more than stale_ttl seconds.
+
+		:param key: Key of the response.
+		"""
+		now = self._clock()
+		# a hit only reads, so readers never wait for the write lock
+		connection = self._connection()
+		row = connection.execute("SELECT content, compressed, expires, stale_until FROM responses WHERE key = ?", (key,)).fetchone()
+		if row is None:
+			self.misses += 1
+			return None
+
+		content, compressed, expires, stale_until = row
+		if stale_until <= now:
+			connection.execute("DELETE FROM responses WHERE key = ? AND stale_until <= ?", (key, now))
+			self.misses += 1
+			return None
+
+		with self._lock:
+			self._accessed[key] = now
+
+		fresh = expires > now
+		if fresh:
+			self.hits += 1
+		else:
+			self.stale_hits += 1
+
+		return (zlib.decompress(content) if compressed else bytes(content)), fresh
+
+	def get(self, key):
+		"""
+		Returns the stored response for the key, or None if there is no such, or it is expired.
+
+		:param key: Key of the response.
+		"""
+		entry = self.lookup(key)
+		return entry[0] if entry is not None and entry[1] else None
+
+	def set(self, key, content, route):
+		"""
+		Stores the response, and evicts the least recently used ones, if the cache is full.
+
+		:param key: Key of the response.
+		:param content: The body of the response.
+		:param route: Route of the method, from which the time to live is taken.
+		"""
+		ttl = self.ttl_for(route)
+		if ttl <= 0:
+			return
+
+		if self.compress:
+			content = zlib.compress(content)
+
+		now, evicted = self._clock(), 0
+		with self._connection() as connection:
+			self._write_accessed(connection)
+			connection.execute("INSERT OR REPLACE INTO responses (key, content, compressed, size, expires, stale_until, accessed) "
+								"VALUES (?, ?, ?, ?, ?, ?, ?)",
+								(key, sqlite3.Binary(content), int(self.compress), len(content), now + ttl, now + ttl + self.stale_ttl, now))
+
+			if self._size(connection) > self.max_bytes:
+				evicted = self._evict(connection)
+
+		# vacuum can not run inside a transaction
+		if evicted:
+			self._vacuum()
+
+	def purge(self):
+		"""
+		Removes all responses, which can not be served anymore, and vacuums the database.
+		"""
+		with self._connection() as connection:
+			connection.execute("DELETE FROM responses WHERE stale_until <= ?", (self._clock(),))
+		self._vacuum()
+
+	def clear(self):
+		"""
+		Removes all responses.
+		"""
+		with self._connection() as connection:
+			connection.execute("DELETE FROM responses")
+		self._vacuum()
+
+	def close(self):
+		"""
+		Closes the connection of the current thread.
+		"""
+		connection = getattr(self._local, 'connection', None)
+		if connection is not None:
+			connection.close()
+			self._local.connection = None
+
+	def stats(self):
+		"""
+		Returns the number of fresh and stale hits, misses and evictions in the current process, and the number
+		and size of the stored responses.
+		"""
+		connection = self._connection()
+		entries, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+		return {
+			'hits': self.hits,
+			'stale_hits': self.stale_hits,
+			'misses': self.misses,
+			'evictions': self.evictions,
+			'entries': entries,
+			'bytes': size
+		}
+
+	def _connection(self):
+		connection = getattr(self._local, 'connection', None)
+		if connection is None:
+			connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+			# auto vacuum must be set before the header of a new database is written by the switch to WAL
+			connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+			connection.execute("PRAGMA journal_mode = WAL")
+			connection.execute("PRAGMA synchronous = NORMAL")
+			connection = self._local.connection = _Transaction(connection)
+		return connection
+
+	def _create(self):
+		directory = os.path.dirname(os.path.abspath(self.path))
+		if not os.path.isdir(directory):
+			os.makedirs(directory)
+
+		connection = self._connection()
+		with connection:
+			connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content BLOB, compressed INTEGER, "
+								"size INTEGER, expires REAL, stale_until REAL, accessed REAL)")
+			connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+		# databases which were created without auto vacuum are rebuilt with it once
+		if connection.execute("PRAGMA auto_vacuum").fetchone()[0] != INCREMENTAL:
+			connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+			connection.execute("VACUUM")
+
+	def _vacuum(self):
+		# execute runs only the first step of the pragma, which frees nothing, while a script runs it to the end.
+		# The checkpoint moves the freed pages from the log to the file, and truncates it
+		self._connection().executescript("PRAGMA incremental_vacuum; PRAGMA wal_checkpoint(TRUNCATE);")
+
+	def _write_accessed(self, connection):
+		with self._lock:
+			accessed, self._accessed = self._accessed, {}
+		connection.executemany("UPDATE responses SET accessed = ? WHERE key = ?", [(now, key) for key, now in accessed.items()])
+
+	def _size(self, connection):
+		return connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+	def _evict(self, connection):
+		size = self._size(connection)
+		rows = connection.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+
+		evicted = []
+		for key, _size in rows:
+			if size <= self.max_bytes:
+				break
+			evicted.append((key,))
+			size -= _size
+
+		connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+		self.evictions += len(evicted)
+		return len(evicted)
+
+
+class _Transaction(object):
+	"""
+	SQLite connection in autocommit mode, which starts an immediate transaction, when it is used as context manager,
+	so writers from other processes wait for each other, instead of failing.
+	"""
+
+	def __init__(self, connection):
+		self.connection = connection
+
+	def __enter__(self):
+		self.connection.execute("BEGIN IMMEDIATE")
+		return self.connection
+
+	def __exit__(self, exc_type, *exc_info):
+		self.connection.execute("COMMIT" if exc_type is None else "ROLLBACK")
+
+	def execute(self, *args):
+		return self.connection.execute(*args)
+
+	def executescript(self, script):
+		return self.connection.executescript(script)
+
+	def close(self):
+		self.connection.close()
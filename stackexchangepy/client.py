@@ -1,35 +1,81 @@
+import asyncio
 import datetime as dt
-import re
+import math
 import os
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from heapq import merge
+from itertools import chain, islice
+from operator import attrgetter
 
 import requests
 from tinynetrc import Netrc
 
-from stackexchangepy.model import create_class
+from stackexchangepy.cache import cache_key
+from stackexchangepy.columns import build_columns, to_numpy
+from stackexchangepy.decoders import get_decoder
+from stackexchangepy.export import record_batch, schema
+from stackexchangepy.model import create_class, LazyRecord
+from stackexchangepy.pacing import BackoffScheduler
+from stackexchangepy.query import Query, Metadata, Result, Cursor, AsyncCursor, SiteItem
+from stackexchangepy.routes import RouteTable, segments
 from stackexchangepy.exception import ExchangeException
 from stackexchangepy.sites import Site
+from stackexchangepy.singleflight import SingleFlight
+from stackexchangepy.stream import ItemStream
+from stackexchangepy.transport import Transport, AsyncTransport
+
+
+# finished query, which is ready to be send. If ids is not None, the url contains {ids}
+# in place of a list of more than MAX_IDS ids, which will be requested in chunks.
+# format is the name of the model, in which the items are returned, and fields are the returned columns.
+# metadata is filled from the responses, and is returned with the result
+Call = namedtuple('Call', ['method', 'url', 'params', 'item', 'route', 'ids', 'format', 'fields', 'metadata'])
+
 
 class ExchangeClient(object):
 
 	BASE_URL = 'https://api.stackexchange.com'
 	post_methods = ['add', 'accept', 'edit', 'create', 'undo', 'render', 'delete', 'favorite', 'upvote', 'downvote']
 	get_methods = ['de_authenticate', 'invalidate', 'get']
+	# methods which walk through all pages of the result
+	page_methods = ['iter', 'parallel', 'stream']
+
+	# maximum number of items in a single page, allowed by the API
+	MAX_PAGESIZE = 100
+	# maximum number of ids in a single vectorized request, allowed by the API
+	MAX_IDS = 100
+	# methods whose single id lookups can be batched, because every item has the <method>_id field
+	batch_methods = ['answers', 'badges', 'comments', 'posts', 'questions', 'suggested-edits', 'users']
+	# models of the items. objects are built with all fields, lazy are views over the decoded items
+	formats = { 'objects': create_class, 'lazy': LazyRecord }
+	# formats in which the items of a page are returned together, as dictionary of columns, NumPy structured array
+	# or Arrow record batch, whose schema is taken from the fields of the type of the items in Filter,
+	# with an extra JSON column for the other fields of the items, unless the fields are given
+	column_formats = {
+		'columns': lambda name, items, fields: build_columns(items, fields),
+		'numpy': lambda name, items, fields: to_numpy(build_columns(items, fields)),
+		'arrow': lambda name, items, fields: record_batch(items, schema(name, fields))
+	}
 
 	# params which are not part of the url
-	query_params = ['accepted', 'body', 'closed', 'comment', 'filter', 'fromdate', 'inname', 'intitle', 'max', 'migrated', 'min', 
+	query_params = frozenset(['accepted', 'body', 'closed', 'comment', 'filter', 'fromdate', 'inname', 'intitle', 'max', 'migrated', 'min', 
 					'notice', 'nottagged','option_id',  'order', 'page', 'pagesize', 'preview', 'q', 'question_id', 'since',
-					'sort', 'tagged', 'target_site', 'title', 'todate', 
-					'url', 'user', 'views', 'wiki']
+					'site', 'sort', 'tagged', 'target_site', 'title', 'todate', 
+					'url', 'user', 'views', 'wiki'])
 
 
 	# params for which no replace with "-" should happen
-	exclude_fields = ['option_id', 'question_id', 'target_site', 'all_time']
+	exclude_fields = frozenset(['option_id', 'question_id', 'target_site', 'all_time'])
 
 	# methods for which site parameter must be excluded
-	network_methods = ["access-tokens/.*", "apps/.*", "filters.*", 'errors/.*', 'sites', '(users/.*|me)/associated', '(users/.*|me)/merges', '(2\.2/|2\.1/|2\.0/)inbox(/unread)?']
+	network_routes = RouteTable(['/access-tokens', '/apps', '/errors', '/filters', '/inbox', '/sites',
+								'/me/associated', '/me/merges', '/users/{ids}/associated', '/users/{ids}/merges'])
 
 
-	def __init__(self, version=2.2, access_token=None, key=None, site=Site.STACKOVERFLOW):
+	def __init__(self, version=2.2, access_token=None, key=None, site=Site.STACKOVERFLOW, transport=None, scheduler=None, credentials=None,
+				chunk_workers=4, singleflight=None, batcher=None, cache=None, decoder=None):
 		"""
 		Initializes a new client.
 		There are 3 possible ways for providing crenedtials, which will be used by the package.
@@ -42,73 +88,542 @@ class ExchangeClient(object):
 		:param access_token: The token obtained from the steps, decribed in the site: 
 		:param key: The key provided from the site, when you registered your app.
 		:param site: Site to which queries will be send. By default is set to STACKOVERFLOW.
+		:param transport: Transport through which the requests are send. If it is not given, a new pooled
+			transport with keep-alive connections is created for the client. The same transport can be shared by many clients.
+		:param scheduler: BackoffScheduler, which keeps the backoff returned from the API for every method, and delays
+			later calls to the same method. If it is not given, a new one is created for the client.
+		:param credentials: CredentialPool with many keys and access tokens. If it is given, every request is send with
+			the credential, which has the most remaining quota, and access_token and key are not used.
+		:param chunk_workers: Maximum number of concurrent requests, when a list of more than 100 ids
+			is split into chunks.
+		:param singleflight: SingleFlight group, through which identical get requests, made at the same time, share
+			one round trip and one decoded response. If it is not given, a new one is created for the client.
+			Give the same group to the clients of many threads, in order their requests to be coalesced.
+		:param batcher: Batcher, which merges single id lookups of the same method, e.g. users(1).get(), which arrive
+			in a short window, in one vectorized request. By default lookups are not batched.
+		:param cache: Cache of responses, e.g. MemoryCache or SQLiteCache, from which get requests are served, while
+			the responses are fresh. Stale responses of SQLiteCache are served, while they are requested again in background.
+			By default responses are not cached.
+		:param decoder: JSON library, with which responses are decoded - orjson, ujson or json, or a function which receives
+			the body as bytes. By default it is the fastest installed library.
 		"""
 		self.version 	= version
-		self._params 	= {}
 		self._site 		= site
-		self._url 		= "{}/{}".format(self.BASE_URL, version)
+		self._transport = transport or Transport()
+		self._scheduler = scheduler or BackoffScheduler()
+		self._credentials = credentials
+		self.chunk_workers = chunk_workers
+		self._singleflight = singleflight or SingleFlight()
+		self._batcher = batcher
+		self._cache = cache
+		self._decoder = get_decoder(decoder)
 
-		self._authentication_crenedtials(access_token=access_token, key=key)
+		if credentials is None:
+			self._authentication_crenedtials(access_token=access_token, key=key)
+		else:
+			self._token, self._key = None, None
 
 
 	def __str__(self):
-		site = self._params['site'] if 'site' in self._params else 'site is not set'
-		return "Name: {}\nVersion: {}\nSite: {}\n".format("StackExchange API", self._version, site)
+		return "Name: {}\nVersion: {}\nSite: {}\n".format("StackExchange API", self.version, self._site)
+
+	def batch(self, queries, workers=8, timeout=None, partial=True):
+		"""
+		Runs many unrelated queries concurrently, and returns their results in the order of the queries.
+		Every request still goes through the rate limiter of the transport and waits for the backoff of its method.
+
+		>>> questions, users = client.batch([client.questions().tagged('python'), client.users(1, 2)])
+
+		:param queries: List of queries, which are finished with get, or functions without arguments, which finish
+			a query in another way, e.g. lambda: list(client.questions().iter(max_items=500)). Every query can be
+			a (query, timeout) tuple, in order to have its own timeout.
+		:param workers: Maximum number of queries, which are running at the same time.
+		:param timeout: Seconds, in which every query must finish after it is started. By default there is no timeout.
+		:param partial: If it is set to True, the exceptions of the failed queries are returned in place of their results.
+			Otherwise the first exception is raised, and the queries which are not started yet are cancelled.
+		"""
+		entries = self._batch_entries(queries, timeout)
+		started = [threading.Event() for _ in entries]
+
+		def run(index, function):
+			started[index].set()
+			return function()
+
+		executor = ThreadPoolExecutor(max_workers=workers)
+		futures = [executor.submit(run, index, function) for index, (function, _) in enumerate(entries)]
+
+		results = []
+		try:
+			for index, future in enumerate(futures):
+				_timeout = entries[index][1]
+				try:
+					started[index].wait()
+					results.append(future.result(timeout=_timeout))
+				except FutureTimeoutError:
+					error = ExchangeException('Query {} did not finish in {} seconds.'.format(index, _timeout), 'timeout', 408)
+					if not partial:
+						raise error
+					results.append(error)
+				except Exception as error:
+					if not partial:
+						raise
+					results.append(error)
+		finally:
+			for future in futures:
+				future.cancel()
+			# queries which timed out are not waited for
+			executor.shutdown(wait=False)
+
+		return results
+
+	def fanout(self, query, sites, key=None, order='desc', limit=None, workers=8, format='objects'):
+		"""
+		Runs the query on many sites concurrently, and returns a list of SiteItem(site, item) with the items of all sites.
+		Without key, the items are in the order of the sites. With key, the items of the sites are merged by it,
+		so the query must be sorted by the same field on every site, e.g. client.questions().sort('votes').
+
+		>>> top = client.fanout(client.questions().sort('votes').order('desc'), [Site.SUPERUSER, Site.SERVER_FAULT],
+		>>>                     key='score', limit=10)
+		>>> top[0].site, top[0].item.score
+
+		:param query: Query, which is finished with get on every site.
+		:param sites: List of sites, e.g. [Site.STACKOVERFLOW, Site.SUPERUSER].
+		:param key: Field or function of an item, by which the items of the sites are merged.
+		:param order: Order of the query - desc or asc.
+		:param limit: Maximum number of returned items. Then at most limit items are requested from every site,
+			and the next page of a site is requested only if the merge reaches its end.
+		:param workers: Maximum number of sites, which are requested at the same time.
+		:param format: Model of the items - objects or lazy.
+		"""
+		self._fanout_format(format)
+
+		def first(site):
+			_query = query.site(site)
+			if limit is None:
+				return _query.get(format=format)
+			# the first page is requested concurrently, and the next pages while the items are merged
+			items = _query.iter(max_items=limit, format=format)
+			return chain(list(islice(items, self._pagesize(_query._params, None, limit))), items)
+
+		with ThreadPoolExecutor(max_workers=workers) as executor:
+			streams = list(executor.map(first, sites))
+
+		return list(islice(self._merge_sites(sites, streams, key, order), limit))
+
+	def _fanout_format(self, format):
+		if format not in self.formats:
+			raise ExchangeException('Format {} can not be used with fanout. Use one of {}.'.format(format, ", ".join(self.formats)),
+									'format', 400)
+
+	def _merge_sites(self, sites, streams, key, order):
+		tagged = [self._tag(site, stream) for site, stream in zip(sites, streams)]
+		if key is None:
+			return chain.from_iterable(tagged)
+
+		field = key if callable(key) else attrgetter(key)
+		return merge(*tagged, key=lambda site_item: field(site_item.item), reverse=order == 'desc')
+
+	def _tag(self, site, items):
+		for item in items:
+			yield SiteItem(site, item)
+
+	def _batch_entries(self, queries, timeout):
+		entries = []
+		for query in queries:
+			query, _timeout = query if type(query) == tuple else (query, timeout)
+			entries.append((query.get if isinstance(query, Query) else query, _timeout))
+		return entries
 
 	def __getattr__(self, name):
 		"""
 		Constructs the query which will be send to the API.
 		Check the documentation for more information. https://github.com/monzita/stackxchangepy/wiki
 
-		After successful operation, remaining requests, has_more and max requests which can be used, are kept in variables.
+		Every step returns a new immutable Query, so one client can build and execute queries from many threads.
+		get and the post methods return a Result, which is a list of the items, with the metadata of the response,
+		e.g. result.has_more and result.quota_remaining. The client keeps the same values in client.has_more,
+		client.quota_remaining, client.quota_max and client.backoff, but they are of the last response of any thread,
+		so use the metadata of the result or of the cursor, when the client is shared.
+		Instead of get, the query can be finished with iter(pagesize=None, max_items=None), which returns a generator
+		over the items of all pages, or with parallel(pagesize=None, max_items=None, in_flight=4), which requests
+		the pages concurrently, or with stream(chunk_size=65536), which yields the items of the page while its body is read.
+		All of them take format, which is objects by default. With format='lazy' every item is a view over the decoded
+		response, whose fields are read, and whose nested objects are wrapped, only when they are accessed.
+		With format='columns' the items are returned as dictionary of columns, with format='numpy' as NumPy
+		structured array, and with format='arrow' as Arrow record batch, which can be written with ParquetSink.
+		Then fields can be given, in order only some of the columns to be returned, e.g.
+		get(format='columns', fields=['question_id', 'owner.user_id']), and iter, parallel and stream return
+		one block of columns for every page. iter, parallel and stream return a Cursor, whose metadata is of the last page.
+		Lists of more than 100 ids are split into chunks of 100 ids, which are requested concurrently,
+		and the items are returned in the order of the ids, when it is possible.
 		"""
-		def _set(*args, **kwargs):
+		if name.startswith('_'):
+			raise AttributeError(name)
+		return getattr(Query(self, "{}/{}".format(self.BASE_URL, self.version)), name)
+
+	def _step(self, query, name, args, kwargs):
+		if name in self.post_methods or name in self.get_methods:
+			return self._call(query, name, *args, **kwargs)
+
+		if name in self.page_methods:
+			return getattr(self, '_{}'.format(name))(query, *args, **kwargs)
+
+		return self._build(query, name, list(args), kwargs)
+
+	def _build(self, query, name, args, kwargs):
+		_name = name.replace('_', '-') if '_' in name and not name in self.exclude_fields else name
+		url, params, item, route, ids = query._url, dict(query._params), query._item, query._route, query._ids
+
+		if _name in self.query_params or \
+			_name == 'answers' and segments(route)[0] == 'search' or \
+			_name == 'tags' and 'questions' in segments(route):
+			params[_name] = self._unix_time(args[0]) if type(args[0]) == dt.datetime  \
+				else ";".join(map(lambda _id: str(_id).lower() if not type(_id) == str else _id, args))
+		else:
+			item = _name
+			if len(args) > self.MAX_IDS and ids is None:
+				ids = [str(_id) for _id in args]
+				_args = "/{ids}"
+			else:
+				_args = "/" + ";".join(map(lambda _id: str(_id), args)) if args else ""
+			url += "/{}{}".format(_name, _args)
+			route += "/{}{}".format(_name, "/{ids}" if args else "")
 
-			args = list(args)
-			_name = name.replace('_', '-') if re.match(r".*_.*", name) and not name in self.exclude_fields else name
-			if name in self.post_methods or name in self.get_methods:
-				self._url += "/{}".format(_name) if name in self.post_methods or name in self.get_methods[:-1] else ""
-				params = self._form_params()
+			for key, value in kwargs.items():
+				params[key] = ";".join(value) if not type(value) == bool else value
 
-				method = "post" if name in self.post_methods else "get"
+		return Query(self, url, params, item, route, ids)
 
-				response = requests.post(self._url, data=params) if method == "post" else requests.get(self._url, params=params)
-				if response.status_code != requests.codes.ok:
-					response = response.json()
-					self._reset_state()
-					raise ExchangeException(response['error_message'], response['error_name'], response['error_id'])
-				
-				if name == 'delete':
-					return response.status_code
+	def _call(self, query, name, *args, **kwargs):
+		call = self._prepare(query, name, kwargs.get('format', 'objects'), kwargs.get('fields'))
+		if call.ids is not None:
+			return self._get_chunks(call)
 
-				response = response.json()
-				items = [create_class(self._item, item) for item in response['items']]
+		if name == 'get' and self._batchable(call):
+			return self._get_batched(call)
 
-				self._reset_state()
+		if name == 'get':
+			return self._items(call, self._fetch(call, call.params))
 
-				self.has_more = response['has_more']
-				self.quota_remaining = response['quota_remaining']
-				self.quota_max = response['quota_max']
+		credential = self._acquire_credential()
+		response = self._send(call, self._sign(call.params, credential))
+		return self._process(name, call, response, credential)
 
-				return items
-			else:
-				if re.match(r".*search.*", self._url) and _name == 'answers' or \
-					re.match(r".*questions.*", self._url) and _name == "tags" or \
-					_name in self.query_params:
-					self._params[_name] = self._unix_time(args[0]) if type(args[0]) == dt.datetime  \
-						else ";".join(map(lambda _id: str(_id).lower() if not type(_id) == str else _id, args))
-				else:
-					self._item = _name
-					_args = "/" + ";".join(map(lambda _id: str(_id), args)) if args else ""
-					self._url += "/{}{}".format(_name, _args)
-
-					for key, value in kwargs.items():
-						self._params[key] = ";".join(value) if not type(value) == bool else value
-
-			return self
-		return _set
-
-	def _form_params(self):
+	def _get_batched(self, call):
+		prefix, _id = call.url.rsplit("/", 1)
+
+		def fetch(ids):
+			return self._fetch(call._replace(url="{}/{}".format(prefix, ";".join(ids))), dict(call.params, pagesize=self.MAX_PAGESIZE))
+
+		response = self._batcher.load(self._key_of(call._replace(url=prefix), call.params), _id, fetch)
+		call.metadata.update(response)
+		return self._items(call, self._unbatch(call, _id, response))
+
+	def _get_chunks(self, call):
+		params = dict(call.params, pagesize=call.params.get('pagesize', self.MAX_PAGESIZE))
+
+		def fetch(chunk):
+			return self._fetch(chunk, params)
+
+		with ThreadPoolExecutor(max_workers=self.chunk_workers) as executor:
+			responses = list(executor.map(fetch, self._split(call)))
+
+		return self._merge_chunks(call, responses)
+
+	def _iter(self, query, pagesize=None, max_items=None, format='objects', fields=None):
+		"""
+		Returns a cursor over the items of all pages. Next page is requested only after
+		all items from the previous one are consumed, and requesting stops when has_more is False.
+
+		:param pagesize: Number of items in a page. By default it is the pagesize of the query,
+			or the maximum allowed from the API, if it is not set.
+		:param max_items: Maximum number of items, which will be returned.
+		:param format: Model of the items - objects, lazy, columns, numpy or arrow.
+		:param fields: Columns, which are returned with the columns and numpy formats.
+		"""
+		call = self._prepare(query, 'get', format, fields)
+		pagesize = self._pagesize(call.params, pagesize, max_items)
+		items = chain.from_iterable(self._iter_pages(chunk, pagesize, max_items) for chunk in self._split(call))
+		return Cursor(self._blocks(call, islice(items, max_items), pagesize), call.metadata)
+
+	def _iter_pages(self, call, pagesize, max_items):
+		page, count = int(call.params.get('page', 1)), 0
+
+		while max_items is None or count < max_items:
+			response = self._fetch(call, dict(call.params, page=page, pagesize=pagesize))
+
+			for _item in response.get('items', []):
+				if max_items is not None and count >= max_items:
+					return
+				count += 1
+				yield self._create(call, _item)
+
+			if not response.get('has_more'):
+				return
+			page += 1
+
+	def _parallel(self, query, pagesize=None, max_items=None, in_flight=4, format='objects', fields=None):
+		"""
+		Returns a cursor over the items of all pages, which are requested concurrently.
+		First the total number of items is requested with the total filter, and from it the range of pages is planned.
+		Items are returned in the order of the pages.
+
+		:param pagesize: Number of items in a page. By default it is the pagesize of the query,
+			or the maximum allowed from the API, if it is not set.
+		:param max_items: Maximum number of items, which will be returned.
+		:param in_flight: Maximum number of pages, which are requested at the same time.
+		:param format: Model of the items - objects, lazy, columns, numpy or arrow.
+		:param fields: Columns, which are returned with the columns and numpy formats.
+		"""
+		call = self._prepare(query, 'get', format, fields)
+		pagesize = self._pagesize(call.params, pagesize, max_items)
+		items = chain.from_iterable(self._parallel_pages(chunk, pagesize, max_items, in_flight) for chunk in self._split(call))
+		return Cursor(self._blocks(call, islice(items, max_items), pagesize), call.metadata)
+
+	def _parallel_pages(self, call, pagesize, max_items, in_flight):
+		total = self._fetch(call, dict(call.params, filter='total'))['total']
+		pages = iter(self._plan_pages(call.params, total, pagesize, max_items))
+
+		def fetch(page):
+			return self._fetch(call, dict(call.params, page=page, pagesize=pagesize))
+
+		count = 0
+		with ThreadPoolExecutor(max_workers=in_flight) as executor:
+			pending = deque(executor.submit(fetch, page) for page in islice(pages, in_flight))
+
+			while pending:
+				response = pending.popleft().result()
+
+				page = next(pages, None)
+				if page is not None:
+					pending.append(executor.submit(fetch, page))
+
+				for _item in response.get('items', []):
+					if max_items is not None and count >= max_items:
+						return
+					count += 1
+					yield self._create(call, _item)
+
+	def _stream(self, query, chunk_size=64 * 1024, format='objects', fields=None):
+		"""
+		Returns a cursor over the items of the page, which are decoded one by one, while the compressed body
+		of the response is read, so the whole page is never kept in memory. Responses are not cached and identical
+		requests are not coalesced. The metadata of the cursor, and the same attributes of the client, are set after
+		the last item is read.
+
+		:param chunk_size: Number of bytes, which are read from the connection at once.
+		:param format: Model of the items - objects, lazy, columns, numpy or arrow.
+		:param fields: Columns, which are returned with the columns and numpy formats.
+		"""
+		call = self._prepare(query, 'get', format, fields)
+		items = chain.from_iterable(self._stream_page(chunk, chunk_size) for chunk in self._split(call))
+		return Cursor(self._blocks(call, items, self.MAX_PAGESIZE), call.metadata)
+
+	def _stream_page(self, call, chunk_size):
+		credential = self._acquire_credential()
+		response = self._send(call, self._sign(call.params, credential), stream=True)
+
+		try:
+			if response.status_code != requests.codes.ok:
+				self._decode(response, call, credential)
+
+			items = ItemStream(response.iter_content(chunk_size))
+			for _item in items:
+				yield self._create(call, _item)
+
+			self._record(items.envelope, call, credential)
+			call.metadata.update(items.envelope)
+		finally:
+			response.close()
+
+	def _send(self, call, params, **kwargs):
+		self._scheduler.wait(call.route)
+		return self._transport.request(call.method, call.url, params, **kwargs)
+
+	def _fetch(self, call, params):
+		key = cache_key(call.url, params, call.route) if self._cache is not None else None
+
+		def fetch():
+			credential = self._acquire_credential()
+			response = self._send(call, self._sign(params, credential))
+			return self._store(key, call, response, self._decode(response, call, credential))
+
+		entry = self._cache.lookup(key) if key is not None else None
+		if entry is not None:
+			content, fresh = entry
+			if not fresh:
+				self._revalidate(self._key_of(call, params), fetch)
+			response = self._cached(content)
+		else:
+			response = self._singleflight.do(self._key_of(call, params), fetch)
+
+		call.metadata.update(response)
+		return response
+
+	def _revalidate(self, key, fetch):
+		"""
+		Requests a stale response again in background. Errors are ignored, because the stale response was already served.
+		"""
+		def revalidate():
+			try:
+				self._singleflight.do(key, fetch)
+			except Exception:
+				pass
+
+		threading.Thread(target=revalidate, daemon=True).start()
+
+	def _cached(self, content):
+		response = self._loads(content)
+		self.has_more = response.get('has_more')
+		return response
+
+	def _store(self, key, call, response, decoded):
+		if key is not None:
+			self._cache.set(key, response.content, call.route)
+		return decoded
+
+	def _loads(self, content):
+		return self._decoder(content)
+
+	def _key_of(self, call, params):
+		return (call.url, tuple(sorted((key, str(value)) for key, value in params.items())))
+
+	def _acquire_credential(self):
+		return self._credentials.acquire() if self._credentials is not None else None
+
+	def _sign(self, params, credential):
+		return dict(params, **credential.params()) if credential is not None else params
+
+	def _prepare(self, query, name, format='objects', fields=None):
+		"""
+		Finishes the query with the method.
+		Lists of more than MAX_IDS ids are kept for chunking only for get requests.
+		"""
+		_name = name.replace('_', '-')
+		url, route = query._url, query._route
+		if name in self.post_methods or name in self.get_methods[:-1]:
+			url += "/{}".format(_name)
+			route += "/{}".format(_name)
+
+		method = "post" if name in self.post_methods else "get"
+		call = Call(method, url, self._form_params(query, route), query._item, route, query._ids, format, fields, Metadata())
+
+		if call.ids is not None and name != 'get':
+			call = call._replace(url=call.url.replace("{ids}", ";".join(call.ids)), ids=None)
+
+		if format not in self.formats and format not in self.column_formats:
+			raise ExchangeException('Unknown format {}. Use one of {}.'.format(format, ", ".join(chain(self.formats, self.column_formats))),
+									'format', 400)
+		return call
+
+	def _split(self, call):
+		"""
+		Splits the call in calls for at most MAX_IDS ids.
+		"""
+		if call.ids is None:
+			return [call]
+
+		return [call._replace(url=call.url.replace("{ids}", ";".join(call.ids[i:i + self.MAX_IDS])), ids=None)
+				for i in range(0, len(call.ids), self.MAX_IDS)]
+
+	def _merge_chunks(self, call, responses):
+		"""
+		Merges the items of the chunks, ordering them by the position of their id in the requested list,
+		if they have the id field of the chunked items, e.g. question_id for questions.
+		"""
+		items = [_item for response in responses for _item in response['items']]
+		self.has_more = call.metadata.has_more = any(response.get('has_more') for response in responses)
+
+		field = self._id_field(call)
+		if all(field in _item for _item in items):
+			position = { _id: index for index, _id in enumerate(call.ids) }
+			items.sort(key=lambda _item: position.get(str(_item[field]), len(position)))
+
+		return self._items(call, { 'items': items })
+
+	def _id_field(self, call):
+		"""
+		Returns the id field of the items of the first method with ids, e.g. question_id for questions/{ids}/answers.
+		"""
+		return "{}_id".format(call.route.split("/{ids}")[0].split("/")[-1].rstrip("s").replace("-", "_"))
+
+	def _batchable(self, call):
+		return self._batcher is not None and call.route.endswith("/{ids}") and ";" not in call.url.rsplit("/", 1)[1] and \
+			call.route.split("/")[-2] in self.batch_methods and call.route.count("{ids}") == 1
+
+	def _unbatch(self, call, _id, response):
+		field = self._id_field(call)
+		return dict(response, items=[_item for _item in response['items'] if str(_item.get(field)) == _id])
+
+	def _process(self, name, call, response, credential=None):
+		if name == 'delete' and response.status_code == requests.codes.ok:
+			return response.status_code
+
+		response = self._decode(response, call, credential)
+		call.metadata.update(response)
+		return self._items(call, response)
+
+	def _items(self, call, response):
+		if call.format in self.column_formats:
+			return self.column_formats[call.format](call.item, response['items'], call.fields)
+
+		model = self.formats[call.format]
+		return Result([model(call.item, _item) for _item in response['items']], call.metadata)
+
+	def _create(self, call, _item):
+		# items in column formats are kept decoded, until their block is built
+		model = self.formats.get(call.format)
+		return model(call.item, _item) if model is not None else _item
+
+	def _blocks(self, call, items, size):
+		"""
+		Returns the items, or for the column formats, a generator over blocks of columns for every size items.
+		"""
+		if call.format not in self.column_formats:
+			return items
+
+		blocks = iter(lambda: list(islice(items, size)), [])
+		return (self._items(call, { 'items': block }) for block in blocks)
+
+	def _decode(self, response, call, credential=None):
+		if response.status_code != requests.codes.ok:
+			response = self._loads(response.content)
+			raise ExchangeException(response['error_message'], response['error_name'], response['error_id'])
+
+		return self._record(self._loads(response.content), call, credential)
+
+	def _record(self, response, call, credential=None):
+		"""
+		Keeps has_more, the quota and the backoff from the decoded response in attributes of the client, for
+		backward compatibility. They are overwritten by every response, so with concurrent queries they can be
+		of another request. The scheduler and the credential pool are updated only with the values of this response.
+		"""
+		quota_remaining, quota_max, backoff = response.get('quota_remaining'), response.get('quota_max'), response.get('backoff')
+		self.has_more = response.get('has_more')
+		self.quota_remaining = quota_remaining
+		self.quota_max = quota_max
+		self.backoff = backoff
+
+		# values of this response, because the attributes can be already changed from another thread
+		self._scheduler.record(call.route, backoff)
+		if credential is not None:
+			self._credentials.update(credential, quota_remaining, quota_max)
+
+		return response
+
+	def _pagesize(self, params, pagesize, max_items):
+		pagesize = int(pagesize or params.get('pagesize') or self.MAX_PAGESIZE)
+		return min(pagesize, max_items) if max_items else pagesize
+
+	def _plan_pages(self, params, total, pagesize, max_items):
+		first = int(params.get('page', 1))
+		remaining = max(total - (first - 1) * pagesize, 0)
+		if max_items is not None:
+			remaining = min(remaining, max_items)
+
+		return range(first, first + int(math.ceil(remaining / float(pagesize))))
+
+	def _form_params(self, query, route):
 		params = {}
 
 		if self._token:
@@ -117,10 +632,11 @@ class ExchangeClient(object):
 		if self._key:
 			params['key'] = self._key
 
-		params.update({ key: value for key, value in self._params.items() })
-		params['site'] = self._site
+		params.update({ key: value for key, value in query._params.items() })
+		# site of the client, unless the query has its own
+		params.setdefault('site', self._site)
 
-		if any([rg for rg in self.network_methods if re.findall(r"{}".format(rg), self._url)]):
+		if route in self.network_routes:
 			params.pop('site')
 
 		return params
@@ -133,13 +649,249 @@ class ExchangeClient(object):
 
 
 	def _authentication_crenedtials(self, access_token=None, key=None):
-		netrc = Netrc()
+		self._token = access_token or os.getenv('ACCESS_TOKEN')
+		self._key = key or os.getenv('KEY')
+
+		if not self._token or not self._key:
+			netrc = Netrc()
+			self._token = self._token or netrc['api.stackexchangepy.com']['login']
+			self._key = self._key or netrc['api.stackexchangepy.com']['password']
+
+
+
+class AsyncExchangeClient(ExchangeClient):
+	"""
+	Asynchronous version of the client. Queries are constructed in the same way, but the final
+	method returns a coroutine, which must be awaited:
+
+	>>> questions = await client.questions().tagged('python').get()
+
+	The query is finished at the moment when the final method is called, so many queries can be
+	started from the same client and awaited concurrently.
+	"""
+
+	def __init__(self, version=2.2, access_token=None, key=None, site=Site.STACKOVERFLOW, transport=None, scheduler=None, credentials=None,
+				singleflight=None, batcher=None, cache=None, decoder=None, max_concurrency=100):
+		"""
+		Initializes a new asynchronous client. Credentials are provided in the same way as for ExchangeClient.
+
+		:param transport: Asynchronous transport through which the requests are send. If it is not given,
+			a new AsyncTransport is created, which requires aiohttp to be installed.
+		:param max_concurrency: Maximum number of requests, which are send to the API at the same time.
+		"""
+		super().__init__(version=version, access_token=access_token, key=key, site=site, transport=transport or AsyncTransport(),
+						scheduler=scheduler, credentials=credentials, singleflight=singleflight, batcher=batcher, cache=cache,
+						decoder=decoder)
+		self.max_concurrency = max_concurrency
+		self._semaphore = None
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, *exc_info):
+		await self.close()
+
+	async def close(self):
+		"""
+		Closes the connections of the transport.
+		"""
+		await self._transport.close()
 
-		self._token = access_token or os.getenv('ACCESS_TOKEN') or netrc['api.stackexchangepy.com']['login']
-		self._key = key or os.getenv('KEY') or netrc['api.stackexchangepy.com']['password']
+	async def batch(self, queries, timeout=None, partial=True):
+		"""
+		Asynchronous version of batch. All queries are started at once, and max_concurrency limits their requests.
 
+		>>> questions, users = await client.batch([client.questions().tagged('python'), client.users(1, 2)])
 
-	def _reset_state(self):
-		self._url = "{}/{}".format(self.BASE_URL, self.version)
-		self._params = {}
-		self._item = ""
\ No newline at end of file
+		:param queries: List of queries, which are finished with get, or functions without arguments, which return
+			a coroutine. Every query can be a (query, timeout) tuple, in order to have its own timeout.
+		:param timeout: Seconds, in which every query must finish. By default there is no timeout.
+		:param partial: If it is set to True, the exceptions of the failed queries are returned in place of their results.
+			Otherwise the first exception is raised, and the rest of the queries are cancelled.
+		"""
+		async def run(index, function, _timeout):
+			try:
+				return await asyncio.wait_for(function(), _timeout)
+			except asyncio.TimeoutError:
+				raise ExchangeException('Query {} did not finish in {} seconds.'.format(index, _timeout), 'timeout', 408)
+
+		tasks = [asyncio.ensure_future(run(index, function, _timeout))
+				for index, (function, _timeout) in enumerate(self._batch_entries(queries, timeout))]
+		try:
+			return await asyncio.gather(*tasks, return_exceptions=partial)
+		finally:
+			for task in tasks:
+				task.cancel()
+
+	async def fanout(self, query, sites, key=None, order='desc', limit=None, format='objects'):
+		"""
+		Asynchronous version of fanout. All sites are requested at once, and with limit, the first limit items of every
+		site are received, before they are merged.
+
+		>>> top = await client.fanout(client.questions().sort('votes'), [Site.SUPERUSER, Site.SERVER_FAULT], key='score', limit=10)
+
+		:param query: Query, which is finished with get on every site.
+		:param sites: List of sites, e.g. [Site.STACKOVERFLOW, Site.SUPERUSER].
+		:param key: Field or function of an item, by which the items of the sites are merged.
+		:param order: Order of the query - desc or asc.
+		:param limit: Maximum number of returned items.
+		:param format: Model of the items - objects or lazy.
+		"""
+		self._fanout_format(format)
+
+		async def first(site):
+			_query = query.site(site)
+			if limit is None:
+				return await _query.get(format=format)
+			return [item async for item in _query.iter(max_items=limit, format=format)]
+
+		streams = await asyncio.gather(*[first(site) for site in sites])
+		return list(islice(self._merge_sites(sites, streams, key, order), limit))
+
+	def _call(self, query, name, *args, **kwargs):
+		call = self._prepare(query, name, kwargs.get('format', 'objects'), kwargs.get('fields'))
+		if call.ids is not None:
+			return self._get_chunks(call)
+		return self._request(name, call)
+
+	async def _request(self, name, call):
+		if name == 'get' and self._batchable(call):
+			return await self._get_batched(call)
+
+		if name == 'get':
+			return self._items(call, await self._fetch(call, call.params))
+
+		credential = self._acquire_credential()
+		response = await self._send(call, self._sign(call.params, credential))
+		return self._process(name, call, response, credential)
+
+	async def _get_batched(self, call):
+		prefix, _id = call.url.rsplit("/", 1)
+
+		def fetch(ids):
+			return self._fetch(call._replace(url="{}/{}".format(prefix, ";".join(ids))), dict(call.params, pagesize=self.MAX_PAGESIZE))
+
+		response = await self._batcher.load_async(self._key_of(call._replace(url=prefix), call.params), _id, fetch)
+		call.metadata.update(response)
+		return self._items(call, self._unbatch(call, _id, response))
+
+	async def _get_chunks(self, call):
+		params = dict(call.params, pagesize=call.params.get('pagesize', self.MAX_PAGESIZE))
+		responses = await asyncio.gather(*[self._fetch(chunk, params) for chunk in self._split(call)])
+		return self._merge_chunks(call, responses)
+
+	def _iter(self, query, pagesize=None, max_items=None, format='objects', fields=None):
+		call = self._prepare(query, 'get', format, fields)
+		pagesize = self._pagesize(call.params, pagesize, max_items)
+		items = self._iter_chunks(call, lambda chunk: self._iter_pages(chunk, pagesize, max_items), max_items)
+		return AsyncCursor(self._blocks(call, items, pagesize), call.metadata)
+
+	def _parallel(self, query, pagesize=None, max_items=None, in_flight=4, format='objects', fields=None):
+		call = self._prepare(query, 'get', format, fields)
+		pagesize = self._pagesize(call.params, pagesize, max_items)
+		items = self._iter_chunks(call, lambda chunk: self._parallel_pages(chunk, pagesize, max_items, in_flight), max_items)
+		return AsyncCursor(self._blocks(call, items, pagesize), call.metadata)
+
+	def _blocks(self, call, items, size):
+		if call.format not in self.column_formats:
+			return items
+		return self._async_blocks(call, items, size)
+
+	async def _async_blocks(self, call, items, size):
+		block = []
+		async for _item in items:
+			block.append(_item)
+			if len(block) == size:
+				yield self._items(call, { 'items': block })
+				block = []
+		if block:
+			yield self._items(call, { 'items': block })
+
+	async def _iter_chunks(self, call, pages, max_items):
+		count = 0
+		for chunk in self._split(call):
+			async for _item in pages(chunk):
+				if max_items is not None and count >= max_items:
+					return
+				count += 1
+				yield _item
+
+	async def _iter_pages(self, call, pagesize, max_items):
+		page, count = int(call.params.get('page', 1)), 0
+
+		while max_items is None or count < max_items:
+			response = await self._fetch(call, dict(call.params, page=page, pagesize=pagesize))
+
+			for _item in response.get('items', []):
+				if max_items is not None and count >= max_items:
+					return
+				count += 1
+				yield self._create(call, _item)
+
+			if not response.get('has_more'):
+				return
+			page += 1
+
+	async def _parallel_pages(self, call, pagesize, max_items, in_flight):
+		total = (await self._fetch(call, dict(call.params, filter='total')))['total']
+		pages = iter(self._plan_pages(call.params, total, pagesize, max_items))
+
+		async def fetch(page):
+			return await self._fetch(call, dict(call.params, page=page, pagesize=pagesize))
+
+		count = 0
+		pending = deque(asyncio.ensure_future(fetch(page)) for page in islice(pages, in_flight))
+		try:
+			while pending:
+				response = await pending.popleft()
+
+				page = next(pages, None)
+				if page is not None:
+					pending.append(asyncio.ensure_future(fetch(page)))
+
+				for _item in response.get('items', []):
+					if max_items is not None and count >= max_items:
+						return
+					count += 1
+					yield self._create(call, _item)
+		finally:
+			for task in pending:
+				task.cancel()
+
+	def _stream(self, query, chunk_size=64 * 1024, format='objects', fields=None):
+		self._prepare(query, 'get', format, fields)
+		raise ExchangeException('stream is supported only by the synchronous client.', 'stream', 400)
+
+	def _revalidate(self, key, fetch):
+		task = asyncio.ensure_future(self._singleflight.do_async(key, fetch))
+		# errors are ignored, because the stale response was already served
+		task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+	async def _send(self, call, params):
+		await self._scheduler.wait_async(call.route)
+
+		if self._semaphore is None:
+			self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+		async with self._semaphore:
+			return await self._transport.request(call.method, call.url, params)
+
+	async def _fetch(self, call, params):
+		key = cache_key(call.url, params, call.route) if self._cache is not None else None
+
+		async def fetch():
+			credential = self._acquire_credential()
+			response = await self._send(call, self._sign(params, credential))
+			return self._store(key, call, response, self._decode(response, call, credential))
+
+		entry = self._cache.lookup(key) if key is not None else None
+		if entry is not None:
+			content, fresh = entry
+			if not fresh:
+				self._revalidate(self._key_of(call, params), fetch)
+			response = self._cached(content)
+		else:
+			response = await self._singleflight.do_async(self._key_of(call, params), fetch)
+
+		call.metadata.update(response)
+		return response
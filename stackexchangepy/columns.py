@@ -0,0 +1,107 @@
+from array import array
+
+from stackexchangepy.exception import ExchangeException
+
+
+# imported on first use of the numpy format, so importing the client does not load it
+numpy = None
+
+
+def flatten(item, prefix=""):
+	"""
+	Returns the fields of the item, in which the fields of the nested objects are joined with dot, e.g. owner.user_id.
+
+	:param item: Decoded item of a response.
+	:param prefix: Name of the object, in which the item is nested.
+	"""
+	fields = {}
+	for key, value in item.items():
+		if type(value) == dict:
+			fields.update(flatten(value, "{}{}.".format(prefix, key)))
+		else:
+			fields["{}{}".format(prefix, key)] = value
+	return fields
+
+
+def is_date(field):
+	return field.endswith('_date')
+
+
+def build_columns(items, fields=None):
+	"""
+	Builds column buffers from the decoded items. Integers and dates, which are unix times, are kept in arrays
+	of 64 bit integers, and floats in arrays of doubles. Integer columns with missing values are kept as doubles
+	with nan in place of the missing values. Strings, booleans and lists are kept in lists.
+
+	:param items: List of decoded items.
+	:param fields: List of the fields, which are returned, e.g. ['question_id', 'owner.user_id'].
+		By default all fields of the items are returned.
+	"""
+	rows = [flatten(item) for item in items]
+	if fields is None:
+		fields = list(dict.fromkeys(field for row in rows for field in row))
+
+	columns = {}
+	for field in fields:
+		values = [row.get(field) for row in rows]
+		present = [value for value in values if value is not None]
+
+		if present and all(type(value) == int for value in present):
+			columns[field] = array('q', values) if len(present) == len(values) else \
+				array('d', (float('nan') if value is None else value for value in values))
+		elif present and all(type(value) in (int, float) for value in present):
+			columns[field] = array('d', (float('nan') if value is None else value for value in values))
+		else:
+			columns[field] = values
+
+	return columns
+
+
+def _require():
+	global numpy
+	if numpy is None:
+		try:
+			import numpy
+		except ImportError:
+			raise ExchangeException('numpy must be installed, in order the numpy format to be used.', 'format', 500)
+
+
+def to_numpy(columns):
+	"""
+	Returns the columns as NumPy structured array. Dates are datetime64 in seconds, with NaT for missing values,
+	and strings and lists are objects. NumPy must be installed, in order this to be used.
+
+	:param columns: Columns, returned from build_columns.
+	"""
+	_require()
+	arrays = [(field, _to_numpy(field, values)) for field, values in columns.items()]
+	size = len(arrays[0][1]) if arrays else 0
+
+	result = numpy.empty(size, dtype=[(field, values.dtype) for field, values in arrays])
+	for field, values in arrays:
+		result[field] = values
+	return result
+
+
+def _to_numpy(field, values):
+	if isinstance(values, array):
+		values = numpy.frombuffer(values, dtype='i8' if values.typecode == 'q' else 'f8')
+		if not is_date(field):
+			return values
+
+		if values.dtype.kind == 'i':
+			return values.astype('datetime64[s]')
+
+		missing = numpy.isnan(values)
+		dates = numpy.where(missing, 0, values).astype('i8').astype('datetime64[s]')
+		dates[missing] = numpy.datetime64('NaT')
+		return dates
+
+	if values and all(type(value) == bool for value in values):
+		return numpy.array(values, dtype='?')
+
+	# lists, e.g. tags, must not become a second dimension
+	result = numpy.empty(len(values), dtype=object)
+	for index, value in enumerate(values):
+		result[index] = value
+	return result
@@ -0,0 +1,203 @@
+import json
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.export import ParquetSink
+from stackexchangepy.sync import save_json
+
+
+def write_json_lines(path, items):
+	"""
+	Writes every item as a line of JSON, and returns the number of written items.
+
+	:param path: Path of the file.
+	:param items: Iterable over items in the objects or lazy format.
+	"""
+	count = 0
+	with open(path, 'w', encoding='utf-8') as f:
+		for item in items:
+			f.write(json.dumps(item._asdict()))
+			f.write("\n")
+			count += 1
+	return count
+
+
+def write_parquet(path, batches):
+	"""
+	Writes the Arrow record batches in a Parquet file, and returns the number of written rows.
+
+	:param path: Path of the file.
+	:param batches: Iterable over record batches, e.g. from iter(format='arrow').
+	"""
+	with ParquetSink(path) as sink:
+		return sink.write_all(batches)
+
+
+class Crawler(object):
+	"""
+	Crawls all items of a query in a range of creation dates, which is split into shards with fromdate and todate.
+	The total of every window is requested first, and windows with more than max_shard_items items are split again,
+	so shards are small where the site is busy and large where it is not. Shards are crawled concurrently, and every
+	shard is written to its own file. The shards and their state are kept in a manifest, so a crawl which was stopped
+	continues from the shards which are not done, and failed shards can be crawled again on their own.
+
+	All requests are send from the client of the query, so the shards share its transport, rate limiter,
+	backoff scheduler and credential pool.
+
+	>>> crawler = Crawler(client.questions().sort('creation').order('asc'), 1217462400, 1700000000,
+	>>>                   'questions-{fromdate}-{todate}.jsonl', 'questions.json', workers=8)
+	>>> crawler.run()
+	"""
+
+	def __init__(self, query, fromdate, todate, path, manifest, max_shard_items=10000, workers=4, pagesize=100,
+				format='lazy', fields=None, writer=write_json_lines):
+		"""
+		:param query: Query, whose items are crawled, e.g. client.questions().tagged('python'). The items should be
+			sorted by creation date, so the pages of a shard do not change while it is crawled.
+		:param fromdate: Unix time or datetime, from which items are crawled.
+		:param todate: Unix time or datetime, until which items are crawled. It is not included.
+		:param path: Path of the file of a shard, which contains {fromdate} and {todate}.
+		:param manifest: Path of the JSON file with the shards. It is created, when the shards are planned.
+		:param max_shard_items: Maximum number of items in a shard. Windows of a single second are not split,
+			however many items they have.
+		:param workers: Maximum number of windows or shards, which are requested at the same time.
+		:param pagesize: Number of items in a page.
+		:param format: Format, in which the items are given to the writer, e.g. lazy or arrow.
+		:param fields: Columns, which are returned with the column formats.
+		:param writer: Function, which receives the path of the file and the items of a shard, writes them,
+			and returns their number. By default items are written as JSON lines. Use write_parquet with format='arrow'.
+		"""
+		if "{fromdate}" not in path or "{todate}" not in path:
+			raise ExchangeException('The path must contain {fromdate} and {todate}.', 'crawler', 400)
+
+		self.query 				= query
+		self.fromdate 			= self._unix_time(fromdate)
+		self.todate 			= self._unix_time(todate)
+		self.path 				= path
+		self.manifest 			= manifest
+		self.max_shard_items 	= max_shard_items
+		self.workers 			= workers
+		self.pagesize 			= pagesize
+		self.format 			= format
+		self.fields 			= fields
+		self.writer 			= writer
+
+		self._lock 				= threading.Lock()
+		self.shards 			= self._load()
+
+	def run(self):
+		"""
+		Plans the shards, if they are not in the manifest yet, and crawls all shards, which are not done.
+		Returns the number of items, which were written. If some of the shards failed, the rest are still crawled,
+		and then an exception is raised. The failed shards are crawled again on the next run.
+		"""
+		with ThreadPoolExecutor(max_workers=self.workers) as executor:
+			if self.shards is None:
+				self.shards = self._plan(executor)
+				self._save()
+
+			pending = [index for index, shard in enumerate(self.shards) if shard['status'] != 'done']
+			count = sum(executor.map(self._run, pending))
+
+		failed = self.failed()
+		if failed:
+			raise ExchangeException('{} of {} shards failed: {}'.format(len(failed), len(self.shards), failed[0]['error']),
+									'crawler', 500)
+		return count
+
+	def crawl(self, index):
+		"""
+		Crawls a single shard, and returns the number of its items. Its file is replaced only when all of its items
+		are written, so a shard which failed does not leave a part of its items.
+
+		:param index: Index of the shard in the manifest.
+		"""
+		shard = self.shards[index]
+		query = self._window(shard['fromdate'], shard['todate'])
+		temporary = "{}.tmp".format(shard['path'])
+
+		try:
+			items = self.writer(temporary, query.iter(pagesize=self.pagesize, format=self.format, fields=self.fields))
+			os.replace(temporary, shard['path'])
+		except Exception as error:
+			if os.path.exists(temporary):
+				os.remove(temporary)
+			self._update(index, status='failed', error=getattr(error, 'message', str(error)))
+			raise
+
+		self._update(index, status='done', items=items, error=None)
+		return items
+
+	def failed(self):
+		"""
+		Returns the shards, which failed.
+		"""
+		return [shard for shard in self.shards or [] if shard['status'] == 'failed']
+
+	def _run(self, index):
+		try:
+			return self.crawl(index)
+		except Exception:
+			# kept in the manifest, and raised after the other shards are crawled
+			return 0
+
+	def _plan(self, executor):
+		"""
+		Splits the range in windows, until every window has at most max_shard_items items. A window is split
+		in as many equal parts, as it would need if its items were spread evenly, and parts which are still
+		too large are split again on the next level.
+		"""
+		windows, shards = [(self.fromdate, self.todate)], []
+
+		while windows:
+			split = []
+			for (start, end), total in zip(windows, executor.map(self._total, windows)):
+				if total > self.max_shard_items and end - start > 1:
+					parts = min(int(math.ceil(total / float(self.max_shard_items))), end - start)
+					bounds = [start + (end - start) * part // parts for part in range(parts + 1)]
+					split.extend(zip(bounds, bounds[1:]))
+				elif total:
+					shards.append({ 'fromdate': start, 'todate': end, 'total': total, 'status': 'pending', 'items': None,
+									'error': None, 'path': self.path.format(fromdate=start, todate=end) })
+			windows = split
+
+		return sorted(shards, key=lambda shard: shard['fromdate'])
+
+	def _total(self, window):
+		client = self.query._client
+		call = client._prepare(self._window(*window), 'get')
+		return client._fetch(call, dict(call.params, filter='total'))['total']
+
+	def _window(self, start, end):
+		# todate of the API is inclusive
+		return self.query.fromdate(start).todate(end - 1)
+
+	def _update(self, index, **state):
+		with self._lock:
+			self.shards[index].update(state)
+			self._save()
+
+	def _load(self):
+		if not os.path.exists(self.manifest):
+			return None
+
+		with open(self.manifest, encoding='utf-8') as f:
+			manifest = json.load(f)
+
+		if [manifest['url'], manifest['params'], manifest['fromdate'], manifest['todate']] != \
+			[self.query._url, self._params(), self.fromdate, self.todate]:
+			raise ExchangeException('The manifest {} is of another crawl.'.format(self.manifest), 'crawler', 400)
+		return manifest['shards']
+
+	def _save(self):
+		save_json(self.manifest, { 'url': self.query._url, 'params': self._params(), 'fromdate': self.fromdate,
+									'todate': self.todate, 'shards': self.shards })
+
+	def _params(self):
+		return { key: str(value) for key, value in self.query._params.items() }
+
+	def _unix_time(self, date):
+		return int(date.timestamp()) if hasattr(date, 'timestamp') else int(date)
@@ -0,0 +1,123 @@
+import datetime as dt
+import threading
+import time
+
+from stackexchangepy.exception import ExchangeException
+
+
+class Credential(object):
+	"""
+	App key and access token, which are send together with a request, and the quota which is left for them.
+	"""
+
+	def __init__(self, key=None, access_token=None, quota_max=10000):
+		"""
+		:param key: The key provided from the site, when you registered your app.
+		:param access_token: Access token of an user of the app.
+		:param quota_max: Daily quota of the credential. It is updated from the responses of the API.
+		"""
+		self.key 				= key
+		self.access_token 		= access_token
+		self.quota_max 			= quota_max
+		self.quota_remaining 	= quota_max
+		self.reset_at 			= None
+		self.parked_until 		= None
+
+	def __repr__(self):
+		return "Credential(key={!r}, quota_remaining={}, quota_max={})".format(self.key, self.quota_remaining, self.quota_max)
+
+	def params(self):
+		"""
+		Returns the parameters, which are added to a request made with the credential.
+		"""
+		params = {}
+		if self.access_token:
+			params['access_token'] = self.access_token
+		if self.key:
+			params['key'] = self.key
+		return params
+
+
+class CredentialPool(object):
+	"""
+	Pool of credentials, from which the client takes the one with the most remaining quota for every request.
+	Quotas are updated from the responses of the API, and credentials without quota are parked until the daily
+	reset at midnight UTC. All operations are atomic, so one pool can be shared by many threads and clients.
+	"""
+
+	def __init__(self, credentials, clock=time.time):
+		"""
+		:param credentials: List of Credential objects or (key, access_token) tuples.
+		:param clock: Function which returns the current unix time.
+		"""
+		self.credentials 	= [credential if isinstance(credential, Credential) else Credential(*credential)
+								for credential in credentials]
+		self._clock 		= clock
+		self._lock 			= threading.Lock()
+
+		if not self.credentials:
+			raise ExchangeException('At least one credential must be provided.', 'authentication', 400)
+
+	def acquire(self):
+		"""
+		Returns the credential with the most remaining quota, and takes one request from its quota.
+		If all credentials are out of quota, an exception is raised.
+		"""
+		with self._lock:
+			now = self._clock()
+			for credential in self.credentials:
+				self._reset(credential, now)
+
+			available = [credential for credential in self.credentials if credential.parked_until is None]
+			if not available:
+				raise ExchangeException('All credentials are out of quota until {}.'.format(self._reset_date(now)),
+										'throttle_violation', 502)
+
+			credential = max(available, key=lambda credential: credential.quota_remaining)
+			credential.quota_remaining -= 1
+			if credential.quota_remaining <= 0:
+				credential.parked_until = self._next_reset(now)
+
+			return credential
+
+	def update(self, credential, quota_remaining, quota_max):
+		"""
+		Updates the quota of the credential with the values returned from the API.
+
+		:param credential: Credential with which the request was made.
+		:param quota_remaining: Value of the quota_remaining field of the response.
+		:param quota_max: Value of the quota_max field of the response.
+		"""
+		if quota_remaining is None:
+			return
+
+		with self._lock:
+			credential.quota_max = quota_max or credential.quota_max
+			# the request was already taken from the quota by acquire. Responses of concurrent requests
+			# can come in any order, so the smallest value is the latest one
+			credential.quota_remaining = min(credential.quota_remaining + 1, quota_remaining)
+
+			if credential.quota_remaining <= 0:
+				credential.parked_until = self._next_reset(self._clock())
+
+	def remaining(self):
+		"""
+		Returns the remaining quota of all credentials.
+		"""
+		with self._lock:
+			return sum(max(credential.quota_remaining, 0) for credential in self.credentials)
+
+	def _reset(self, credential, now):
+		if credential.reset_at is None:
+			credential.reset_at = self._next_reset(now)
+		elif now >= credential.reset_at:
+			credential.quota_remaining = credential.quota_max
+			credential.reset_at = self._next_reset(now)
+			credential.parked_until = None
+
+	def _next_reset(self, now):
+		return self._reset_date(now).timestamp()
+
+	def _reset_date(self, now):
+		today = dt.datetime.fromtimestamp(now, tz=dt.timezone.utc).date()
+		return dt.datetime.combine(today + dt.timedelta(days=1), dt.time(0, 0, 0), tzinfo=dt.timezone.utc)
@@ -0,0 +1,58 @@
+import json
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+try:
+	import ujson
+except ImportError:
+	ujson = None
+
+from stackexchangepy.exception import ExchangeException
+
+
+def _json_loads(content):
+	return json.loads(content.decode('utf-8') if isinstance(content, bytes) else content)
+
+
+def _ujson_loads(content):
+	return ujson.loads(content.decode('utf-8') if isinstance(content, bytes) else content)
+
+
+# JSON libraries which can decode the responses, from the fastest one
+decoders = [
+	('orjson', orjson.loads if orjson is not None else None),
+	('ujson', _ujson_loads if ujson is not None else None),
+	('json', _json_loads)
+]
+
+
+def available():
+	"""
+	Returns the names of the installed JSON libraries, from the fastest one.
+	"""
+	return [name for name, loads in decoders if loads is not None]
+
+
+def get_decoder(decoder=None):
+	"""
+	Returns function, which decodes the body of a response.
+
+	:param decoder: Name of the JSON library - orjson, ujson or json, or a function which receives the body
+		as bytes and returns the decoded object. By default it is the fastest installed library.
+	"""
+	if callable(decoder):
+		return decoder
+
+	loads = dict(decoders)
+	if decoder is None:
+		return loads[available()[0]]
+
+	if decoder not in loads:
+		raise ExchangeException('Unknown JSON library {}. Use one of {}.'.format(decoder, ", ".join(loads)), 'decoder', 400)
+	if loads[decoder] is None:
+		raise ExchangeException('{} must be installed, in order to be used for decoding.'.format(decoder), 'decoder', 400)
+
+	return loads[decoder]
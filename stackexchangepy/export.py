@@ -0,0 +1,258 @@
+import json
+from functools import lru_cache
+
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.filters import filter_fields, item_type, object_types
+
+
+# imported on first use of the arrow format, so importing the client does not load it
+pyarrow = None
+
+# column with the fields, which are not in the schema
+EXTRA = 'extra'
+
+# fields whose values are lists of strings
+list_fields = ['aliases', 'included_fields', 'last_tags', 'markdown_extensions', 'scope', 'tags']
+
+int_fields = ['accept_rate', 'age', 'applied_count', 'award_count', 'backoff', 'bounty_amount', 'bronze', 'count', 'gold',
+			'max_daily_actions', 'min_seconds_between_actions', 'new_active_users', 'quota_max', 'quota_remaining',
+			'reputation', 'revision_number', 'score', 'silver']
+
+bool_fields = ['edited', 'on_hold', 'requires_comment', 'requires_question_id', 'requires_site', 'set_community_wiki']
+
+
+def _require():
+	global pyarrow
+	if pyarrow is None:
+		try:
+			import pyarrow
+			import pyarrow.parquet
+		except ImportError:
+			raise ExchangeException('pyarrow must be installed, in order the arrow format to be used.', 'export', 500)
+
+
+def field_type(field):
+	"""
+	Returns the Arrow type of a field. Dates are timestamps in seconds, nested objects are structs with the fields
+	of their type, and objects of unknown type are JSON strings.
+
+	:param field: Name of the field.
+	"""
+	_require()
+	if field in object_types:
+		return pyarrow.struct([(name, field_type(name)) for name in filter_fields(object_types[field])])
+	if field.endswith('_date'):
+		return pyarrow.timestamp('s', tz='UTC')
+	if field in list_fields:
+		return pyarrow.list_(pyarrow.string())
+	if field.startswith(('is_', 'has_', 'can_')) or field in bool_fields:
+		return pyarrow.bool_()
+	if field.endswith('_per_minute'):
+		return pyarrow.float64()
+	if field.endswith(('_id', '_count', '_score')) or field.startswith(('total_', 'reputation_change')) or field in int_fields:
+		return pyarrow.int64()
+	return pyarrow.string()
+
+
+@lru_cache(maxsize=None)
+def _schema(name, fields):
+	columns = fields or tuple(filter_fields(item_type(name)))
+	if not columns:
+		raise ExchangeException('There are no fields of {} in Filter. Give the fields of the schema.'.format(name), 'export', 400)
+
+	# the fields of the items are open-ended, unless they are given
+	extra = [(EXTRA, pyarrow.string())] if not fields else []
+	return pyarrow.schema([(field, field_type(field)) for field in columns] + extra)
+
+
+def schema(name, fields=None):
+	"""
+	Returns the Arrow schema of the items of a method. By default it has all fields of the type of the items in Filter,
+	and the extra column, in which the other fields of every item are kept as JSON object, e.g. body of filter('withbody')
+	or fields of nested objects, which are not in Filter. The schema is the same for every page of a query.
+
+	:param name: Name of the method, e.g. questions.
+	:param fields: List of the fields of the schema. It can have fields, which are not in Filter, e.g. body.
+		Then there is no extra column, and the other fields are skipped.
+	"""
+	_require()
+	return _schema(name, tuple(fields) if fields else None)
+
+
+def record_batch(items, schema):
+	"""
+	Returns Arrow record batch with the decoded items. Missing fields are null. If the schema has the extra column,
+	the fields which are not in the schema, and the fields of the nested objects, which are not in their structs,
+	are kept in it.
+
+	:param items: List of decoded items.
+	:param schema: Arrow schema of the batch.
+	"""
+	_require()
+	arrays = []
+	for field in schema:
+		if field.name == EXTRA:
+			values = [_extra(item, schema) for item in items]
+		else:
+			values = [item.get(field.name) for item in items]
+			if field.type == pyarrow.string():
+				values = [value if value is None or type(value) == str else json.dumps(value) for value in values]
+		arrays.append(pyarrow.array(values, type=field.type))
+	return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _extra(item, schema):
+	rest = _rest(item, schema)
+	return json.dumps(rest) if rest else None
+
+
+def _rest(value, _type):
+	"""
+	Returns the fields of the object, which do not fit in the schema or in the struct type.
+	"""
+	rest = {}
+	for key, nested in value.items():
+		index = _type.get_field_index(key)
+		if index < 0 or key == EXTRA:
+			rest[key] = nested
+			continue
+
+		child = _type.field(index).type
+		if type(nested) == dict and pyarrow.types.is_struct(child):
+			nested = _rest(nested, child)
+			if nested:
+				rest[key] = nested
+	return rest
+
+
+class ParquetSink(object):
+	"""
+	Writes record batches, e.g. the ones returned from iter(format='arrow'), to Parquet files. Batches are collected,
+	until they have row_group_size rows, and then are written as one row group, so at most one row group is kept
+	in memory, however large the crawl is. With max_file_rows the output is split in many files.
+
+	All batches must have the schema of the file, or a part of its columns, which are then null.
+	The batches of iter(format='arrow') have one schema for the whole query, but when the batches come from
+	more than one query, or are built with other schemas, give the schema of the file, which has all of their fields.
+
+	>>> with ParquetSink('questions-{part}.parquet', max_file_rows=1000000) as sink:
+	>>>     sink.write_all(client.questions().iter(format='arrow'))
+	"""
+
+	def __init__(self, path, schema=None, row_group_size=64 * 1024, max_file_rows=None, compression='snappy'):
+		"""
+		:param path: Path of the Parquet file. When max_file_rows is given, it must contain {part}, which is replaced
+			with the number of the file.
+		:param schema: Arrow schema of the file. By default it is the schema of the first batch, so it must be given,
+			when the fields of the batches are not known in advance.
+		:param row_group_size: Number of rows in a row group.
+		:param max_file_rows: Maximum number of rows in a file. By default all rows are written in one file.
+		:param compression: Compression of the columns.
+		"""
+		_require()
+		if max_file_rows is not None and "{part}" not in path:
+			raise ExchangeException('The path must contain {part}, when max_file_rows is given.', 'export', 400)
+
+		self.path 			= path
+		self.schema 		= schema
+		self.row_group_size = row_group_size
+		self.max_file_rows 	= max_file_rows
+		self.compression 	= compression
+		self.files 			= []
+		self.rows 			= 0
+
+		self._writer 		= None
+		self._file_rows 	= 0
+		self._pending 		= []
+		self._pending_rows 	= 0
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
+
+	def write(self, batch):
+		"""
+		Adds the batch to the output.
+
+		:param batch: Arrow record batch.
+		"""
+		if self.schema is None:
+			self.schema = batch.schema
+
+		self._pending.append(self._conform(batch))
+		self._pending_rows += batch.num_rows
+
+		while self._pending_rows >= self._group_size():
+			self._flush(self._group_size())
+
+	def write_all(self, batches):
+		"""
+		Writes all batches, and returns the number of written rows.
+
+		:param batches: Iterable over Arrow record batches.
+		"""
+		for batch in batches:
+			self.write(batch)
+		return self.rows + self._pending_rows
+
+	def close(self):
+		"""
+		Writes the remaining rows and closes the file.
+		"""
+		while self._pending_rows:
+			self._flush(min(self._pending_rows, self._group_size()))
+
+		if self._writer is not None:
+			self._writer.close()
+			self._writer = None
+
+	def _conform(self, batch):
+		"""
+		Returns the batch with the columns of the schema. Columns which are missing in the batch are null.
+		Columns which are not in the schema, or have other type, e.g. struct with more fields, raise an exception,
+		instead of being dropped.
+		"""
+		if batch.schema.equals(self.schema):
+			return batch
+
+		for field in batch.schema:
+			index = self.schema.get_field_index(field.name)
+			if index < 0:
+				raise ExchangeException('Field {} is not in the schema of the file. Give the schema to the sink.'.format(field.name),
+										'export', 400)
+			if not field.type.equals(self.schema.field(index).type):
+				raise ExchangeException('Field {} is {} in the batch and {} in the file. Give the schema to the sink.'.format(
+										field.name, field.type, self.schema.field(index).type), 'export', 400)
+
+		columns = [batch.column(field.name) if field.name in batch.schema.names else pyarrow.nulls(batch.num_rows, field.type)
+					for field in self.schema]
+		return pyarrow.RecordBatch.from_arrays(columns, schema=self.schema)
+
+	def _group_size(self):
+		# a row group must not continue in the next file
+		if self.max_file_rows is None:
+			return self.row_group_size
+		return min(self.row_group_size, self.max_file_rows - self._file_rows)
+
+	def _flush(self, rows):
+		table = pyarrow.Table.from_batches(self._pending, schema=self.schema)
+		group, rest = table.slice(0, rows), table.slice(rows)
+
+		if self._writer is None:
+			path = self.path.format(part=len(self.files)) if self.max_file_rows is not None else self.path
+			self._writer = pyarrow.parquet.ParquetWriter(path, self.schema, compression=self.compression)
+			self.files.append(path)
+
+		self._writer.write_table(group, row_group_size=rows)
+		self.rows += rows
+		self._file_rows += rows
+
+		self._pending = rest.to_batches()
+		self._pending_rows = rest.num_rows
+
+		if self.max_file_rows is not None and self._file_rows >= self.max_file_rows:
+			self._writer.close()
+			self._writer = None
+			self._file_rows = 0
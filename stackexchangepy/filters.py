@@ -339,4 +339,42 @@ class Filter:
 	WRITE_PERMISSION_MIN_SECONDS_BETWEEN_ACTIONS 	= "write_permission.min_seconds_between_actions"
 	WRITE_PERMISSION_OBJECT_TYPE 					= "write_permission.object_type"
 	WRITE_PERMISSION_USER_ID 						= "write_permission.user_id"
-	WITHBODY										= "witbody"
\ No newline at end of file
+	WITHBODY										= "witbody"
+
+
+# types of the objects, which are nested in the items
+object_types = {
+	'badge_counts': 'badge_count',
+	'closed_details': 'closed_details',
+	'migrated_from': 'migration_info',
+	'migrated_to': 'migration_info',
+	'notice': 'notice',
+	'on_site': 'site',
+	'other_site': 'site',
+	'owner': 'shallow_user',
+	'proposing_user': 'shallow_user',
+	'reply_to_user': 'shallow_user',
+	'styling': 'styling',
+	'user': 'shallow_user'
+}
+
+
+def filter_fields(_type):
+	"""
+	Returns the names of the fields of the type, which are in Filter, e.g. ['answer_id', 'creation_date', ...] for answer.
+
+	:param _type: Name of the type of the API, e.g. question or shallow_user.
+	"""
+	prefix = "{}.".format(_type)
+	return list(dict.fromkeys(value[len(prefix):] for name, value in vars(Filter).items()
+							if name.isupper() and isinstance(value, str) and value.startswith(prefix)))
+
+
+def item_type(name):
+	"""
+	Returns the type of the items of a method, e.g. suggested_edit for suggested-edits.
+
+	:param name: Name of the method, from which the items are returned.
+	"""
+	name = name.replace('-', '_')
+	return name[:-1] if name.endswith('s') else name
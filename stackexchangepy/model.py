@@ -1,10 +1,135 @@
+import datetime as dt
+import threading
+
+from stackexchangepy.filters import filter_fields, item_type, object_types
+
+
+# record type of every kind of item, by its name
+_types = {}
+_lock = threading.Lock()
+# value of the fields, which are not set
+_missing = object()
+
+
+class Record(object):
+	"""
+	Base of the types of the items returned from the API. Every field of the item is an attribute, which is kept
+	in a slot of the instance, and nested objects are records too. A type has a slot for every known field of its kind,
+	and the slots of the fields, which are missing in an item, are not set, so reading them raises AttributeError.
+	"""
+	__slots__ = ()
+	_fields = ()
+	_known = frozenset()
+
+	def __init__(self, item):
+		for field, value in item.items():
+			setattr(self, field, value)
+
+	def __repr__(self):
+		return "{}({})".format(type(self).__name__, ", ".join("{}={!r}".format(field, value) for field, value in self._items()))
+
+	def _asdict(self):
+		"""
+		Returns the item as a dictionary, in which the nested records are dictionaries too.
+		"""
+		return { field: value._asdict() if isinstance(value, Record) else value for field, value in self._items() }
+
+	def _items(self):
+		for field in self._fields:
+			value = getattr(self, field, _missing)
+			if value is not _missing:
+				yield field, value
+
+
+def record_type(name, fields=()):
+	"""
+	Returns the record type of the items with the given name. There is one type for every kind of item, which has
+	the fields of its type in Filter. When an item has a field, which is not known yet, the type is replaced
+	with one, which has the new field too, so the number of types is bounded by the number of different fields.
+
+	:param name: Name of the item, e.g. questions or owner.
+	:param fields: Names of the fields of the item.
+	"""
+	klass = _types.get(name)
+	if klass is not None and klass._known.issuperset(fields):
+		return klass
+
+	with _lock:
+		klass = _types.get(name)
+		known = klass._fields if klass is not None else tuple(filter_fields(object_types.get(name, item_type(name))))
+		if klass is None or not klass._known.issuperset(fields):
+			known += tuple(field for field in fields if field not in known)
+			slots = tuple(field for field in known if field.isidentifier())
+			# fields which are not valid identifiers can be still reached with getattr
+			if len(slots) < len(known):
+				slots += ('__dict__',)
+			klass = _types[name] = type(name, (Record,), { '__slots__': slots, '_fields': known, '_known': frozenset(known) })
+		return klass
+
 
 def create_class(name, response):
-	klass = type(name, (object,), {})
-	for key, value in response.items():
+	klass = record_type(name, response)
+	return klass({ key: create_class(key, value) if type(value) == dict else value for key, value in response.items() })
+
+
+class LazyRecord(object):
+	"""
+	View over an item of the decoded response. Fields are read from the item, when they are accessed,
+	and nested objects are wrapped only on first access. Wrapped objects and converted dates are kept,
+	so nothing is allocated for the fields, which are never read.
+	"""
+	__slots__ = ('_name', '_data', '_memo')
+
+	def __init__(self, name, data):
+		self._name = name
+		self._data = data
+		self._memo = None
+
+	def __getattr__(self, field):
+		if field.startswith('__'):
+			raise AttributeError(field)
+
+		memo = self._memo
+		if memo is not None and field in memo:
+			return memo[field]
+
+		try:
+			value = self._data[field]
+		except KeyError:
+			raise AttributeError("{} has no field {}".format(self._name, field))
+
 		if type(value) == dict:
-			subklass = create_class(key, value)
-			setattr(klass, key, subklass)
-		else:
-			setattr(klass, key, value)
-	return klass
\ No newline at end of file
+			return self._remember(field, LazyRecord(field, value))
+		return value
+
+	def __dir__(self):
+		return list(self._data)
+
+	def __repr__(self):
+		return "{}({!r})".format(self._name, self._data)
+
+	def date(self, field):
+		"""
+		Returns the value of a date field, e.g. creation_date, as datetime in UTC.
+
+		:param field: Name of the field, whose value is unix time.
+		"""
+		key = ('date', field)
+		memo = self._memo
+		if memo is not None and key in memo:
+			return memo[key]
+
+		value = self._data.get(field)
+		return self._remember(key, dt.datetime.fromtimestamp(value, tz=dt.timezone.utc) if value is not None else None)
+
+	def _asdict(self):
+		"""
+		Returns the decoded item.
+		"""
+		return self._data
+
+	def _remember(self, key, value):
+		if self._memo is None:
+			self._memo = {}
+		self._memo[key] = value
+		return value
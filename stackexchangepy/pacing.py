@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+
+
+class BackoffScheduler(object):
+	"""
+	Keeps the backoff, which the API returned for every method, and delays later calls to the same method
+	until it expires. Calls to other methods are not affected.
+	A method is identified by its route, in which the ids are replaced by {ids}, e.g. /questions/{ids}/answers.
+	One scheduler can be shared by more than one client.
+	"""
+
+	def __init__(self, clock=time.monotonic):
+		"""
+		:param clock: Function which returns the current time in seconds.
+		"""
+		self._clock = clock
+		self._ready = {}
+		self._lock 	= threading.Lock()
+
+	def record(self, method, backoff):
+		"""
+		Records that the method must not be called in the next backoff seconds.
+
+		:param method: Route of the method.
+		:param backoff: Seconds, returned from the API in the backoff field.
+		"""
+		if not backoff:
+			return
+
+		with self._lock:
+			ready = self._clock() + backoff
+			self._ready[method] = max(ready, self._ready.get(method, ready))
+
+	def delay(self, method):
+		"""
+		Returns the seconds, which are left until the method can be called again.
+
+		:param method: Route of the method.
+		"""
+		with self._lock:
+			ready = self._ready.get(method)
+			if ready is None:
+				return 0
+
+			delay = ready - self._clock()
+			if delay <= 0:
+				del self._ready[method]
+				return 0
+			return delay
+
+	def wait(self, method):
+		"""
+		Blocks the current thread until the method can be called again.
+
+		:param method: Route of the method.
+		"""
+		delay = self.delay(method)
+		while delay > 0:
+			time.sleep(delay)
+			delay = self.delay(method)
+
+	async def wait_async(self, method):
+		"""
+		Suspends the current coroutine until the method can be called again.
+
+		:param method: Route of the method.
+		"""
+		delay = self.delay(method)
+		while delay > 0:
+			await asyncio.sleep(delay)
+			delay = self.delay(method)
@@ -0,0 +1,136 @@
+from collections import namedtuple
+
+
+# item returned from fanout, together with the site from which it was received
+SiteItem = namedtuple('SiteItem', ['site', 'item'])
+
+
+class Query(object):
+	"""
+	Immutable query to the API, which is returned from every step of the builder, e.g. client.questions().tagged('python').
+	Every step returns a new query, so a query can be kept, extended and executed from many threads at the same time.
+	The query is executed from the client, when it is finished with get, iter, parallel, stream or one of the post methods.
+	"""
+	__slots__ = ('_client', '_url', '_params', '_item', '_route', '_ids')
+
+	def __init__(self, client, url, params=None, item="", route="", ids=None):
+		"""
+		:param client: Client, which builds and executes the query.
+		:param url: Url of the method.
+		:param params: Parameters of the query. The dictionary must not be changed after that.
+		:param item: Name of the returned items.
+		:param route: Path of the method, in which the ids are replaced with {ids}.
+		:param ids: List of more than MAX_IDS ids, which are requested in chunks.
+		"""
+		for field, value in zip(self.__slots__, (client, url, params or {}, item, route, ids)):
+			object.__setattr__(self, field, value)
+
+	def __setattr__(self, name, value):
+		raise AttributeError('Query is immutable.')
+
+	def __getattr__(self, name):
+		if name.startswith('_'):
+			raise AttributeError(name)
+
+		def _set(*args, **kwargs):
+			return self._client._step(self, name, args, kwargs)
+		return _set
+
+	def __repr__(self):
+		return "Query({}, {})".format(self._url, self._params)
+
+	def describe(self):
+		"""
+		Returns the url and a copy of the parameters of the query. Other attributes of the query are steps
+		of the builder, e.g. url and params, so the query does not have properties with their names.
+		"""
+		return self._url, dict(self._params)
+
+
+class Metadata(object):
+	"""
+	Fields of a response, which are not items. It is created for every execution of a query, so it is never
+	shared between threads. For queries which make many requests, e.g. iter, it has the values of the last response.
+	"""
+	__slots__ = ('has_more', 'quota_remaining', 'quota_max', 'backoff', 'total')
+
+	def __init__(self):
+		for field in self.__slots__:
+			setattr(self, field, None)
+
+	def __repr__(self):
+		return "Metadata({})".format(", ".join("{}={!r}".format(field, getattr(self, field)) for field in self.__slots__))
+
+	def update(self, response):
+		"""
+		Takes the fields from the decoded response.
+
+		:param response: Decoded response, or its fields without the items.
+		"""
+		for field in self.__slots__:
+			if field in response:
+				setattr(self, field, response[field])
+
+
+class _WithMetadata(object):
+
+	@property
+	def has_more(self):
+		return self.metadata.has_more
+
+	@property
+	def quota_remaining(self):
+		return self.metadata.quota_remaining
+
+	@property
+	def quota_max(self):
+		return self.metadata.quota_max
+
+	@property
+	def backoff(self):
+		return self.metadata.backoff
+
+
+class Result(_WithMetadata, list):
+	"""
+	Items returned from get or a post method, together with the metadata of the response, e.g. result.has_more.
+	"""
+
+	def __init__(self, items, metadata):
+		super().__init__(items)
+		self.metadata = metadata
+
+
+class Cursor(_WithMetadata):
+	"""
+	Iterator returned from iter, parallel and stream. Its metadata is of the last response, which was read.
+	"""
+
+	def __init__(self, items, metadata):
+		self.metadata = metadata
+		self._items = iter(items)
+
+	def __iter__(self):
+		return self
+
+	def __next__(self):
+		return next(self._items)
+
+
+class AsyncCursor(_WithMetadata):
+	"""
+	Asynchronous iterator returned from iter and parallel of the asynchronous client.
+	"""
+
+	def __init__(self, items, metadata):
+		self.metadata = metadata
+		self._items = items
+
+	def __aiter__(self):
+		return self
+
+	async def __anext__(self):
+		return await self._items.__anext__()
+
+	async def aclose(self):
+		await self._items.aclose()
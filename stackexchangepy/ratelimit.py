@@ -0,0 +1,83 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket(object):
+	"""
+	Thread-safe token bucket, which limits the number of requests per second.
+	Every request reserves a token. When the bucket is empty, the reservation is made in advance, so requests
+	are served in the order of arrival, no matter if they come from threads or from coroutines.
+	"""
+
+	def __init__(self, rate=30, burst=30, clock=time.monotonic):
+		"""
+		:param rate: Number of requests per second. By default is set to 30, which is the limit of the API for a single IP.
+		:param burst: Maximum number of requests, which can be send at once, after the bucket was not used for a while.
+		:param clock: Function which returns the current time in seconds.
+		"""
+		self.rate 		= float(rate)
+		self.burst 		= burst
+		self._clock 	= clock
+		self._tokens 	= float(burst)
+		self._updated 	= clock()
+		self._lock 		= threading.Lock()
+
+		self._requests 	= 0
+		self._delayed 	= 0
+		self._wait 		= 0.0
+		self._max_wait 	= 0.0
+
+	def reserve(self):
+		"""
+		Takes a token and returns the seconds, which the caller must wait before sending the request.
+		"""
+		with self._lock:
+			now = self._clock()
+			self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+			self._updated = now
+			self._tokens -= 1
+
+			delay = -self._tokens / self.rate if self._tokens < 0 else 0
+
+			self._requests += 1
+			if delay:
+				self._delayed += 1
+				self._wait += delay
+				self._max_wait = max(self._max_wait, delay)
+
+		return delay
+
+	def acquire(self):
+		"""
+		Takes a token, blocking the current thread until it is available.
+		"""
+		delay = self.reserve()
+		if delay:
+			time.sleep(delay)
+
+	async def acquire_async(self):
+		"""
+		Takes a token, suspending the current coroutine until it is available.
+		"""
+		delay = self.reserve()
+		if delay:
+			await asyncio.sleep(delay)
+
+	def metrics(self):
+		"""
+		Returns how many requests passed through the bucket, how many of them had to wait,
+		and the total, the average and the maximum time in seconds, for which they waited.
+		"""
+		with self._lock:
+			return {
+				'requests': self._requests,
+				'delayed': self._delayed,
+				'total_wait': self._wait,
+				'average_wait': self._wait / self._requests if self._requests else 0.0,
+				'max_wait': self._max_wait
+			}
+
+
+# bucket shared by all transports in the process, unless other is given to them
+default_limiter = TokenBucket()
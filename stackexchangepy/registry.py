@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.model import LazyRecord
+from stackexchangepy.sync import save_json
+
+
+# file in which the sites are kept between runs
+default_path = os.path.join(os.path.expanduser('~'), '.cache', 'stackexchangepy', 'sites.json')
+
+
+class SiteRegistry(object):
+	"""
+	All sites of the network, as returned from /sites. They are requested with all pages on first use,
+	and are kept in a file, from which they are loaded until ttl seconds pass. Every site can be found
+	by its api_site_parameter, e.g. superuser, by its domain or an alias of it, e.g. superuser.com, or by its name,
+	e.g. Super User, in a single dictionary lookup. The returned sites are lazy records.
+
+	>>> sites = SiteRegistry(client)
+	>>> sites['Super User'].site_url
+	'https://superuser.com'
+	>>> ExchangeClient(site=sites.resolve('latin.stackexchange.com'))
+	"""
+
+	def __init__(self, client, path=default_path, ttl=24 * 60 * 60, clock=time.time):
+		"""
+		:param client: ExchangeClient, with which the sites are requested.
+		:param path: Path to the JSON file, in which the sites are kept. None keeps them only in memory.
+		:param ttl: Seconds, after which the sites are requested again.
+		:param clock: Function which returns the current unix time.
+		"""
+		self.client = client
+		self.path 	= path
+		self.ttl 	= ttl
+		self._clock = clock
+		self._lock 	= threading.Lock()
+
+		self._sites = None
+		self._index = None
+		self._updated = None
+
+	def __getitem__(self, site):
+		found = self.get(site)
+		if found is None:
+			raise ExchangeException('Unknown site {}.'.format(site), 'site', 404)
+		return found
+
+	def __contains__(self, site):
+		return self.get(site) is not None
+
+	def __iter__(self):
+		return iter(self._load())
+
+	def __len__(self):
+		return len(self._load())
+
+	def get(self, site, default=None):
+		"""
+		Returns the site, or default if there is no such site.
+
+		:param site: api_site_parameter, domain or name of the site. Case is ignored.
+		"""
+		self._load()
+		return self._index.get(str(site).lower(), default)
+
+	def resolve(self, site):
+		"""
+		Returns the api_site_parameter of the site, which can be given to the client.
+
+		:param site: api_site_parameter, domain or name of the site.
+		"""
+		return self[site].api_site_parameter
+
+	def refresh(self):
+		"""
+		Requests the sites again, even if they are not expired.
+		"""
+		with self._lock:
+			self._fetch()
+
+	def _load(self):
+		if self._sites is None or self._clock() - self._updated >= self.ttl:
+			with self._lock:
+				if self._sites is None:
+					self._read()
+				if self._sites is None or self._clock() - self._updated >= self.ttl:
+					self._fetch()
+		return self._sites
+
+	def _read(self):
+		if self.path is None or not os.path.exists(self.path):
+			return
+
+		with open(self.path, encoding='utf-8') as f:
+			cached = json.load(f)
+		self._set(cached['sites'], cached['updated'])
+
+	def _fetch(self):
+		sites = [site._asdict() for site in self.client.sites().iter(format='lazy')]
+		updated = self._clock()
+
+		if self.path is not None:
+			os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+			save_json(self.path, { 'updated': updated, 'sites': sites })
+		self._set(sites, updated)
+
+	def _set(self, sites, updated):
+		records = [LazyRecord('sites', site) for site in sites]
+		index = {}
+		for record, site in zip(records, sites):
+			for key in self._keys(site):
+				index.setdefault(key.lower(), record)
+
+		self._sites, self._index, self._updated = records, index, updated
+
+	def _keys(self, site):
+		urls = [site.get('site_url')] + site.get('aliases', [])
+		keys = [site.get('api_site_parameter'), site.get('name')] + [urlparse(url).netloc for url in urls if url]
+		return [key for key in keys if key]
@@ -0,0 +1,49 @@
+# marks the node, at which a route of the table ends
+END = None
+
+
+class RouteTable(object):
+	"""
+	Trie over the segments of routes, e.g. /users/{ids}/associated, which is built once. A route matches the table,
+	if one of the routes in it is a prefix of the route, so a lookup is a single pass over the segments of the route.
+	"""
+
+	def __init__(self, routes):
+		"""
+		:param routes: List of routes, in which ids are replaced with {ids}.
+		"""
+		self.routes = list(routes)
+		self._root 	= {}
+
+		for route in self.routes:
+			node = self._root
+			for segment in segments(route):
+				node = node.setdefault(segment, {})
+			node[END] = True
+
+	def __contains__(self, route):
+		return self.match(route)
+
+	def match(self, route):
+		"""
+		Returns whether one of the routes of the table is a prefix of the route.
+
+		:param route: Route of a method, e.g. /users/{ids}/associated.
+		"""
+		node = self._root
+		for segment in segments(route):
+			if END in node:
+				return True
+			node = node.get(segment)
+			if node is None:
+				return False
+		return END in node
+
+
+def segments(route):
+	"""
+	Returns the segments of the route.
+
+	:param route: Route of a method, e.g. /questions/{ids}/answers.
+	"""
+	return route.strip("/").split("/")
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+
+class _Flight(object):
+
+	def __init__(self):
+		self.event 	= threading.Event()
+		self.result = None
+		self.error 	= None
+
+
+class SingleFlight(object):
+	"""
+	Coalesces identical calls which are made at the same time. The first caller for a key runs the function,
+	and everyone else who asks for the same key before it finishes waits for it and gets the same result,
+	or the same exception. One group can be shared by many clients.
+	"""
+
+	def __init__(self):
+		self._flights 	= {}
+		self._tasks 	= {}
+		self._lock 		= threading.Lock()
+
+	def do(self, key, function):
+		"""
+		Runs the function, unless a call for the same key is already running in another thread,
+		in which case waits for it and returns its result.
+
+		:param key: Hashable key, which identifies the call.
+		:param function: Function without arguments, which makes the call.
+		"""
+		with self._lock:
+			flight = self._flights.get(key)
+			leader = flight is None
+			if leader:
+				flight = self._flights[key] = _Flight()
+
+		if not leader:
+			flight.event.wait()
+			if flight.error is not None:
+				raise flight.error
+			return flight.result
+
+		try:
+			flight.result = function()
+			return flight.result
+		except Exception as error:
+			flight.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._flights[key]
+			flight.event.set()
+
+	async def do_async(self, key, function):
+		"""
+		Asynchronous version of do. Must be called only from one event loop.
+
+		:param key: Hashable key, which identifies the call.
+		:param function: Coroutine function without arguments, which makes the call.
+		"""
+		task = self._tasks.get(key)
+		if task is None:
+			task = self._tasks[key] = asyncio.ensure_future(function())
+			task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+		# a cancelled caller must not cancel the call for everyone else
+		return await asyncio.shield(task)
@@ -2,6 +2,7 @@
 class Site:
 	"""
 	Contains all sites which can be used with the API.
+	Sites which are not here, can be found by their parameter, domain or name with registry.SiteRegistry.
 	"""
 	QUANTUM_COMPUTING 				= "quantumcomputing.stackexchange.com"
 	CONSTRUCTED_LANGUAGES 			= "conlang.stackexchange.com"
@@ -24,8 +25,8 @@ class Site:
 	CRAFTS 							= "crafts.stackexchange.com"
 	RETROCOMPUTING 					= "retrocomputing.stackexchange.com"
 	LANGUAGE_LEARNING 				= "languagelearning.stackexchange.com"
-	LATIN_LANGUAGE 					= "lating.stackexchange.com"
-	ETHEREUM 						= "etherum.stackexchange.com"
+	LATIN_LANGUAGE 					= "latin.stackexchange.com"
+	ETHEREUM 						= "ethereum.stackexchange.com"
 	PRINTING_3D						= "3dprinting.stackexchange.com"
 	STACKOVERFLOW_ES 				= "es.stackoverflow.com"
 	HARDWARECS 						= "hardwarecs.stackexchange.com"
@@ -52,7 +53,8 @@ class Site:
 	WORLDBUILDING 					= "worldbuilding.stackexchange.com"
 	COMMUNITY_BUILDING 				= "communitybuilding.stackexchange.com"
 	HINDUISM 						= "hinduism.stackexchange.com"
-	BUDDISM 						= "buddism.stackexchange.com"
+	BUDDHISM 						= "buddhism.stackexchange.com"
+	BUDDISM 						= BUDDHISM
 	CRAFTCMS 						= "craftcms.stackexchange.com"
 	PUZZLING 						= "puzzling.stackexchange.com"
 	DATASCIENCE 					= "datascience.stackexchange.com"
@@ -61,11 +63,11 @@ class Site:
 	MATHEMATICS_EDUCATORS 			= "matheducators.stackexchange.com"
 	EXPATRIATES 					= "expatriates.stackexchange.com"
 	ARDUINO 						= "arduino.stackexchange.com"
-	SOFTWARE_RECOMMENDATIONS 		= "sofwarecs.stackexchange.com"
+	SOFTWARE_RECOMMENDATIONS 		= "softwarerecs.stackexchange.com"
 	ALCOHOL 						= "alcohol.stackexchange.com"
 	EBOOKS 							= "ebooks.stackexchange.com"
 	AVIATION 						= "aviation.stackexchange.com"
-	STACKOVERFLOW_PT 				= "pt.stackexchange.com"
+	STACKOVERFLOW_PT 				= "pt.stackoverflow.com"
 	ITALIAN_LANGUAGE 				= "italian.stackexchange.com"
 	AMATEUR_RADIO					= "ham.stackexchange.com"
 	PETS 							= "pets.stackexchange.com"
@@ -95,13 +97,13 @@ class Site:
 	CHEMISTRY 						= "chemistry.stackexchange.com"
 	WINDOWS_PHONE 					= "windowsphone.stackexchange.com"
 	WORKPLACE 						= "workplace.stackexchange.com"
-	CS 								= "computerscience.stackexchange.com"
+	CS 								= "cs.stackexchange.com"
 	ACADEMIA 						= "academia.stackexchange.com"
 	SPORTS 							= "sports.stackexchange.com"
 	MARTIAL_ARTS 					= "martialarts.stackexchange.com"
 	OUTDOORS 						= "outdoors.stackexchange.com"
 	PSYCHOLOGY 						= "psychology.stackexchange.com"
-	MATHEMATICA 					= "mathematics.stackexchange.com"
+	MATHEMATICA 					= "mathematica.stackexchange.com"
 	POKER 							= "poker.stackexchange.com"
 	BIOLOGY 						= "biology.stackexchange.com"
 	CHINESE_LANGUAGE 				= "chinese.stackexchange.com"
@@ -118,11 +120,12 @@ class Site:
 	SIGNAL_PROCESSING 				= "dsp.stackexchange.com"
 	CRYPTOGRAPHY 					= "crypto.stackexchange.com"
 	TRAVEL 							= "travel.stackexchange.com"
-	GARDENING 						= "gradening.stackexchange.com"
+	GARDENING 						= "gardening.stackexchange.com"
 	PHILOSOPHY 						= "philosophy.stackexchange.com"
 	JAPANESE_LANGUAGE 				= "japanese.stackexchange.com"
 	GERMAN_LANGUAGE 				= "german.stackexchange.com"
-	JUDISM 							= "judism.stackexchange.com"
+	JUDAISM 						= "judaism.stackexchange.com"
+	JUDISM 							= JUDAISM
 	SOFTWARE_QUALITY 				= "sqa.stackexchange.com"
 	MUSIC 						  	= "music.stackexchange.com"
 	SHAREPOINT 						= "sharepoint.stackexchange.com"
@@ -136,7 +139,7 @@ class Site:
 	CODE_GOLF 						= "codegolf.stackexchange.com"
 	CODE_REVIEW						= "codereview.stackexchange.com"
 	SCIFI 							= "scifi.stackexchange.com"
-	GRAPHICS_DESIGN 				= "graphicsdesign.stackexchange.com"
+	GRAPHICS_DESIGN 				= "graphicdesign.stackexchange.com"
 	DBA 							= "dba.stackexchange.com"
 	VIDEO							= "video.stackexchange.com"
 	WRITING 						= "writing.stackexchange.com"
@@ -170,7 +173,7 @@ class Site:
 	GAMING 							= "gaming.stackexchange.com"
 	WEBAPPS 						= "webapps.stackexchange.com"
 	STACKAPPS 						= "stackapps.com"
-	MATHOVERFLOW 					= "mathoverflow.com"
+	MATHOVERFLOW 					= "mathoverflow.net"
 	SUPERUSER 						= "superuser.com"
 	META 							= "meta.stackexchange.com"
 	SERVER_FAULT 					= "serverfault.com"
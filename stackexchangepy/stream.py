@@ -0,0 +1,107 @@
+import codecs
+import json
+import re
+
+from stackexchangepy.exception import ExchangeException
+
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class ItemStream(object):
+	"""
+	Incremental decoder of a response of the API. It reads the body chunk by chunk, and yields every item
+	of the items field, as soon as it is decoded, so the whole response is never kept in memory.
+	The other fields of the response, e.g. has_more, quota_remaining and backoff, are collected in envelope,
+	which is complete after all items are read.
+	"""
+
+	def __init__(self, chunks):
+		"""
+		:param chunks: Iterable over the body of the response, as bytes or text chunks.
+		"""
+		self.envelope 	= {}
+		self._chunks 	= iter(chunks)
+		self._text 		= codecs.getincrementaldecoder('utf-8')()
+		self._decoder 	= json.JSONDecoder()
+		self._buffer 	= ""
+		self._position 	= 0
+		self._finished 	= False
+
+	def __iter__(self):
+		self._expect("{")
+
+		while True:
+			if self._peek() == "}":
+				return
+			if self._peek() == ",":
+				self._position += 1
+
+			key = self._value()
+			self._expect(":")
+
+			if key != 'items':
+				self.envelope[key] = self._value()
+				continue
+
+			self._expect("[")
+			while self._peek() != "]":
+				if self._peek() == ",":
+					self._position += 1
+				yield self._value()
+			self._position += 1
+
+	def _peek(self):
+		"""
+		Skips the whitespaces and returns the next character.
+		"""
+		while True:
+			self._position = WHITESPACE.match(self._buffer, self._position).end()
+			if self._position < len(self._buffer):
+				return self._buffer[self._position]
+			if not self._read():
+				raise ExchangeException('Unexpected end of the response.', 'stream', 500)
+
+	def _expect(self, character):
+		if self._peek() != character:
+			raise ExchangeException('Expected {} at position {} of the response.'.format(character, self._position), 'stream', 500)
+		self._position += 1
+
+	def _value(self):
+		"""
+		Decodes the next JSON value, reading more chunks, until it is complete.
+		"""
+		self._peek()
+		while True:
+			try:
+				value, end = self._decoder.raw_decode(self._buffer, self._position)
+			except ValueError:
+				if self._read():
+					continue
+				raise ExchangeException('Invalid JSON in the response.', 'stream', 500)
+
+			# numbers and literals can continue in the next chunk
+			if end == len(self._buffer) and self._buffer[self._position] not in '{["' and self._read():
+				continue
+
+			self._position = end
+			return value
+
+	def _read(self):
+		"""
+		Appends the next chunk to the buffer, dropping the part which is already decoded.
+		Returns False, if there are no more chunks.
+		"""
+		if self._finished:
+			return False
+
+		chunk = next(self._chunks, None)
+		if chunk is None:
+			self._finished = True
+			text = self._text.decode(b"", final=True)
+		else:
+			text = self._text.decode(chunk) if isinstance(chunk, bytes) else chunk
+
+		self._buffer = self._buffer[self._position:] + text
+		self._position = 0
+		return True
@@ -0,0 +1,169 @@
+import json
+import os
+import time
+
+from stackexchangepy.exception import ExchangeException
+
+
+class Checkpoint(object):
+	"""
+	High-water marks of the synced methods, kept in a JSON file. The file is replaced atomically on every save,
+	so after a crash it has either the previous or the new state, never a part of it.
+	"""
+
+	def __init__(self, path):
+		"""
+		:param path: Path to the JSON file. It is created on the first save.
+		"""
+		self.path = path
+		self.state = self._load()
+
+	def get(self, site, method):
+		"""
+		Returns the state of the method on the site, or None if it was never synced.
+
+		:param site: Site, e.g. stackoverflow.com.
+		:param method: Synced method, e.g. questions.
+		"""
+		return self.state.get(site, {}).get(method)
+
+	def set(self, site, method, state):
+		"""
+		Keeps the new state of the method and saves the file.
+
+		:param site: Site, e.g. stackoverflow.com.
+		:param method: Synced method, e.g. questions.
+		:param state: Dictionary, which can be encoded to JSON.
+		"""
+		self.state.setdefault(site, {})[method] = state
+		self._save()
+
+	def _load(self):
+		if not os.path.exists(self.path):
+			return {}
+		with open(self.path, encoding='utf-8') as f:
+			return json.load(f)
+
+	def _save(self):
+		save_json(self.path, self.state)
+
+
+def save_json(path, data):
+	"""
+	Writes the data to a temporary file, and replaces the file with it, so the file is never left half written.
+
+	:param path: Path to the JSON file.
+	:param data: Dictionary, which can be encoded to JSON.
+	"""
+	temporary = "{}.tmp".format(path)
+	with open(temporary, 'w', encoding='utf-8') as f:
+		json.dump(data, f, indent=1, sort_keys=True)
+		f.flush()
+		os.fsync(f.fileno())
+	os.replace(temporary, path)
+
+
+class DeltaSync(object):
+	"""
+	Incremental sync of the items of a site, which changed since the last run. Every method is paged sorted by activity
+	in ascending order, from the high-water mark, which is saved in the checkpoint after every page.
+
+	Pages are requested by key instead of by number: every request starts from the date of the last received item,
+	so items which change during the crawl move to the end and are received again, but nothing is skipped.
+	Items with the same date as the mark, which were already received, are not returned again.
+
+	>>> sync = DeltaSync(client, 'stackoverflow.json')
+	>>> sync.run(lambda method, items: database.upsert(method, items))
+	"""
+
+	# field of the id and of the date, and sort order of every method
+	methods = {
+		'questions': ('question_id', 'last_activity_date', 'activity'),
+		'answers': ('answer_id', 'last_activity_date', 'activity'),
+		'comments': ('comment_id', 'creation_date', 'creation')
+	}
+
+	def __init__(self, client, checkpoint, methods=('questions', 'answers', 'comments'), since=0, pagesize=100,
+				format='objects', clock=time.time):
+		"""
+		:param client: ExchangeClient, with which the items are requested.
+		:param checkpoint: Checkpoint or path to its file.
+		:param methods: Methods, which are synced.
+		:param since: Unix time, from which the first run starts, if there is no checkpoint.
+		:param pagesize: Number of items in a page.
+		:param format: Model of the items, which are given to the handler - objects or lazy.
+		:param clock: Function which returns the current unix time.
+		"""
+		unknown = [method for method in methods if method not in self.methods]
+		if unknown:
+			raise ExchangeException('Methods {} can not be synced.'.format(", ".join(unknown)), 'sync', 400)
+
+		self.client 	= client
+		self.checkpoint = checkpoint if isinstance(checkpoint, Checkpoint) else Checkpoint(checkpoint)
+		self._methods 	= list(methods)
+		self.since 		= since
+		self.pagesize 	= pagesize
+		self.format 	= format
+		self._clock 	= clock
+
+	def run(self, handler):
+		"""
+		Syncs every method, until there are no more changed items, and returns the number of items, which were given
+		to the handler. The handler is called for every page, before the page is saved in the checkpoint, so after
+		a crash the last page can be received again, and the handler must be idempotent.
+
+		:param handler: Function, which receives the name of the method and the list of the changed items.
+		"""
+		# items which change after the start are left for the next run, so the run always ends
+		until = int(self._clock())
+		return sum(self.sync(method, handler, until) for method in self._methods)
+
+	def sync(self, method, handler, until=None):
+		"""
+		Syncs one method and returns the number of received items.
+
+		:param method: questions, answers or comments.
+		:param handler: Function, which receives the name of the method and the list of the changed items.
+		:param until: Unix time, after which changes are not requested. By default it is the current time.
+		"""
+		id_field, date_field, sort = self.methods[method]
+		until = int(self._clock()) if until is None else until
+		site = self.client._site
+
+		state = self.checkpoint.get(site, method) or { 'since': self.since, 'seen': [], 'page': 1 }
+		count = 0
+
+		while True:
+			query = getattr(self.client, method)().sort(sort).order('asc').min(state['since']).max(until)
+			items = query.pagesize(self.pagesize).page(state['page']).get(format=self.format)
+
+			seen = set(state['seen'])
+			changed = [item for item in items
+					if getattr(item, date_field) != state['since'] or getattr(item, id_field) not in seen]
+
+			if changed:
+				handler(method, changed)
+				count += len(changed)
+
+			state = self._advance(state, items, id_field, date_field)
+			self.checkpoint.set(site, method, state)
+
+			if not items.has_more:
+				return count
+
+	def _advance(self, state, items, id_field, date_field):
+		"""
+		Returns the state after the page. The mark moves to the date of the last item, and the ids of all items with
+		that date are kept. Only when the whole page has the date of the mark, the next page of it is requested.
+		"""
+		if not items:
+			return state
+
+		last = getattr(items[-1], date_field)
+		ids = [getattr(item, id_field) for item in items if getattr(item, date_field) == last]
+
+		if last != state['since']:
+			return { 'since': last, 'seen': ids, 'page': 1 }
+
+		return { 'since': last, 'seen': sorted(set(state['seen']) | set(ids)),
+				'page': state['page'] + 1 if len(ids) == len(items) else 1 }
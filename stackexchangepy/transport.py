@@ -0,0 +1,191 @@
+import json
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+	import aiohttp
+except ImportError:
+	aiohttp = None
+
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.ratelimit import default_limiter
+
+
+class Transport(object):
+	"""
+	Pooled HTTP transport, through which the client sends its requests to the API.
+	One keep-alive session is shared by every thread which uses the transport, so the TCP and TLS
+	handshakes are made once per pooled connection, instead of once per request.
+	A transport can be given to more than one client, in which case they share the same pool.
+	"""
+
+	def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, max_retries=0, timeout=(3.05, 30), keep_alive=True,
+				limiter=default_limiter):
+		"""
+		:param pool_connections: Number of hosts for which a connection pool is kept.
+		:param pool_maxsize: Maximum number of connections which are kept alive for a single host.
+		:param pool_block: If it is set to True, a thread waits for a free connection when the pool of the host is full,
+			so at most pool_maxsize connections are opened to a host. Otherwise extra connections are opened and thrown away.
+		:param max_retries: Number of retries for failed connections. It can be also urllib3.Retry object.
+		:param timeout: Timeout in seconds for every request. Can be a single number or a (connect, read) tuple.
+		:param keep_alive: If it is set to False, every connection is closed after the response is read.
+		:param limiter: Rate limiter, from which every request takes a token. By default all transports in the process
+			share one bucket of 30 requests per second. None disables the limit.
+		"""
+		self.pool_connections 	= pool_connections
+		self.pool_maxsize 		= pool_maxsize
+		self.pool_block 		= pool_block
+		self.max_retries 		= max_retries
+		self.timeout 			= timeout
+		self.keep_alive 		= keep_alive
+		self.limiter 			= limiter
+
+		self._session 			= None
+		self._lock 				= threading.Lock()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
+
+	@property
+	def session(self):
+		"""
+		The underlying requests.Session. It is created on first use and is not changed afterwards,
+		which makes it safe to be used from more than one thread.
+		"""
+		if self._session is None:
+			with self._lock:
+				if self._session is None:
+					self._session = self._create_session()
+		return self._session
+
+	def request(self, method, url, params, stream=False):
+		"""
+		Sends a request to the API and returns the requests.Response object.
+
+		:param method: get or post.
+		:param url: The url of the method.
+		:param params: Parameters of the request. For post requests they are send as form data.
+		:param stream: If it is set to True, only the headers are read, and the body is read later with iter_content.
+			The response must be closed, in order its connection to be returned to the pool.
+		"""
+		if self.limiter is not None:
+			self.limiter.acquire()
+
+		if method == "post":
+			return self.session.post(url, data=params, timeout=self.timeout, stream=stream)
+		return self.session.get(url, params=params, timeout=self.timeout, stream=stream)
+
+	def close(self):
+		"""
+		Closes all pooled connections. The transport can be used again after that, with a new pool.
+		"""
+		with self._lock:
+			session, self._session = self._session, None
+		if session is not None:
+			session.close()
+
+	def _create_session(self):
+		session = requests.Session()
+		adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+							max_retries=self.max_retries, pool_block=self.pool_block)
+		session.mount('https://', adapter)
+		session.mount('http://', adapter)
+
+		if not self.keep_alive:
+			session.headers['Connection'] = 'close'
+
+		return session
+
+
+class Response(object):
+	"""
+	Response of the asynchronous transport. It has the part of the requests.Response interface,
+	which is used by the client.
+	"""
+
+	def __init__(self, status_code, content):
+		self.status_code 	= status_code
+		self.content 		= content
+
+	def json(self):
+		return json.loads(self.content.decode('utf-8'))
+
+
+class AsyncTransport(object):
+	"""
+	Non-blocking HTTP transport, used by the asynchronous client. It keeps a pool of keep-alive
+	connections in an aiohttp.ClientSession, which must be used only from the event loop in which it was created.
+	aiohttp must be installed, in order the transport to be used: pip3 install stackexchangepy[async]
+	"""
+
+	def __init__(self, limit=100, limit_per_host=0, timeout=30, keep_alive=True, limiter=default_limiter):
+		"""
+		:param limit: Maximum number of connections which are opened at the same time.
+		:param limit_per_host: Maximum number of connections to a single host. 0 means no limit.
+		:param timeout: Total timeout in seconds for every request.
+		:param keep_alive: If it is set to False, every connection is closed after the response is read.
+		:param limiter: Rate limiter, from which every request takes a token. By default it is the same bucket,
+			which is shared by the synchronous transports. None disables the limit.
+		"""
+		if aiohttp is None:
+			raise ExchangeException('aiohttp must be installed, in order the asynchronous client to be used.', 'transport', 500)
+
+		self.limit 				= limit
+		self.limit_per_host 	= limit_per_host
+		self.timeout 			= timeout
+		self.keep_alive 		= keep_alive
+		self.limiter 			= limiter
+
+		self._session 			= None
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, *exc_info):
+		await self.close()
+
+	@property
+	def session(self):
+		"""
+		The underlying aiohttp.ClientSession. It is created on first use.
+		"""
+		if self._session is None or self._session.closed:
+			connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host, force_close=not self.keep_alive)
+			self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+		return self._session
+
+	async def request(self, method, url, params):
+		"""
+		Sends a request to the API and returns Response object.
+
+		:param method: get or post.
+		:param url: The url of the method.
+		:param params: Parameters of the request. For post requests they are send as form data.
+		"""
+		params = { key: str(value) for key, value in params.items() }
+
+		if self.limiter is not None:
+			await self.limiter.acquire_async()
+
+		if method == "post":
+			context = self.session.post(url, data=params)
+		else:
+			context = self.session.get(url, params=params)
+
+		async with context as response:
+			content = await response.read()
+
+		return Response(response.status, content)
+
+	async def close(self):
+		"""
+		Closes all pooled connections.
+		"""
+		session, self._session = self._session, None
+		if session is not None:
+			await session.close()
@@ -0,0 +1,72 @@
+import unittest
+import asyncio
+import json
+
+from stackexchangepy.client import AsyncExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.transport import Response
+
+
+class FakeAsyncTransport(object):
+
+	def __init__(self, status_code=200, payload=None):
+		self.status_code = status_code
+		self.payload = payload or { 'items': [{ 'question_id': 1 }], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+		self.calls = []
+		self.running = 0
+		self.max_running = 0
+
+	async def request(self, method, url, params):
+		self.calls.append((method, url, params))
+		self.running += 1
+		self.max_running = max(self.max_running, self.running)
+		await asyncio.sleep(0.01)
+		self.running -= 1
+		return Response(self.status_code, json.dumps(self.payload).encode('utf-8'))
+
+	async def close(self):
+		pass
+
+
+class TestAsyncClient(unittest.TestCase):
+
+	def test_get(self):
+		transport = FakeAsyncTransport()
+		client = AsyncExchangeClient(access_token='token', key='key', transport=transport)
+
+		questions = asyncio.run(client.questions(1).get())
+
+		self.assertEqual(1, questions[0].question_id)
+		self.assertEqual([('get', 'https://api.stackexchange.com/2.2/questions/1',
+			{ 'access_token': 'token', 'key': 'key', 'site': 'stackoverflow.com' })], transport.calls)
+
+	def test_network_method_without_site(self):
+		transport = FakeAsyncTransport()
+		client = AsyncExchangeClient(access_token='token', key='key', transport=transport)
+
+		asyncio.run(client.sites().get())
+
+		self.assertFalse('site' in transport.calls[0][2])
+
+	def test_bounded_concurrency(self):
+		transport = FakeAsyncTransport()
+		client = AsyncExchangeClient(access_token='token', key='key', transport=transport, max_concurrency=3)
+
+		async def run():
+			return await asyncio.gather(*[client.questions(i).get() for i in range(10)])
+
+		results = asyncio.run(run())
+
+		self.assertEqual(10, len(results))
+		self.assertEqual(3, transport.max_running)
+		self.assertEqual(['https://api.stackexchange.com/2.2/questions/{}'.format(i) for i in range(10)],
+			[call[1] for call in transport.calls])
+
+	def test_error(self):
+		transport = FakeAsyncTransport(400, { 'error_message': 'bad', 'error_name': 'bad_parameter', 'error_id': 400 })
+		client = AsyncExchangeClient(access_token='token', key='key', transport=transport)
+
+		with self.assertRaises(ExchangeException) as context:
+			asyncio.run(client.questions().get())
+
+		self.assertEqual('bad_parameter', context.exception.name)
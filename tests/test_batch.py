@@ -0,0 +1,96 @@
+import unittest
+import asyncio
+import json
+import threading
+import time
+
+from stackexchangepy.client import ExchangeClient, AsyncExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.transport import Response
+
+
+def respond(url, params):
+	if params.get('sort') == 'fail':
+		payload = { 'error_id': 400, 'error_name': 'bad_parameter', 'error_message': 'sort' }
+		return Response(400, json.dumps(payload).encode('utf-8'))
+
+	payload = { 'items': [{ 'url': url }], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+	return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.running = 0
+		self.max_running = 0
+		self.lock = threading.Lock()
+
+	def request(self, method, url, params):
+		with self.lock:
+			self.running += 1
+			self.max_running = max(self.max_running, self.running)
+		time.sleep(float(params.get('pagesize', 0.02)))
+		with self.lock:
+			self.running -= 1
+		return respond(url, params)
+
+
+class FakeAsyncTransport(object):
+
+	async def request(self, method, url, params):
+		await asyncio.sleep(float(params.get('pagesize', 0.01)))
+		return respond(url, params)
+
+
+class TestBatch(unittest.TestCase):
+
+	def setUp(self):
+		self.transport = FakeTransport()
+		self.client = ExchangeClient(access_token='token', key='key', transport=self.transport)
+
+	def test_results_in_order_of_the_queries(self):
+		queries = [self.client.questions(_id) for _id in range(1, 21)]
+		results = self.client.batch(queries, workers=8)
+
+		self.assertEqual(['https://api.stackexchange.com/2.2/questions/{}'.format(_id) for _id in range(1, 21)],
+						[result[0].url for result in results])
+		self.assertGreater(self.transport.max_running, 1)
+		self.assertLessEqual(self.transport.max_running, 8)
+
+	def test_partial_failure(self):
+		results = self.client.batch([self.client.users(1), self.client.questions().sort('fail'), lambda: 'done'])
+
+		self.assertEqual(1, len(results[0]))
+		self.assertIsInstance(results[1], ExchangeException)
+		self.assertEqual('done', results[2])
+
+	def test_failure_is_raised(self):
+		with self.assertRaises(ExchangeException):
+			self.client.batch([self.client.users(1), self.client.questions().sort('fail')], partial=False)
+
+	def test_timeout(self):
+		results = self.client.batch([self.client.questions().pagesize(0.5), (self.client.users().pagesize(0.5), 2),
+									self.client.tags()], timeout=0.1)
+
+		self.assertIsInstance(results[0], ExchangeException)
+		self.assertEqual('timeout', results[0].name)
+		self.assertEqual(1, len(results[1]))
+		self.assertEqual(1, len(results[2]))
+
+
+class TestAsyncBatch(unittest.TestCase):
+
+	def setUp(self):
+		self.client = AsyncExchangeClient(access_token='token', key='key', transport=FakeAsyncTransport())
+
+	def test_results_and_timeout(self):
+		queries = [self.client.questions(1), self.client.questions().sort('fail'), self.client.users().pagesize(0.5)]
+		results = asyncio.run(self.client.batch(queries, timeout=0.1))
+
+		self.assertEqual('https://api.stackexchange.com/2.2/questions/1', results[0][0].url)
+		self.assertIsInstance(results[1], ExchangeException)
+		self.assertEqual('timeout', results[2].name)
+
+	def test_failure_is_raised(self):
+		with self.assertRaises(ExchangeException):
+			asyncio.run(self.client.batch([self.client.questions(1), self.client.questions().sort('fail')], partial=False))
@@ -0,0 +1,90 @@
+import unittest
+import asyncio
+import json
+import threading
+
+from stackexchangepy.batching import Batcher
+from stackexchangepy.client import ExchangeClient, AsyncExchangeClient
+from stackexchangepy.transport import Response
+
+
+def users_response(url):
+	ids = url.split('/users/')[1].split(';')
+	items = [{ 'user_id': int(_id), 'display_name': 'User {}'.format(_id) } for _id in ids]
+	payload = { 'items': items, 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+	return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.urls = []
+		self.lock = threading.Lock()
+
+	def request(self, method, url, params):
+		with self.lock:
+			self.urls.append(url)
+		return users_response(url)
+
+
+class FakeAsyncTransport(FakeTransport):
+
+	async def request(self, method, url, params):
+		return FakeTransport.request(self, method, url, params)
+
+
+class TestBatching(unittest.TestCase):
+
+	def test_lookups_from_threads_are_batched(self):
+		transport = FakeTransport()
+		batcher = Batcher(window=0.2)
+		results = {}
+
+		def get(_id):
+			client = ExchangeClient(access_token='token', key='key', transport=transport, batcher=batcher)
+			results[_id] = client.users(_id).get()
+
+		threads = [threading.Thread(target=get, args=(_id,)) for _id in range(1, 6)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		self.assertEqual(1, len(transport.urls))
+		self.assertEqual(5, len(transport.urls[0].split('/')[-1].split(';')))
+		self.assertEqual({ _id: [_id] for _id in range(1, 6) },
+			{ _id: [user.user_id for user in users] for _id, users in results.items() })
+
+	def test_batch_is_limited_to_max_size(self):
+		transport = FakeTransport()
+		batcher = Batcher(window=0.2, max_size=2)
+
+		threads = [threading.Thread(target=lambda _id=_id:
+			ExchangeClient(access_token='token', key='key', transport=transport, batcher=batcher).users(_id).get()) for _id in range(1, 5)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		self.assertEqual(2, len(transport.urls))
+
+	def test_only_single_id_lookups_are_batched(self):
+		transport = FakeTransport()
+		client = ExchangeClient(access_token='token', key='key', transport=transport, batcher=Batcher(window=0.2))
+
+		self.assertFalse(client._batchable(client._prepare(client.users(1, 2), 'get')))
+		self.assertFalse(client._batchable(client._prepare(client.users(1).answers(), 'get')))
+		self.assertFalse(client._batchable(client._prepare(client.tags('python'), 'get')))
+		self.assertTrue(client._batchable(client._prepare(client.users(1), 'get')))
+
+	def test_async_lookups_are_batched(self):
+		transport = FakeAsyncTransport()
+		client = AsyncExchangeClient(access_token='token', key='key', transport=transport, batcher=Batcher())
+
+		async def run():
+			return await asyncio.gather(*[client.users(_id).get() for _id in range(1, 11)])
+
+		results = asyncio.run(run())
+
+		self.assertEqual(1, len(transport.urls))
+		self.assertEqual(list(range(1, 11)), [users[0].user_id for users in results])
@@ -0,0 +1,93 @@
+import unittest
+import json
+
+from stackexchangepy.cache import MemoryCache, cache_key
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.transport import Response
+
+
+class FakeClock(object):
+
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self):
+		return self.now
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.calls = []
+
+	def request(self, method, url, params):
+		self.calls.append(url)
+		payload = { 'items': [{ 'total_questions': len(self.calls) }], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class TestMemoryCache(unittest.TestCase):
+
+	def setUp(self):
+		self.clock = FakeClock()
+
+	def test_expiration(self):
+		cache = MemoryCache(ttl=10, clock=self.clock)
+		cache.set('key', b'content', '/questions')
+
+		self.assertEqual(b'content', cache.get('key'))
+		self.clock.now += 11
+		self.assertIsNone(cache.get('key'))
+		self.assertEqual(1, cache.stats()['expirations'])
+
+	def test_ttl_per_method(self):
+		cache = MemoryCache(ttl=10, ttls={ '/info': 300, '/tags': 600, '/tags/{ids}/synonyms': 0 })
+
+		self.assertEqual(300, cache.ttl_for('/info'))
+		self.assertEqual(600, cache.ttl_for('/tags/{ids}/info'))
+		self.assertEqual(0, cache.ttl_for('/tags/{ids}/synonyms'))
+		self.assertEqual(10, cache.ttl_for('/questions'))
+
+	def test_lru_eviction_by_size(self):
+		cache = MemoryCache(max_bytes=10)
+		cache.set('a', b'aaaa', '/questions')
+		cache.set('b', b'bbbb', '/questions')
+		cache.get('a')
+		cache.set('c', b'cccc', '/questions')
+
+		self.assertIsNone(cache.get('b'))
+		self.assertEqual(b'aaaa', cache.get('a'))
+		self.assertEqual(1, cache.stats()['evictions'])
+		self.assertEqual(8, cache.stats()['bytes'])
+
+	def test_compression(self):
+		cache = MemoryCache(compress=True)
+		content = b'{"items": []}' * 100
+		cache.set('key', content, '/questions')
+
+		self.assertEqual(content, cache.get('key'))
+		self.assertTrue(cache.stats()['bytes'] < len(content))
+
+	def test_key_excludes_credentials(self):
+		params = { 'key': 'key', 'access_token': 'token', 'site': 'stackoverflow.com', 'page': 1 }
+
+		self.assertEqual('https://api.stackexchange.com/2.2/questions?page=1&site=stackoverflow.com',
+			cache_key('https://api.stackexchange.com/2.2/questions', params, '/questions'))
+		self.assertTrue('access_token=token' in cache_key('https://api.stackexchange.com/2.2/me', params, '/me'))
+
+
+class TestClientCache(unittest.TestCase):
+
+	def test_get_is_served_from_cache(self):
+		transport = FakeTransport()
+		cache = MemoryCache()
+		client = ExchangeClient(access_token='token', key='key', transport=transport, cache=cache)
+
+		first = client.info().get()
+		second = client.info().get()
+		client.questions().get()
+
+		self.assertEqual(2, len(transport.calls))
+		self.assertEqual(first[0].total_questions, second[0].total_questions)
+		self.assertEqual(1, cache.stats()['hits'])
+		self.assertEqual(2, cache.stats()['misses'])
@@ -0,0 +1,82 @@
+import unittest
+import asyncio
+import json
+import threading
+
+from stackexchangepy.client import ExchangeClient, AsyncExchangeClient
+from stackexchangepy.transport import Response
+
+
+def ids_response(url):
+	ids = url.split('/questions/')[1].split('/')[0].split(';')
+	# the API orders the items by their activity, not by the requested ids
+	items = [{ 'question_id': int(_id) } for _id in reversed(ids)]
+	payload = { 'items': items, 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+	return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.urls = []
+		self.lock = threading.Lock()
+
+	def request(self, method, url, params):
+		with self.lock:
+			self.urls.append(url)
+		return ids_response(url)
+
+
+class FakeAsyncTransport(FakeTransport):
+
+	async def request(self, method, url, params):
+		return FakeTransport.request(self, method, url, params)
+
+
+class TestChunking(unittest.TestCase):
+
+	def test_small_list_is_not_split(self):
+		transport = FakeTransport()
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		client.questions(*range(100)).get()
+
+		self.assertEqual(1, len(transport.urls))
+
+	def test_get_is_split_in_chunks(self):
+		transport = FakeTransport()
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+		ids = list(range(1000, 1250))
+
+		questions = client.questions(*ids).get()
+
+		self.assertEqual(3, len(transport.urls))
+		self.assertTrue(all(len(url.split('/')[-1].split(';')) <= 100 for url in transport.urls))
+		self.assertEqual(ids, [question.question_id for question in questions])
+
+	def test_iter_is_split_in_chunks(self):
+		transport = FakeTransport()
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		questions = list(client.questions(*range(1, 202)).iter())
+
+		self.assertEqual(201, len(questions))
+		self.assertEqual(3, len(transport.urls))
+
+	def test_post_is_not_split(self):
+		transport = FakeTransport()
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		client.questions(*range(1, 202)).upvote()
+
+		self.assertEqual(['https://api.stackexchange.com/2.2/questions/{}/upvote'.format(";".join(map(str, range(1, 202))))], transport.urls)
+
+	def test_async_get_is_split_in_chunks(self):
+		transport = FakeAsyncTransport()
+		client = AsyncExchangeClient(access_token='token', key='key', transport=transport)
+		ids = list(range(1000, 1250))
+
+		questions = asyncio.run(client.questions(*ids).get())
+
+		self.assertEqual(3, len(transport.urls))
+		self.assertEqual(ids, [question.question_id for question in questions])
@@ -0,0 +1,90 @@
+import unittest
+import importlib.util
+import json
+import math
+import subprocess
+import sys
+from array import array
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.columns import build_columns, to_numpy
+from stackexchangepy.transport import Response
+
+
+ITEMS = [
+	{ 'question_id': 1, 'score': 5, 'creation_date': 1217540572, 'title': 'a', 'tags': ['python'], 'is_answered': True,
+		'owner': { 'user_id': 10, 'reputation': 1.5 } },
+	{ 'question_id': 2, 'score': -1, 'creation_date': 1217540573, 'title': 'b', 'tags': ['json', 'c'], 'is_answered': False,
+		'owner': { 'user_id': 11, 'reputation': 2 }, 'accepted_answer_id': 7 }
+]
+
+
+class FakeTransport(object):
+
+	def __init__(self, pages=1):
+		self.pages = pages
+
+	def request(self, method, url, params):
+		page = int(params.get('page', 1))
+		payload = { 'items': ITEMS, 'has_more': page < self.pages, 'quota_remaining': 9, 'quota_max': 10 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class TestColumns(unittest.TestCase):
+
+	def test_types_of_the_columns(self):
+		result = build_columns(ITEMS)
+
+		self.assertEqual(array('q', [1, 2]), result['question_id'])
+		self.assertEqual(array('q', [1217540572, 1217540573]), result['creation_date'])
+		self.assertEqual(array('d', [1.5, 2.0]), result['owner.reputation'])
+		self.assertEqual(['a', 'b'], result['title'])
+		self.assertEqual([True, False], result['is_answered'])
+		self.assertEqual([['python'], ['json', 'c']], result['tags'])
+
+	def test_missing_integers_are_nan(self):
+		result = build_columns(ITEMS)
+
+		self.assertEqual('d', result['accepted_answer_id'].typecode)
+		self.assertTrue(math.isnan(result['accepted_answer_id'][0]))
+		self.assertEqual(7, result['accepted_answer_id'][1])
+
+	def test_projection(self):
+		result = build_columns(ITEMS, ['owner.user_id', 'score'])
+		self.assertEqual({ 'owner.user_id': array('q', [10, 11]), 'score': array('q', [5, -1]) }, result)
+
+	@unittest.skipIf(importlib.util.find_spec('numpy') is None, 'numpy is not installed')
+	def test_numpy(self):
+		result = to_numpy(build_columns(ITEMS))
+
+		self.assertEqual([1, 2], result['question_id'].tolist())
+		self.assertEqual('datetime64[s]', str(result['creation_date'].dtype))
+		self.assertTrue(math.isnan(result['accepted_answer_id'][0]))
+		self.assertEqual([True, False], result['is_answered'].tolist())
+		self.assertEqual(['json', 'c'], result['tags'][1])
+
+
+class TestColumnsFormat(unittest.TestCase):
+
+	def test_get(self):
+		client = ExchangeClient(access_token='token', key='key', transport=FakeTransport())
+		result = client.questions().get(format='columns', fields=['question_id', 'title'])
+
+		self.assertEqual({ 'question_id': array('q', [1, 2]), 'title': ['a', 'b'] }, result)
+
+	def test_iter_returns_block_for_every_page(self):
+		client = ExchangeClient(access_token='token', key='key', transport=FakeTransport(pages=3))
+		blocks = list(client.questions().iter(pagesize=2, format='columns', fields=['question_id']))
+
+		self.assertEqual(3, len(blocks))
+		self.assertEqual(array('q', [1, 2]), blocks[2]['question_id'])
+
+	def test_iter_with_max_items(self):
+		client = ExchangeClient(access_token='token', key='key', transport=FakeTransport(pages=3))
+		blocks = list(client.questions().iter(pagesize=2, max_items=3, format='columns', fields=['question_id']))
+
+		self.assertEqual([array('q', [1, 2]), array('q', [1])], [block['question_id'] for block in blocks])
+
+	def test_numpy_is_imported_on_first_use(self):
+		code = "import sys, stackexchangepy.columns; print('numpy' in sys.modules)"
+		self.assertEqual("False", subprocess.check_output([sys.executable, '-c', code]).decode().strip())
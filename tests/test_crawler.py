@@ -0,0 +1,122 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.crawler import Crawler
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.transport import Response
+
+
+class FakeSite(object):
+	"""
+	Questions filtered by creation date with fromdate and todate, as the API does.
+	"""
+
+	def __init__(self, dates):
+		self.questions = { _id: date for _id, date in enumerate(dates, 1) }
+		self.totals = 0
+		self.fail = set()
+		self.lock = threading.Lock()
+
+	def request(self, method, url, params):
+		fromdate, todate = int(params['fromdate']), int(params['todate'])
+		items = sorted((date, _id) for _id, date in self.questions.items() if fromdate <= date <= todate)
+
+		if params.get('filter') == 'total':
+			with self.lock:
+				self.totals += 1
+			return self.response({ 'total': len(items) })
+
+		if fromdate in self.fail:
+			return Response(500, json.dumps({ 'error_id': 500, 'error_name': 'internal_error',
+											'error_message': 'Failed.' }).encode('utf-8'))
+
+		pagesize, page = int(params['pagesize']), int(params['page'])
+		chunk = items[(page - 1) * pagesize:page * pagesize]
+		return self.response({ 'items': [{ 'question_id': _id, 'creation_date': date } for date, _id in chunk],
+							'has_more': page * pagesize < len(items) })
+
+	def response(self, payload):
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class TestCrawler(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		self.path = os.path.join(self.directory.name, 'questions-{fromdate}-{todate}.jsonl')
+		self.manifest = os.path.join(self.directory.name, 'manifest.json')
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def crawler(self, site, todate=100):
+		client = ExchangeClient(access_token='token', key='key', transport=site)
+		return Crawler(client.questions(), 0, todate, self.path, self.manifest, max_shard_items=3,
+					workers=3, pagesize=2)
+
+	def read(self, crawler):
+		ids = []
+		for shard in crawler.shards:
+			with open(shard['path']) as f:
+				ids.extend(json.loads(line)['question_id'] for line in f)
+		return ids
+
+	def test_shards_adapt_to_the_totals(self):
+		# most questions are in the last tenth of the range
+		site = FakeSite([5, 50, 90, 91, 92, 93, 94, 95, 96, 97])
+		crawler = self.crawler(site)
+
+		self.assertEqual(10, crawler.run())
+		self.assertTrue(all(shard['total'] <= 3 for shard in crawler.shards))
+		self.assertEqual(list(range(1, 11)), sorted(self.read(crawler)))
+
+		# shards are disjoint and cover the range
+		self.assertEqual([0, 100], [crawler.shards[0]['fromdate'], max(shard['todate'] for shard in crawler.shards)])
+		for first, second in zip(crawler.shards, crawler.shards[1:]):
+			self.assertLessEqual(first['todate'], second['fromdate'])
+
+	def test_window_of_one_second_is_not_split(self):
+		site = FakeSite([7, 7, 7, 7, 7])
+		crawler = self.crawler(site)
+
+		self.assertEqual(5, crawler.run())
+		self.assertEqual([(7, 8, 5)], [(shard['fromdate'], shard['todate'], shard['total']) for shard in crawler.shards])
+
+	def test_failed_shards_are_crawled_again(self):
+		site = FakeSite([10, 20, 30, 40, 50, 60, 70, 80])
+		crawler = self.crawler(site)
+		# the range is split in [0, 33), [33, 66) and [66, 100)
+		site.fail = {33}
+
+		with self.assertRaises(ExchangeException):
+			crawler.run()
+
+		failed = crawler.failed()
+		self.assertEqual([33], [shard['fromdate'] for shard in failed])
+		self.assertFalse(os.path.exists(failed[0]['path']))
+		self.assertEqual(3, len(os.listdir(self.directory.name)))
+		self.assertEqual(['failed'], [shard['status'] for shard in json.load(open(self.manifest))['shards']
+									if shard['fromdate'] == 33])
+
+		# the plan and the finished shards are taken from the manifest
+		site.fail, totals = set(), site.totals
+		crawler = self.crawler(site)
+		self.assertEqual(3, crawler.run())
+		self.assertEqual(totals, site.totals)
+		self.assertEqual(list(range(1, 9)), sorted(self.read(crawler)))
+
+	def test_manifest_of_another_crawl(self):
+		site = FakeSite([10, 20])
+		self.crawler(site).run()
+
+		with self.assertRaises(ExchangeException):
+			self.crawler(site, todate=200)
+
+	def test_path_without_dates(self):
+		client = ExchangeClient(access_token='token', key='key', transport=FakeSite([]))
+		with self.assertRaises(ExchangeException):
+			Crawler(client.questions(), 0, 100, 'questions.jsonl', self.manifest)
@@ -16,4 +16,52 @@ class TestCreateClass(unittest.TestCase):
 			}
 		})
 
-		self.assertTrue(hasattr(newclass.subFields, 'subSubField'))
\ No newline at end of file
+		self.assertTrue(hasattr(newclass.subFields, 'subSubField'))
+
+	def test_record_types_are_reused(self):
+		first = create_class('questions', { 'question_id': 1, 'owner': { 'user_id': 2 } })
+		second = create_class('questions', { 'question_id': 3, 'owner': { 'user_id': 4 } })
+
+		self.assertIs(type(first), type(second))
+		self.assertIs(type(first.owner), type(second.owner))
+		self.assertEqual(1, first.question_id)
+		self.assertEqual(4, second.owner.user_id)
+
+	def test_records_have_slots(self):
+		question = create_class('questions', { 'question_id': 1 })
+
+		self.assertFalse(hasattr(question, '__dict__'))
+		self.assertFalse(hasattr(question, 'title'))
+		self.assertEqual({ 'question_id': 1 }, question._asdict())
+
+	def test_items_with_other_fields(self):
+		first = create_class('questions', { 'question_id': 1 })
+		second = create_class('questions', { 'question_id': 2, 'accepted_answer_id': 3 })
+
+		self.assertIs(type(first), type(second))
+		self.assertEqual(3, second.accepted_answer_id)
+		self.assertFalse(hasattr(first, 'accepted_answer_id'))
+		self.assertEqual({ 'question_id': 1 }, first._asdict())
+
+	def test_one_type_for_items_with_optional_fields(self):
+		optional = ['accepted_answer_id', 'bounty_amount', 'bounty_closes_date', 'closed_date', 'closed_reason',
+					'community_owned_date', 'locked_date', 'migrated_from', 'protected_date', 'last_edit_date']
+		types = set()
+		for mask in range(2 ** len(optional)):
+			item = dict({ 'question_id': mask }, **{ field: 1 for bit, field in enumerate(optional) if mask & 1 << bit })
+			types.add(type(create_class('questions', item)))
+
+		self.assertEqual(1, len(types))
+
+	def test_unknown_fields_extend_the_type(self):
+		first = create_class('answers', { 'answer_id': 1 })
+		second = create_class('answers', { 'answer_id': 2, 'new_field': 3 })
+		third = create_class('answers', { 'answer_id': 4 })
+
+		self.assertEqual(3, second.new_field)
+		self.assertIs(type(second), type(third))
+		self.assertIn('answer_id', type(first)._fields)
+
+	def test_fields_which_are_not_identifiers(self):
+		item = create_class('sites', { 'site-url': 'https://stackoverflow.com' })
+		self.assertEqual('https://stackoverflow.com', getattr(item, 'site-url'))
@@ -0,0 +1,81 @@
+import unittest
+import datetime as dt
+import json
+import threading
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.credentials import Credential, CredentialPool
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.transport import Response
+
+
+class FakeClock(object):
+
+	def __init__(self):
+		self.now = dt.datetime(2018, 5, 20, 12, 0, tzinfo=dt.timezone.utc).timestamp()
+
+	def __call__(self):
+		return self.now
+
+
+class FakeTransport(object):
+
+	def __init__(self, quota_remaining):
+		self.quota_remaining = quota_remaining
+		self.calls = []
+
+	def request(self, method, url, params):
+		self.calls.append(params)
+		payload = { 'items': [], 'has_more': False, 'quota_remaining': self.quota_remaining[params['key']], 'quota_max': 10 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class TestCredentialPool(unittest.TestCase):
+
+	def setUp(self):
+		self.clock = FakeClock()
+		self.pool = CredentialPool([('key1', 'token1'), Credential('key2', quota_max=5)], clock=self.clock)
+
+	def test_most_remaining_quota(self):
+		self.pool.update(self.pool.credentials[0], 3, 10)
+
+		self.assertEqual('key2', self.pool.acquire().key)
+		self.assertEqual('key2', self.pool.acquire().key)
+		self.assertEqual('key1', self.pool.acquire().key)
+		self.assertEqual('key2', self.pool.acquire().key)
+
+	def test_exhausted_credentials_are_parked_until_reset(self):
+		self.pool.update(self.pool.credentials[0], 0, 10)
+		self.pool.update(self.pool.credentials[1], 0, 5)
+
+		with self.assertRaises(ExchangeException):
+			self.pool.acquire()
+
+		self.clock.now += 12 * 60 * 60
+		self.assertEqual('key1', self.pool.acquire().key)
+
+	def test_concurrent_acquire(self):
+		pool = CredentialPool([Credential('key1', quota_max=500), Credential('key2', quota_max=500)], clock=self.clock)
+		threads = [threading.Thread(target=lambda: [pool.acquire() for _ in range(100)]) for _ in range(8)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		self.assertEqual(200, pool.remaining())
+		self.assertEqual([100, 100], [credential.quota_remaining for credential in pool.credentials])
+
+
+class TestClientCredentials(unittest.TestCase):
+
+	def test_requests_rotate_credentials(self):
+		transport = FakeTransport({ 'key1': 1, 'key2': 8 })
+		pool = CredentialPool([('key1', 'token1'), ('key2', 'token2')])
+		client = ExchangeClient(transport=transport, credentials=pool)
+
+		for _ in range(3):
+			client.questions().get()
+
+		self.assertEqual(['key1', 'key2', 'key2'], [params['key'] for params in transport.calls])
+		self.assertEqual('token1', transport.calls[0]['access_token'])
+		self.assertEqual(8, pool.credentials[1].quota_remaining)
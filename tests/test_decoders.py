@@ -0,0 +1,50 @@
+import unittest
+import json
+
+from stackexchangepy import decoders
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.decoders import get_decoder
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.transport import Response
+
+
+PAYLOAD = { 'items': [{ 'question_id': 1, 'title': 'Grüße' }], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+
+
+class FakeTransport(object):
+
+	def request(self, method, url, params):
+		return Response(200, json.dumps(PAYLOAD).encode('utf-8'))
+
+
+class TestDecoders(unittest.TestCase):
+
+	def test_every_available_decoder(self):
+		content = json.dumps(PAYLOAD).encode('utf-8')
+
+		for name in decoders.available():
+			self.assertEqual(PAYLOAD, get_decoder(name)(content))
+
+	def test_default_is_the_fastest_available(self):
+		self.assertIs(dict(decoders.decoders)[decoders.available()[0]], get_decoder())
+
+	def test_stdlib_is_always_available(self):
+		self.assertIn('json', decoders.available())
+
+	def test_unknown_decoder(self):
+		with self.assertRaises(ExchangeException):
+			get_decoder('yaml')
+
+	def test_client_uses_given_decoder(self):
+		decoded = []
+
+		def loads(content):
+			decoded.append(content)
+			return json.loads(content.decode('utf-8'))
+
+		client = ExchangeClient(access_token='token', key='key', transport=FakeTransport(), decoder=loads)
+		questions = client.questions(1).get()
+
+		self.assertEqual('Grüße', questions[0].title)
+		self.assertEqual(1, len(decoded))
+		self.assertEqual(9, client.quota_remaining)
@@ -0,0 +1,149 @@
+import unittest
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from stackexchangepy import export
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.transport import Response
+
+if importlib.util.find_spec('pyarrow') is not None:
+	import pyarrow
+	import pyarrow.parquet
+
+
+def question(_id):
+	return { 'question_id': _id, 'title': 'title {}'.format(_id), 'tags': ['python'], 'is_answered': _id % 2 == 0,
+			'creation_date': 1217540572 + _id, 'owner': { 'user_id': _id * 10, 'display_name': 'user' },
+			'migrated_to': { 'other_site': None, 'question_id': 5 }, 'closed_reason': None }
+
+
+class FakeTransport(object):
+
+	def __init__(self, pages, pagesize):
+		self.pages = pages
+		self.pagesize = pagesize
+
+	def request(self, method, url, params):
+		page = int(params.get('page', 1))
+		first = (page - 1) * self.pagesize
+		payload = { 'items': [question(_id) for _id in range(first, first + self.pagesize)], 'has_more': page < self.pages,
+					'quota_remaining': 9, 'quota_max': 10 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class PagesTransport(object):
+
+	def __init__(self, pages):
+		self.pages = pages
+
+	def request(self, method, url, params):
+		page = int(params.get('page', 1))
+		payload = { 'items': self.pages[page - 1], 'has_more': page < len(self.pages) }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+@unittest.skipIf(importlib.util.find_spec('pyarrow') is None, 'pyarrow is not installed')
+class TestExport(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def test_schema_from_filter(self):
+		schema = export.schema('questions')
+
+		self.assertEqual(pyarrow.int64(), schema.field('question_id').type)
+		self.assertEqual(pyarrow.timestamp('s', tz='UTC'), schema.field('creation_date').type)
+		self.assertEqual(pyarrow.bool_(), schema.field('is_answered').type)
+		self.assertEqual(pyarrow.list_(pyarrow.string()), schema.field('tags').type)
+		self.assertEqual(pyarrow.int64(), schema.field('owner').type.field('user_id').type)
+
+	def test_unknown_type_without_fields(self):
+		with self.assertRaises(ExchangeException):
+			export.schema('unknowns')
+
+	def test_record_batch(self):
+		batch = export.record_batch([question(1), { 'question_id': 2 }], export.schema('questions', ['question_id', 'title', 'body']))
+
+		self.assertEqual({ 'question_id': [1, 2], 'title': ['title 1', None], 'body': [None, None] }, batch.to_pydict())
+
+	def test_iter_returns_batch_for_every_page(self):
+		client = ExchangeClient(access_token='token', key='key', transport=FakeTransport(pages=3, pagesize=10))
+		batches = list(client.questions().iter(pagesize=10, format='arrow'))
+
+		self.assertEqual([10, 10, 10], [batch.num_rows for batch in batches])
+		self.assertEqual(50, batches[0].column('owner').to_pylist()[5]['user_id'])
+
+	def test_fields_which_are_not_in_filter_are_kept(self):
+		items = [dict(question(1), body='<p>body</p>', comments=[{ 'comment_id': 7 }]),
+				dict(question(2), owner={ 'user_id': 20, 'unknown': 'value' })]
+		batch = export.record_batch(items, export.schema('questions'))
+
+		self.assertEqual([{ 'body': '<p>body</p>', 'comments': [{ 'comment_id': 7 }] }, { 'owner': { 'unknown': 'value' } }],
+						[json.loads(extra) for extra in batch.column('extra').to_pylist()])
+		self.assertEqual(20, batch.column('owner').to_pylist()[1]['user_id'])
+
+	def test_schema_is_the_same_for_every_page(self):
+		pages = [[{ 'question_id': 1, 'owner': { 'user_id': 1 } }],
+				[{ 'question_id': 2, 'owner': { 'user_id': 2, 'weird': 'x' }, 'closed_reason': 'duplicate',
+				'body': 'body' }]]
+		client = ExchangeClient(access_token='token', key='key', transport=PagesTransport(pages))
+		path = os.path.join(self.directory.name, 'questions.parquet')
+
+		with export.ParquetSink(path) as sink:
+			self.assertEqual(2, sink.write_all(client.questions().filter('withbody').iter(pagesize=1, format='arrow')))
+
+		table = pyarrow.parquet.read_table(path).to_pydict()
+		self.assertEqual([None, { 'owner': { 'weird': 'x' }, 'body': 'body' }],
+						[extra and json.loads(extra) for extra in table['extra']])
+		self.assertEqual([None, 'duplicate'], table['closed_reason'])
+
+	def test_sink_rejects_other_types(self):
+		schema = export.schema('questions', ['question_id', 'owner'])
+		wider = pyarrow.schema([('question_id', pyarrow.int64()),
+								('owner', pyarrow.struct(list(schema.field('owner').type) + [('weird', pyarrow.string())]))])
+
+		with export.ParquetSink(os.path.join(self.directory.name, 'questions.parquet'), schema=schema) as sink:
+			with self.assertRaises(ExchangeException):
+				sink.write(export.record_batch([{ 'question_id': 1, 'owner': { 'weird': 'x' } }], wider))
+
+	def test_sink_fills_missing_columns_and_rejects_new_ones(self):
+		path = os.path.join(self.directory.name, 'questions.parquet')
+		schema = export.schema('questions', ['question_id', 'title'])
+
+		with export.ParquetSink(path, schema=schema) as sink:
+			sink.write(export.record_batch([{ 'question_id': 1 }], export.schema('questions', ['question_id'])))
+			with self.assertRaises(ExchangeException):
+				sink.write(export.record_batch([{ 'body': 'x' }], export.schema('questions', ['body'])))
+
+		self.assertEqual({ 'question_id': [1], 'title': [None] }, pyarrow.parquet.read_table(path).to_pydict())
+
+	def test_pyarrow_is_not_imported_with_the_client(self):
+		code = "import sys, stackexchangepy.client; print('pyarrow' in sys.modules or 'numpy' in sys.modules)"
+		self.assertEqual("False", subprocess.check_output([sys.executable, '-c', code]).decode().strip())
+
+	def test_parquet_row_groups_and_files(self):
+		client = ExchangeClient(access_token='token', key='key', transport=FakeTransport(pages=10, pagesize=10))
+		path = os.path.join(self.directory.name, 'questions-{part}.parquet')
+
+		with export.ParquetSink(path, row_group_size=25, max_file_rows=60) as sink:
+			rows = sink.write_all(client.questions().iter(pagesize=10, format='arrow'))
+
+		self.assertEqual(100, rows)
+		self.assertEqual(2, len(sink.files))
+
+		first, second = [pyarrow.parquet.ParquetFile(path) for path in sink.files]
+		self.assertEqual([25, 25, 10], [first.metadata.row_group(i).num_rows for i in range(first.num_row_groups)])
+		self.assertEqual([25, 15], [second.metadata.row_group(i).num_rows for i in range(second.num_row_groups)])
+		self.assertEqual(list(range(60, 100)), second.read(columns=['question_id']).column(0).to_pylist())
+
+	def test_path_without_part(self):
+		with self.assertRaises(ExchangeException):
+			export.ParquetSink(os.path.join(self.directory.name, 'questions.parquet'), max_file_rows=10)
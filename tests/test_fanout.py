@@ -0,0 +1,99 @@
+import unittest
+import asyncio
+import json
+import threading
+from collections import Counter
+
+from stackexchangepy.client import ExchangeClient, AsyncExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.transport import Response
+
+
+# scores of the questions of every site, sorted by votes
+SCORES = {
+	'stackoverflow.com': [90, 70, 50, 30, 10],
+	'superuser.com': [80, 60, 40],
+	'serverfault.com': [100, 5]
+}
+
+
+def respond(params):
+	scores = SCORES[params['site']]
+	pagesize, page = int(params.get('pagesize', 100)), int(params.get('page', 1))
+	chunk = scores[(page - 1) * pagesize:page * pagesize]
+	payload = { 'items': [{ 'question_id': score, 'score': score } for score in chunk],
+				'has_more': page * pagesize < len(scores) }
+	return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.requests = Counter()
+		self.lock = threading.Lock()
+
+	def request(self, method, url, params):
+		with self.lock:
+			self.requests[params['site'], int(params.get('page', 1))] += 1
+		return respond(params)
+
+
+class FakeAsyncTransport(object):
+
+	async def request(self, method, url, params):
+		return respond(params)
+
+
+class TestFanout(unittest.TestCase):
+
+	def setUp(self):
+		self.transport = FakeTransport()
+		self.client = ExchangeClient(access_token='token', key='key', transport=self.transport)
+		self.query = self.client.questions().sort('votes').order('desc')
+
+	def test_items_are_tagged_with_their_site(self):
+		items = self.client.fanout(self.query, ['superuser.com', 'serverfault.com'])
+
+		self.assertEqual([('superuser.com', 80), ('superuser.com', 60), ('superuser.com', 40),
+						('serverfault.com', 100), ('serverfault.com', 5)],
+						[(site_item.site, site_item.item.score) for site_item in items])
+
+	def test_merge_by_key(self):
+		items = self.client.fanout(self.query, list(SCORES), key='score')
+		self.assertEqual([100, 90, 80, 70, 60, 50, 40, 30, 10, 5], [site_item.item.score for site_item in items])
+
+		items = self.client.fanout(self.query, list(SCORES), key=lambda item: -item.score, order='asc', format='lazy')
+		self.assertEqual(['serverfault.com', 'stackoverflow.com'], [site_item.site for site_item in items[:2]])
+
+	def test_top_n_requests_only_the_needed_pages(self):
+		items = self.client.fanout(self.query, list(SCORES), key='score', limit=2)
+
+		self.assertEqual([('serverfault.com', 100), ('stackoverflow.com', 90)],
+						[(site_item.site, site_item.item.score) for site_item in items])
+		self.assertEqual({ (site, 1): 1 for site in SCORES }, dict(self.transport.requests))
+
+	def test_next_page_is_requested_when_the_merge_needs_it(self):
+		items = self.client.fanout(self.query, list(SCORES), key='score', limit=4)
+
+		self.assertEqual([100, 90, 80, 70], [site_item.item.score for site_item in items])
+		self.assertNotIn(('serverfault.com', 2), self.transport.requests)
+		self.assertEqual(1, self.transport.requests['stackoverflow.com', 1])
+
+	def test_site_of_the_client_is_not_changed(self):
+		self.client.fanout(self.query, ['superuser.com'])
+		self.assertEqual('stackoverflow.com', self.client._site)
+		self.assertEqual(5, len(self.client.questions().get()))
+
+	def test_column_formats_are_not_allowed(self):
+		with self.assertRaises(ExchangeException):
+			self.client.fanout(self.query, list(SCORES), format='columns')
+
+
+class TestAsyncFanout(unittest.TestCase):
+
+	def test_merge_by_key(self):
+		client = AsyncExchangeClient(access_token='token', key='key', transport=FakeAsyncTransport())
+		items = asyncio.run(client.fanout(client.questions().sort('votes'), list(SCORES), key='score', limit=3))
+
+		self.assertEqual([('serverfault.com', 100), ('stackoverflow.com', 90), ('superuser.com', 80)],
+						[(site_item.site, site_item.item.score) for site_item in items])
@@ -12,4 +12,4 @@ class TestFilter(unittest.TestCase):
 				filters(include=['page'], exclude=['pagesize']). \
 				create()
 
-		self.assertTrue('filter' in f[0].__dict__)
\ No newline at end of file
+		self.assertTrue(hasattr(f[0], 'filter'))
\ No newline at end of file
@@ -0,0 +1,66 @@
+import unittest
+import datetime as dt
+import json
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.model import LazyRecord
+from stackexchangepy.transport import Response
+
+
+ITEM = { 'question_id': 1, 'creation_date': 1217540572, 'owner': { 'user_id': 2, 'display_name': 'Jeff' } }
+
+
+class FakeTransport(object):
+
+	def request(self, method, url, params):
+		payload = { 'items': [ITEM, dict(ITEM, question_id=3)], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class TestLazyRecord(unittest.TestCase):
+
+	def test_fields_are_read_from_the_item(self):
+		question = LazyRecord('questions', ITEM)
+
+		self.assertEqual(1, question.question_id)
+		self.assertEqual('Jeff', question.owner.display_name)
+		self.assertFalse(hasattr(question, 'title'))
+		self.assertIs(ITEM, question._asdict())
+
+	def test_nothing_is_allocated_until_a_nested_object_is_read(self):
+		question = LazyRecord('questions', ITEM)
+		question.question_id
+		self.assertIsNone(question._memo)
+
+		self.assertIs(question.owner, question.owner)
+		self.assertEqual(['owner'], list(question._memo))
+
+	def test_dates_are_converted_once(self):
+		question = LazyRecord('questions', ITEM)
+		date = question.date('creation_date')
+
+		self.assertEqual(dt.datetime(2008, 7, 31, 21, 42, 52, tzinfo=dt.timezone.utc), date)
+		self.assertIs(date, question.date('creation_date'))
+
+
+class TestLazyFormat(unittest.TestCase):
+
+	def setUp(self):
+		self.client = ExchangeClient(access_token='token', key='key', transport=FakeTransport())
+
+	def test_get(self):
+		questions = self.client.questions().get(format='lazy')
+
+		self.assertIsInstance(questions[0], LazyRecord)
+		self.assertEqual([1, 3], [question.question_id for question in questions])
+
+	def test_iter(self):
+		questions = list(self.client.questions().iter(format='lazy'))
+		self.assertEqual(2, questions[1].owner.user_id)
+
+	def test_unknown_format(self):
+		with self.assertRaises(ExchangeException):
+			self.client.questions().get(format='xml')
+
+		self.assertEqual(2, len(self.client.questions().get()))
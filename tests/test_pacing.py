@@ -0,0 +1,93 @@
+import unittest
+import asyncio
+import json
+
+from stackexchangepy.client import ExchangeClient, AsyncExchangeClient
+from stackexchangepy.pacing import BackoffScheduler
+from stackexchangepy.transport import Response
+
+
+class FakeClock(object):
+
+	def __init__(self):
+		self.now = 100.0
+
+	def __call__(self):
+		return self.now
+
+
+class FakeTransport(object):
+
+	def __init__(self, backoff=None):
+		self.backoff = backoff
+
+	def request(self, method, url, params):
+		payload = { 'items': [], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+		if self.backoff:
+			payload['backoff'] = self.backoff
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class FakeAsyncTransport(FakeTransport):
+
+	async def request(self, method, url, params):
+		return FakeTransport.request(self, method, url, params)
+
+
+class TestBackoffScheduler(unittest.TestCase):
+
+	def setUp(self):
+		self.clock = FakeClock()
+		self.scheduler = BackoffScheduler(clock=self.clock)
+
+	def test_delay(self):
+		self.scheduler.record('/questions', 10)
+		self.clock.now += 4
+
+		self.assertEqual(6, self.scheduler.delay('/questions'))
+		self.assertEqual(0, self.scheduler.delay('/answers'))
+
+	def test_delay_expires(self):
+		self.scheduler.record('/questions', 10)
+		self.clock.now += 11
+
+		self.assertEqual(0, self.scheduler.delay('/questions'))
+
+	def test_longer_backoff_wins(self):
+		self.scheduler.record('/questions', 10)
+		self.scheduler.record('/questions', 2)
+
+		self.assertEqual(10, self.scheduler.delay('/questions'))
+
+
+class TestClientBackoff(unittest.TestCase):
+
+	def test_backoff_is_recorded_per_method(self):
+		scheduler = BackoffScheduler()
+		client = ExchangeClient(access_token='token', key='key', transport=FakeTransport(backoff=5), scheduler=scheduler)
+
+		client.questions(1, 2).answers().get()
+
+		self.assertEqual(5, client.backoff)
+		self.assertTrue(scheduler.delay('/questions/{ids}/answers') > 4)
+		self.assertEqual(0, scheduler.delay('/questions/{ids}'))
+
+	def test_async_waits_only_for_the_same_method(self):
+		scheduler = BackoffScheduler()
+		scheduler.record('/questions', 0.2)
+		client = AsyncExchangeClient(access_token='token', key='key', transport=FakeAsyncTransport(), scheduler=scheduler)
+		finished = []
+
+		async def wait(name, request):
+			await request
+			finished.append(name)
+
+		async def run():
+			questions = wait('questions', client.questions().get())
+			answers = wait('answers', client.answers().get())
+			await asyncio.gather(questions, answers)
+
+		asyncio.run(run())
+
+		self.assertEqual(['answers', 'questions'], finished)
+		self.assertEqual(0, scheduler.delay('/questions'))
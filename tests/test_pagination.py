@@ -0,0 +1,125 @@
+import unittest
+import asyncio
+import json
+
+from stackexchangepy.client import ExchangeClient, AsyncExchangeClient
+from stackexchangepy.transport import Response
+
+
+def page_response(params, total):
+	page, pagesize = int(params['page']), int(params['pagesize'])
+	ids = range((page - 1) * pagesize, min(page * pagesize, total))
+	payload = { 'items': [{ 'question_id': _id } for _id in ids], 'has_more': page * pagesize < total,
+				'quota_remaining': 9, 'quota_max': 10 }
+	return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class FakeTransport(object):
+
+	def __init__(self, total):
+		self.total = total
+		self.calls = []
+
+	def request(self, method, url, params):
+		self.calls.append(params)
+		return page_response(params, self.total)
+
+
+class FakeAsyncTransport(FakeTransport):
+
+	async def request(self, method, url, params):
+		self.calls.append(params)
+		return page_response(params, self.total)
+
+
+class FakeTotalTransport(FakeTransport):
+
+	def request(self, method, url, params):
+		self.calls.append(params)
+		if params.get('filter') == 'total':
+			return Response(200, json.dumps({ 'total': self.total }).encode('utf-8'))
+		return page_response(params, self.total)
+
+
+class FakeAsyncTotalTransport(FakeTotalTransport):
+
+	async def request(self, method, url, params):
+		return FakeTotalTransport.request(self, method, url, params)
+
+
+class TestPagination(unittest.TestCase):
+
+	def test_iter_all_pages(self):
+		transport = FakeTransport(250)
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		ids = [question.question_id for question in client.questions().iter()]
+
+		self.assertEqual(list(range(250)), ids)
+		self.assertEqual([1, 2, 3], [params['page'] for params in transport.calls])
+		self.assertTrue(all(params['pagesize'] == 100 for params in transport.calls))
+
+	def test_iter_is_lazy(self):
+		transport = FakeTransport(250)
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		questions = client.questions().iter(pagesize=10)
+		self.assertEqual(0, len(transport.calls))
+
+		next(questions)
+		self.assertEqual(1, len(transport.calls))
+
+	def test_iter_max_items(self):
+		transport = FakeTransport(250)
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		ids = [question.question_id for question in client.questions().iter(pagesize=20, max_items=30)]
+
+		self.assertEqual(list(range(30)), ids)
+		self.assertEqual(2, len(transport.calls))
+
+	def test_iter_uses_query_pagesize(self):
+		transport = FakeTransport(15)
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		questions = list(client.questions().pagesize(5).iter())
+
+		self.assertEqual(15, len(questions))
+		self.assertEqual(3, len(transport.calls))
+
+	def test_async_iter(self):
+		transport = FakeAsyncTransport(150)
+		client = AsyncExchangeClient(access_token='token', key='key', transport=transport)
+
+		async def run():
+			return [question.question_id async for question in client.questions().iter()]
+
+		self.assertEqual(list(range(150)), asyncio.run(run()))
+
+	def test_parallel_pages_in_order(self):
+		transport = FakeTotalTransport(950)
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		ids = [question.question_id for question in client.questions().parallel(in_flight=3)]
+
+		self.assertEqual(list(range(950)), ids)
+		self.assertEqual('total', transport.calls[0]['filter'])
+		self.assertEqual(list(range(1, 11)), sorted(params['page'] for params in transport.calls[1:]))
+
+	def test_parallel_max_items(self):
+		transport = FakeTotalTransport(950)
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		ids = [question.question_id for question in client.questions().parallel(pagesize=50, max_items=120)]
+
+		self.assertEqual(list(range(120)), ids)
+		self.assertEqual(4, len(transport.calls))
+
+	def test_async_parallel(self):
+		transport = FakeAsyncTotalTransport(250)
+		client = AsyncExchangeClient(access_token='token', key='key', transport=transport)
+
+		async def run():
+			return [question.question_id async for question in client.questions().parallel(in_flight=2)]
+
+		self.assertEqual(list(range(250)), asyncio.run(run()))
@@ -0,0 +1,99 @@
+import unittest
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.query import Query, Result
+from stackexchangepy.transport import Response
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.calls = []
+		self.lock = threading.Lock()
+
+	def request(self, method, url, params):
+		with self.lock:
+			self.calls.append((url, params))
+			quota = 10000 - len(self.calls)
+
+		if 'fail' in params:
+			payload = { 'error_id': 400, 'error_name': 'bad_parameter', 'error_message': 'fail' }
+			return Response(400, json.dumps(payload).encode('utf-8'))
+
+		_id = int(url.rsplit("/", 1)[1]) if url.rsplit("/", 1)[1].isdigit() else 0
+		payload = { 'items': [{ 'question_id': _id }], 'has_more': _id % 2 == 0, 'quota_remaining': quota, 'quota_max': 10000 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class TestQuery(unittest.TestCase):
+
+	def setUp(self):
+		self.transport = FakeTransport()
+		self.client = ExchangeClient(access_token='token', key='key', transport=self.transport)
+
+	def test_every_step_returns_new_query(self):
+		questions = self.client.questions()
+		python = questions.tagged('python')
+		rust = questions.tagged('rust')
+
+		self.assertIsInstance(questions, Query)
+		self.assertNotIn('tagged', questions.describe()[1])
+		self.assertEqual('python', python.describe()[1]['tagged'])
+		self.assertEqual('rust', rust.describe()[1]['tagged'])
+
+	def test_builder_steps_with_names_of_attributes(self):
+		query = self.client.questions(1).url('http://x')
+
+		self.assertIsInstance(query, Query)
+		self.assertEqual(('https://api.stackexchange.com/2.2/questions/1', { 'url': 'http://x' }), query.describe())
+
+	def test_query_is_immutable(self):
+		query = self.client.questions()
+
+		with self.assertRaises(AttributeError):
+			query._url = 'https://example.com'
+
+	def test_query_can_be_executed_many_times(self):
+		query = self.client.questions(2)
+
+		self.assertEqual(2, query.get()[0].question_id)
+		self.assertEqual(2, query.get()[0].question_id)
+
+	def test_failed_query_does_not_change_the_next_one(self):
+		with self.assertRaises(ExchangeException):
+			self.client.questions(1).answers(fail=True).get()
+
+		self.client.questions(3).get()
+		self.assertTrue(self.transport.calls[-1][0].endswith('/questions/3'))
+
+	def test_metadata_is_returned_with_the_result(self):
+		result = self.client.questions(2).get()
+
+		self.assertIsInstance(result, Result)
+		self.assertTrue(result.has_more)
+		self.assertEqual(9999, result.quota_remaining)
+		self.assertEqual(10000, result.metadata.quota_max)
+
+	def test_one_client_from_many_threads(self):
+		def get(_id):
+			result = self.client.questions(_id).get()
+			return _id, result[0].question_id, result.has_more
+
+		with ThreadPoolExecutor(max_workers=8) as executor:
+			results = list(executor.map(get, range(1, 65)))
+
+		for _id, question_id, has_more in results:
+			self.assertEqual(_id, question_id)
+			self.assertEqual(_id % 2 == 0, has_more)
+
+	def test_cursor_metadata(self):
+		cursor = self.client.questions(3).iter()
+		self.assertIsNone(cursor.quota_max)
+
+		self.assertEqual([3], [question.question_id for question in cursor])
+		self.assertFalse(cursor.has_more)
+		self.assertEqual(10000, cursor.quota_max)
@@ -0,0 +1,65 @@
+import unittest
+import threading
+
+from stackexchangepy.ratelimit import TokenBucket, default_limiter
+from stackexchangepy.transport import Transport
+
+
+class FakeClock(object):
+
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self):
+		return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+
+	def setUp(self):
+		self.clock = FakeClock()
+		self.bucket = TokenBucket(rate=10, burst=5, clock=self.clock)
+
+	def test_burst(self):
+		delays = [self.bucket.reserve() for _ in range(5)]
+		self.assertEqual([0] * 5, delays)
+
+	def test_reservations_are_in_order(self):
+		for _ in range(5):
+			self.bucket.reserve()
+
+		delays = [self.bucket.reserve() for _ in range(3)]
+		self.assertEqual([0.1, 0.2, 0.3], [round(delay, 6) for delay in delays])
+
+	def test_refill(self):
+		for _ in range(5):
+			self.bucket.reserve()
+
+		self.clock.now += 0.3
+		delays = [self.bucket.reserve() for _ in range(4)]
+		self.assertEqual([0, 0, 0, 0.1], [round(delay, 6) for delay in delays])
+
+	def test_metrics(self):
+		for _ in range(7):
+			self.bucket.reserve()
+
+		metrics = self.bucket.metrics()
+		self.assertEqual(7, metrics['requests'])
+		self.assertEqual(2, metrics['delayed'])
+		self.assertAlmostEqual(0.3, metrics['total_wait'])
+		self.assertAlmostEqual(0.2, metrics['max_wait'])
+
+	def test_reserve_from_threads(self):
+		bucket = TokenBucket(rate=1, burst=100, clock=self.clock)
+		threads = [threading.Thread(target=bucket.reserve) for _ in range(50)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		self.assertEqual(50, bucket.metrics()['requests'])
+		self.assertEqual(0, bucket.metrics()['delayed'])
+
+	def test_transports_share_default_limiter(self):
+		self.assertIs(default_limiter, Transport().limiter)
+		self.assertIs(Transport().limiter, Transport().limiter)
@@ -0,0 +1,88 @@
+import unittest
+import json
+import os
+import tempfile
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.registry import SiteRegistry
+from stackexchangepy.transport import Response
+
+
+SITES = [{ 'api_site_parameter': 'site{}'.format(index), 'name': 'Site {}'.format(index),
+			'site_url': 'https://site{}.stackexchange.com'.format(index) } for index in range(250)]
+SITES[1] = { 'api_site_parameter': 'superuser', 'name': 'Super User', 'site_url': 'https://superuser.com',
+			'aliases': ['https://www.superuser.com'] }
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.requests = []
+
+	def request(self, method, url, params):
+		self.requests.append((url, params))
+		pagesize, page = int(params['pagesize']), int(params['page'])
+		payload = { 'items': SITES[(page - 1) * pagesize:page * pagesize], 'has_more': page * pagesize < len(SITES) }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class TestSiteRegistry(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		self.path = os.path.join(self.directory.name, 'cache', 'sites.json')
+		self.transport = FakeTransport()
+		self.now = 1000
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def registry(self, path=None):
+		client = ExchangeClient(access_token='token', key='key', transport=self.transport)
+		return SiteRegistry(client, path=path or self.path, ttl=60, clock=lambda: self.now)
+
+	def test_sites_are_loaded_on_first_use_with_all_pages(self):
+		sites = self.registry()
+		self.assertEqual([], self.transport.requests)
+
+		self.assertEqual(250, len(sites))
+		self.assertEqual(3, len(self.transport.requests))
+		self.assertEqual('https://api.stackexchange.com/2.2/sites', self.transport.requests[0][0])
+		self.assertNotIn('site', self.transport.requests[0][1])
+
+	def test_lookup_by_parameter_domain_alias_and_name(self):
+		sites = self.registry()
+
+		for key in ['superuser', 'superuser.com', 'www.superuser.com', 'Super User', 'SUPER USER']:
+			self.assertEqual('https://superuser.com', sites[key].site_url)
+		self.assertEqual('site7', sites.resolve('site7.stackexchange.com'))
+		self.assertIn('Site 249', sites)
+
+		self.assertIsNone(sites.get('unknown'))
+		with self.assertRaises(ExchangeException):
+			sites['unknown']
+
+	def test_sites_are_kept_in_a_file_until_they_expire(self):
+		self.registry().get('superuser')
+		self.assertEqual(3, len(self.transport.requests))
+
+		self.now += 30
+		self.assertEqual('superuser', self.registry().resolve('Super User'))
+		self.assertEqual(3, len(self.transport.requests))
+
+		self.now += 30
+		sites = self.registry()
+		sites.get('superuser')
+		self.assertEqual(6, len(self.transport.requests))
+		self.assertEqual(1060, json.load(open(self.path))['updated'])
+
+	def test_expired_sites_in_memory_are_requested_again(self):
+		sites = self.registry()
+		len(sites)
+		self.now += 60
+		len(sites)
+		self.assertEqual(6, len(self.transport.requests))
+
+		sites.refresh()
+		self.assertEqual(9, len(self.transport.requests))
@@ -0,0 +1,55 @@
+import unittest
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.routes import RouteTable
+
+
+class TestRouteTable(unittest.TestCase):
+
+	def setUp(self):
+		self.table = RouteTable(['/sites', '/inbox', '/users/{ids}/associated', '/me/associated'])
+
+	def test_prefix_of_the_route(self):
+		self.assertIn('/sites', self.table)
+		self.assertIn('/inbox/unread', self.table)
+		self.assertIn('/users/{ids}/associated', self.table)
+		self.assertIn('/me/associated', self.table)
+
+	def test_other_routes(self):
+		self.assertNotIn('/users/{ids}', self.table)
+		self.assertNotIn('/users/{ids}/inbox', self.table)
+		self.assertNotIn('/me', self.table)
+		self.assertNotIn('/tags/{ids}/info', self.table)
+
+
+class TestRoutes(unittest.TestCase):
+
+	def setUp(self):
+		self.client = ExchangeClient(access_token='token', key='key')
+
+	def params(self, query, name='get'):
+		return self.client._prepare(query, name).params
+
+	def test_site_is_excluded_for_network_methods(self):
+		self.assertNotIn('site', self.params(self.client.sites()))
+		self.assertNotIn('site', self.params(self.client.users(1, 2).associated()))
+		self.assertNotIn('site', self.params(self.client.me().merges()))
+		self.assertNotIn('site', self.params(self.client.inbox().unread()))
+		self.assertNotIn('site', self.params(self.client.filters(include=['page']), 'create'))
+		self.assertNotIn('site', self.params(self.client.access_tokens('abc'), 'invalidate'))
+		self.assertNotIn('site', self.params(self.client.apps('abc'), 'de_authenticate'))
+
+	def test_site_is_kept_for_site_methods(self):
+		self.assertIn('site', self.params(self.client.questions()))
+		self.assertIn('site', self.params(self.client.users(1).inbox()))
+		# ids are not part of the route
+		self.assertIn('site', self.params(self.client.tags('sites').info()))
+
+	def test_query_params_depend_on_the_route(self):
+		search = self.client._prepare(self.client.search().advanced().answers(1), 'get')
+		self.assertEqual('1', search.params['answers'])
+		self.assertEqual('/search/advanced', search.route)
+
+		answers = self.client._prepare(self.client.users(1).answers(), 'get')
+		self.assertEqual('/users/{ids}/answers', answers.route)
+		self.assertNotIn('answers', answers.params)
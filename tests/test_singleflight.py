@@ -0,0 +1,88 @@
+import unittest
+import asyncio
+import json
+import threading
+import time
+
+from stackexchangepy.client import ExchangeClient, AsyncExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.singleflight import SingleFlight
+from stackexchangepy.transport import Response
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.calls = []
+
+	def request(self, method, url, params):
+		self.calls.append(url)
+		time.sleep(0.05)
+		payload = { 'items': [{ 'question_id': 1 }], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class FakeAsyncTransport(object):
+
+	def __init__(self):
+		self.calls = []
+
+	async def request(self, method, url, params):
+		self.calls.append(url)
+		await asyncio.sleep(0.01)
+		payload = { 'items': [{ 'question_id': 1 }], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class TestSingleFlight(unittest.TestCase):
+
+	def test_error_is_shared(self):
+		group = SingleFlight()
+
+		def fail():
+			raise ExchangeException('bad', 'bad_parameter', 400)
+
+		with self.assertRaises(ExchangeException):
+			group.do('key', fail)
+
+		self.assertEqual(1, group.do('key', lambda: 1))
+
+	def test_identical_requests_from_threads(self):
+		transport = FakeTransport()
+		group = SingleFlight()
+		results = []
+
+		def get():
+			client = ExchangeClient(access_token='token', key='key', transport=transport, singleflight=group)
+			results.append(client.questions(1).get())
+
+		threads = [threading.Thread(target=get) for _ in range(5)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		self.assertEqual(1, len(transport.calls))
+		self.assertEqual([1] * 5, [questions[0].question_id for questions in results])
+
+	def test_different_requests_are_not_coalesced(self):
+		transport = FakeTransport()
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		client.questions(1).get()
+		client.questions(1).get()
+		client.questions(2).get()
+
+		self.assertEqual(3, len(transport.calls))
+
+	def test_identical_async_requests(self):
+		transport = FakeAsyncTransport()
+		client = AsyncExchangeClient(access_token='token', key='key', transport=transport)
+
+		async def run():
+			return await asyncio.gather(*[client.questions(1).tagged('python').get() for _ in range(5)])
+
+		results = asyncio.run(run())
+
+		self.assertEqual(1, len(transport.calls))
+		self.assertEqual(5, len(results))
@@ -0,0 +1,131 @@
+import unittest
+import json
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from stackexchangepy.cache import SQLiteCache, cache_key
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.transport import Response
+
+
+class FakeClock(object):
+
+	def __init__(self):
+		self.now = 1000.0
+
+	def __call__(self):
+		return self.now
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.calls = []
+
+	def request(self, method, url, params):
+		self.calls.append(url)
+		payload = { 'items': [{ 'total_questions': len(self.calls) }], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+def store(path):
+	SQLiteCache(path).set('key', b'from another process', '/info')
+
+
+class TestSQLiteCache(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.path = os.path.join(self.directory, 'cache', 'responses.db')
+		self.clock = FakeClock()
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def test_fresh_and_stale(self):
+		cache = SQLiteCache(self.path, ttl=10, stale_ttl=20, clock=self.clock)
+		cache.set('key', b'content', '/questions')
+
+		self.assertEqual((b'content', True), cache.lookup('key'))
+		self.clock.now += 15
+		self.assertEqual((b'content', False), cache.lookup('key'))
+		self.assertIsNone(cache.get('key'))
+		self.clock.now += 20
+		self.assertIsNone(cache.lookup('key'))
+		self.assertEqual(0, cache.stats()['entries'])
+
+	def test_shared_between_instances_and_processes(self):
+		cache = SQLiteCache(self.path)
+
+		process = multiprocessing.get_context('spawn').Process(target=store, args=(self.path,))
+		process.start()
+		process.join()
+
+		self.assertEqual(b'from another process', cache.get('key'))
+
+	def test_eviction_by_size(self):
+		cache = SQLiteCache(self.path, max_bytes=10, compress=False, clock=self.clock)
+		cache.set('a', b'aaaa', '/questions')
+		self.clock.now += 1
+		cache.set('b', b'bbbb', '/questions')
+		self.clock.now += 1
+		cache.get('a')
+		self.clock.now += 1
+		cache.set('c', b'cccc', '/questions')
+
+		self.assertIsNone(cache.get('b'))
+		self.assertEqual(b'aaaa', cache.get('a'))
+		self.assertEqual(1, cache.stats()['evictions'])
+
+	def test_stale_response_is_revalidated(self):
+		transport = FakeTransport()
+		cache = SQLiteCache(self.path, ttl=10, stale_ttl=60, clock=self.clock)
+		client = ExchangeClient(access_token='token', key='key', transport=transport, cache=cache)
+
+		client.info().get()
+		self.clock.now += 30
+		stale = client.info().get()
+
+		key = cache_key('https://api.stackexchange.com/2.2/info', { 'site': 'stackoverflow.com' }, '/info')
+		for _ in range(100):
+			if cache.get(key) is not None:
+				break
+			time.sleep(0.01)
+
+		self.assertEqual(1, stale[0].total_questions)
+		self.assertEqual(2, len(transport.calls))
+		self.assertEqual(2, client.info().get()[0].total_questions)
+
+	def test_file_shrinks_after_clear(self):
+		cache = SQLiteCache(self.path, max_bytes=64 * 1024 * 1024, compress=False, clock=self.clock)
+		for index in range(200):
+			cache.set(str(index), os.urandom(16 * 1024), '/questions')
+		full = os.path.getsize(self.path)
+
+		cache.clear()
+		self.assertLess(os.path.getsize(self.path), full / 10)
+
+	def test_database_without_auto_vacuum_is_converted(self):
+		os.makedirs(os.path.dirname(self.path))
+		connection = sqlite3.connect(self.path)
+		connection.execute("CREATE TABLE other (value INTEGER)")
+		connection.close()
+
+		cache = SQLiteCache(self.path)
+		self.assertEqual(2, cache._connection().execute("PRAGMA auto_vacuum").fetchone()[0])
+
+	def test_hit_does_not_wait_for_writers(self):
+		cache = SQLiteCache(self.path, clock=self.clock)
+		cache.set('key', b'content', '/questions')
+
+		writer = sqlite3.connect(self.path, isolation_level=None)
+		writer.execute("BEGIN IMMEDIATE")
+		started = time.time()
+		self.assertEqual(b'content', cache.get('key'))
+		self.assertLess(time.time() - started, 1)
+		writer.execute("ROLLBACK")
+		writer.close()
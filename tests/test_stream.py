@@ -0,0 +1,103 @@
+import gzip
+import io
+import json
+import unittest
+
+import requests
+from urllib3.response import HTTPResponse
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.stream import ItemStream
+
+
+PAGE = {
+	'items': [{ 'question_id': i, 'title': 'Grüße №{}'.format(i), 'score': -1.5e3, 'is_answered': i % 2 == 0 } for i in range(5)],
+	'has_more': True,
+	'quota_max': 10000,
+	'quota_remaining': 9876,
+	'backoff': 10
+}
+
+
+def chunks(content, size):
+	return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+def gzip_response(payload, status_code=200):
+	body = io.BytesIO(gzip.compress(json.dumps(payload).encode('utf-8')))
+
+	response = requests.Response()
+	response.status_code = status_code
+	response.raw = HTTPResponse(body=body, headers={ 'content-encoding': 'gzip' }, preload_content=False)
+	return response
+
+
+class FakeTransport(object):
+
+	def __init__(self, response):
+		self.response = response
+		self.calls = []
+
+	def request(self, method, url, params, stream=False):
+		self.calls.append((url, stream))
+		return self.response
+
+
+class TestItemStream(unittest.TestCase):
+
+	def test_every_split_of_the_body(self):
+		content = json.dumps(PAGE, ensure_ascii=False).encode('utf-8')
+
+		for size in range(1, 40):
+			stream = ItemStream(chunks(content, size))
+			self.assertEqual(PAGE['items'], list(stream))
+			self.assertEqual(9876, stream.envelope['quota_remaining'])
+			self.assertEqual(10, stream.envelope['backoff'])
+
+	def test_envelope_before_items(self):
+		content = '{"has_more": false, "items": [], "quota_remaining": 5}'
+		stream = ItemStream(chunks(content, 3))
+
+		self.assertEqual([], list(stream))
+		self.assertEqual({ 'has_more': False, 'quota_remaining': 5 }, stream.envelope)
+
+	def test_items_are_yielded_before_the_body_is_read(self):
+		read = []
+
+		def body():
+			for chunk in ['{"items": [{"a": 1}', ', {"a": 2}', '], "has_more": true}']:
+				read.append(chunk)
+				yield chunk
+
+		items = iter(ItemStream(body()))
+		self.assertEqual({ 'a': 1 }, next(items))
+		self.assertEqual(1, len(read))
+
+	def test_truncated_body(self):
+		with self.assertRaises(ExchangeException):
+			list(ItemStream(['{"items": [{"a": 1}, {"a"']))
+
+
+class TestStream(unittest.TestCase):
+
+	def test_stream_decodes_gzip_body(self):
+		transport = FakeTransport(gzip_response(PAGE))
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		questions = list(client.questions().stream(chunk_size=16))
+
+		self.assertEqual([0, 1, 2, 3, 4], [question.question_id for question in questions])
+		self.assertEqual('Grüße №3', questions[3].title)
+		self.assertTrue(transport.calls[0][1])
+		self.assertTrue(client.has_more)
+		self.assertEqual(9876, client.quota_remaining)
+		self.assertEqual(10, client.backoff)
+		self.assertGreater(client._scheduler.delay('/questions'), 0)
+
+	def test_stream_error(self):
+		error = { 'error_id': 400, 'error_name': 'bad_parameter', 'error_message': 'sort' }
+		client = ExchangeClient(access_token='token', key='key', transport=FakeTransport(gzip_response(error, 400)))
+
+		with self.assertRaises(ExchangeException):
+			list(client.questions().stream())
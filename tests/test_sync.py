@@ -0,0 +1,124 @@
+import unittest
+import json
+import os
+import tempfile
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.exception import ExchangeException
+from stackexchangepy.sync import Checkpoint, DeltaSync
+from stackexchangepy.transport import Response
+
+
+class FakeSite(object):
+	"""
+	Questions sorted by activity, which are filtered with min and max, as the API does.
+	"""
+
+	def __init__(self, dates):
+		self.questions = { _id: date for _id, date in enumerate(dates, 1) }
+		self.requests = 0
+		self.on_request = None
+
+	def request(self, method, url, params):
+		self.requests += 1
+		if self.on_request is not None:
+			self.on_request(self.requests)
+
+		_min, _max = int(params['min']), int(params['max'])
+		pagesize, page = int(params['pagesize']), int(params['page'])
+
+		items = sorted((date, _id) for _id, date in self.questions.items() if _min <= date <= _max)
+		chunk = items[(page - 1) * pagesize:page * pagesize]
+		payload = { 'items': [{ 'question_id': _id, 'last_activity_date': date } for date, _id in chunk],
+					'has_more': page * pagesize < len(items), 'quota_remaining': 9, 'quota_max': 10 }
+		return Response(200, json.dumps(payload).encode('utf-8'))
+
+
+class Collector(object):
+
+	def __init__(self, fail_on=None):
+		self.ids = []
+		self.pages = 0
+		self.fail_on = fail_on
+
+	def __call__(self, method, items):
+		self.pages += 1
+		if self.pages == self.fail_on:
+			raise ExchangeException('Database is not available.', 'handler', 500)
+		self.ids.extend(item.question_id for item in items)
+
+
+class TestDeltaSync(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		self.path = os.path.join(self.directory.name, 'checkpoint.json')
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def sync(self, site, now=1000):
+		client = ExchangeClient(access_token='token', key='key', transport=site)
+		return DeltaSync(client, self.path, methods=['questions'], pagesize=3, clock=lambda: now)
+
+	def test_first_run_and_run_without_changes(self):
+		site = FakeSite([10, 20, 30, 40, 50, 60, 70])
+		collector = Collector()
+
+		self.assertEqual(7, self.sync(site).run(collector))
+		self.assertEqual([1, 2, 3, 4, 5, 6, 7], collector.ids)
+		self.assertEqual(70, Checkpoint(self.path).get('stackoverflow.com', 'questions')['since'])
+
+		self.assertEqual(0, self.sync(site).run(Collector()))
+
+	def test_only_changed_items_are_fetched(self):
+		site = FakeSite([10, 20, 30, 40])
+		self.sync(site).run(Collector())
+
+		site.questions[2] = 80
+		site.questions[8] = 90
+		collector = Collector()
+		self.sync(site).run(collector)
+
+		self.assertEqual([2, 8], collector.ids)
+
+	def test_resume_after_failure(self):
+		site = FakeSite([10, 20, 30, 40, 50, 60, 70])
+		collector = Collector(fail_on=2)
+
+		with self.assertRaises(ExchangeException):
+			self.sync(site).run(collector)
+		self.assertEqual([1, 2, 3], collector.ids)
+
+		collector = Collector()
+		self.sync(site).run(collector)
+		self.assertEqual([4, 5, 6, 7], collector.ids)
+
+	def test_more_items_with_the_same_date_than_a_page(self):
+		site = FakeSite([10, 20, 20, 20, 20, 20, 20, 20, 30])
+		collector = Collector()
+		self.sync(site).run(collector)
+
+		self.assertEqual(list(range(1, 10)), sorted(collector.ids))
+		self.assertEqual(len(collector.ids), len(set(collector.ids)))
+
+	def test_items_which_change_during_the_crawl(self):
+		site = FakeSite([10, 20, 30, 40, 50, 60, 70])
+
+		def change(request):
+			# after the first page, an item which was not received yet moves to the end
+			if request == 2:
+				site.questions[5] = 75
+
+		site.on_request = change
+		collector = Collector()
+		self.sync(site).run(collector)
+
+		self.assertEqual([1, 2, 3, 4, 6, 7, 5], collector.ids)
+
+	def test_checkpoint_file_is_replaced(self):
+		checkpoint = Checkpoint(self.path)
+		checkpoint.set('stackoverflow.com', 'answers', { 'since': 5, 'seen': [1], 'page': 1 })
+
+		self.assertEqual(5, Checkpoint(self.path).get('stackoverflow.com', 'answers')['since'])
+		self.assertEqual(['checkpoint.json'], os.listdir(self.directory.name))
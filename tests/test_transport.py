@@ -0,0 +1,70 @@
+import unittest
+import json
+import threading
+
+from stackexchangepy.client import ExchangeClient
+from stackexchangepy.transport import Transport
+
+
+class FakeResponse(object):
+
+	def __init__(self, payload, status_code=200):
+		self.payload = payload
+		self.status_code = status_code
+		self.content = json.dumps(payload).encode('utf-8')
+
+	def json(self):
+		return self.payload
+
+
+class FakeTransport(object):
+
+	def __init__(self):
+		self.calls = []
+
+	def request(self, method, url, params):
+		self.calls.append((method, url, params))
+		return FakeResponse({ 'items': [{ 'question_id': 1 }], 'has_more': False, 'quota_remaining': 9, 'quota_max': 10 })
+
+
+class TestTransport(unittest.TestCase):
+
+	def test_session_is_shared_between_threads(self):
+		transport = Transport()
+		sessions = []
+
+		threads = [threading.Thread(target=lambda: sessions.append(transport.session)) for _ in range(8)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		self.assertEqual(1, len(set(map(id, sessions))))
+
+	def test_pool_configuration(self):
+		transport = Transport(pool_maxsize=32, pool_block=True)
+		adapter = transport.session.get_adapter('https://api.stackexchange.com')
+
+		self.assertEqual(32, adapter._pool_maxsize)
+		self.assertTrue(adapter._pool_block)
+
+	def test_keep_alive_disabled(self):
+		transport = Transport(keep_alive=False)
+		self.assertEqual('close', transport.session.headers['Connection'])
+
+	def test_close_creates_new_session(self):
+		transport = Transport()
+		session = transport.session
+		transport.close()
+
+		self.assertIsNot(session, transport.session)
+
+	def test_client_uses_given_transport(self):
+		transport = FakeTransport()
+		client = ExchangeClient(access_token='token', key='key', transport=transport)
+
+		questions = client.questions(1).get()
+
+		self.assertEqual(1, questions[0].question_id)
+		self.assertEqual([('get', 'https://api.stackexchange.com/2.2/questions/1',
+			{ 'access_token': 'token', 'key': 'key', 'site': 'stackoverflow.com' })], transport.calls)